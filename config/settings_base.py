@@ -273,7 +273,9 @@ AUTH_USER_MODEL = "freedom_ls_accounts.User"
 AUTHENTICATION_BACKENDS = (
     "axes.backends.AxesStandaloneBackend",
     "django.contrib.auth.backends.ModelBackend",
-    "guardian.backends.ObjectPermissionBackend",
+    # guardian's ObjectPermissionBackend, reusing permissions prefetched by the
+    # panel framework.
+    "freedom_ls.panel_framework.permissions.PrefetchedObjectPermissionBackend",
     "allauth.account.auth_backends.AuthenticationBackend",
 )
 
@@ -81,6 +81,11 @@ DATABASES["default"]["CONN_HEALTH_CHECKS"] = fls_defaults.CONN_HEALTH_CHECKS
 # `python manage.py db_worker` process; see settings_defaults.py for details.
 TASKS = fls_defaults.DATABASE_TASKS
 
+# Shared by all workers, as fragment and permission caches require; needs
+# `python manage.py createcachetable`. See settings_defaults.py for details.
+CACHES = fls_defaults.DATABASE_CACHES
+FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT = 300
+
 
 # Static files
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")  # noqa: F405
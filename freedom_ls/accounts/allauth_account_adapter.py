@@ -22,7 +22,8 @@ from freedom_ls.site_aware_models.config import config as site_aware_config
 from freedom_ls.site_aware_models.models import get_cached_site
 
 from .config import config
-from .models import SiteSignupPolicy, User
+from .models import User
+from .utils import get_signup_policy
 
 
 def _set_8bit_encoding(msg: EmailMessage) -> None:
@@ -181,8 +182,7 @@ class AccountAdapter(DefaultAccountAdapter):
         if not isinstance(current_site, Site):
             return default_allow
 
-        try:
-            policy = SiteSignupPolicy.objects.get(site=current_site)
-            return policy.allow_signups
-        except SiteSignupPolicy.DoesNotExist:
+        policy = get_signup_policy(current_site)
+        if policy is None:
             return default_allow
+        return policy.allow_signups
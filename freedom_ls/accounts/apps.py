@@ -8,4 +8,8 @@ class AccountsConfig(AppConfig):
 
     def ready(self) -> None:
         # Register system checks on app load.
-        from . import checks  # noqa: F401
+        # Register the signup policy cache invalidation receivers.
+        from . import (
+            checks,  # noqa: F401
+            signals,  # noqa: F401
+        )
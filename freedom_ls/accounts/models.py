@@ -9,14 +9,13 @@ from django.contrib.auth.models import (
     BaseUserManager,
     PermissionsMixin,
 )
-from django.contrib.sites.models import Site
 from django.db import models
 
+from freedom_ls.base.indexes import trigram_index
 from freedom_ls.site_aware_models.models import (
     SiteAwareModel,
     SiteAwareModelBase,
-    _thread_locals,
-    get_cached_site,
+    get_context_site,
 )
 
 
@@ -52,11 +51,9 @@ def _two_or_one(first: str, second: str) -> str:
 class UserManager(BaseUserManager["User"]):
     def get_queryset(self):
         queryset = super().get_queryset()
-        request = getattr(_thread_locals, "request", None)
-        if request:
-            site = get_cached_site(request)
-            if isinstance(site, Site):
-                return queryset.filter(site=site)
+        site = get_context_site()
+        if site is not None:
+            return queryset.filter(site=site)
         return queryset
 
     def create_user(
@@ -109,6 +106,13 @@ class User(SiteAwareModelBase, AbstractBaseUser, PermissionsMixin):
 
     objects: models.Manager = UserManager()
 
+    class Meta:
+        indexes = [
+            trigram_index("first_name", name="user_first_name_trgm_idx"),
+            trigram_index("last_name", name="user_last_name_trgm_idx"),
+            trigram_index("email", name="user_email_trgm_idx"),
+        ]
+
     @property
     def username(self) -> str:
         """Return email as username for template compatibility."""
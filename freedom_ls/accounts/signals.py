@@ -0,0 +1,17 @@
+"""Keep the process-wide signup policy cache in step with policy writes."""
+
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import SiteSignupPolicy
+from .utils import clear_signup_policy_cache
+
+
+@receiver(post_save, sender=SiteSignupPolicy)
+@receiver(post_delete, sender=SiteSignupPolicy)
+def signup_policy_changed(sender: type[SiteSignupPolicy], **kwargs) -> None:
+    # Dropped on commit: a reload before then would cache the old row again.
+    transaction.on_commit(clear_signup_policy_cache)
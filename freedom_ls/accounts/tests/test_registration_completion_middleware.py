@@ -227,7 +227,9 @@ def test_cache_short_circuits_second_request(mock_site_context, site):
 
 
 @pytest.mark.django_db
-def test_changing_dotted_paths_invalidates_cache(mock_site_context, site):
+def test_changing_dotted_paths_invalidates_cache(
+    mock_site_context, site, django_capture_on_commit_callbacks
+):
     """Switching the policy's `additional_registration_forms` re-evaluates."""
     fixtures.STORED_PHONE_NUMBERS.clear()
     fixtures.IS_COMPLETE_CALL_COUNT.clear()
@@ -240,9 +242,10 @@ def test_changing_dotted_paths_invalidates_cache(mock_site_context, site):
     # First, no forms → marked complete.
     client.get(reverse("accounts:account_profile"))
 
-    # Now switch the policy.
-    policy.additional_registration_forms = [ALWAYS_INCOMPLETE_PATH]
-    policy.save()
+    # Now switch the policy; the cached policy is dropped once it commits.
+    with django_capture_on_commit_callbacks(execute=True):
+        policy.additional_registration_forms = [ALWAYS_INCOMPLETE_PATH]
+        policy.save()
 
     profile_url = reverse("accounts:account_profile")
     response = client.get(profile_url)
@@ -6,7 +6,7 @@ from django.contrib.auth import get_user_model
 from django.test import RequestFactory, override_settings
 
 from freedom_ls.accounts.factories import SiteFactory
-from freedom_ls.site_aware_models.models import _CACHED_SITE_ATTR, _thread_locals
+from freedom_ls.site_aware_models.models import _CACHED_SITE_ATTR, request_context
 
 User = get_user_model()
 
@@ -27,18 +27,13 @@ def test_user_manager_respects_force_site_name() -> None:
     domain_user.save()
 
     request = RequestFactory().get("/")  # domain = testserver
-    _thread_locals.request = request
-
-    try:
-        with override_settings(FORCE_SITE_NAME="ForcedSite"):
-            # Clear any cached site on the request
-            if hasattr(request, _CACHED_SITE_ATTR):
-                delattr(request, _CACHED_SITE_ATTR)
-            users = list(User.objects.all())
-
-        assert len(users) == 1
-        assert users[0].site == forced_site
-        assert users[0].email == "forced@example.com"
-    finally:
-        if hasattr(_thread_locals, "request"):
-            delattr(_thread_locals, "request")
+
+    with request_context(request), override_settings(FORCE_SITE_NAME="ForcedSite"):
+        # Clear any cached site on the request
+        if hasattr(request, _CACHED_SITE_ATTR):
+            delattr(request, _CACHED_SITE_ATTR)
+        users = list(User.objects.all())
+
+    assert len(users) == 1
+    assert users[0].site == forced_site
+    assert users[0].email == "forced@example.com"
@@ -9,6 +9,7 @@ from django.test import RequestFactory
 from freedom_ls.accounts.models import SiteSignupPolicy
 from freedom_ls.accounts.utils import (
     get_client_ip,
+    get_signup_policy,
     get_signup_policy_for_request,
 )
 
@@ -74,3 +75,56 @@ def test_get_signup_policy_for_request_returns_policy_when_one_exists(
 
 def test_get_signup_policy_for_request_handles_none_request():
     assert get_signup_policy_for_request(None) is None
+
+
+@pytest.mark.django_db
+def test_get_signup_policy_is_cached_across_requests(
+    mock_site_context, site, django_assert_num_queries
+):
+    policy = SiteSignupPolicy.objects.create(site=site, allow_signups=False)
+    get_signup_policy(site)
+
+    with django_assert_num_queries(0):
+        assert get_signup_policy(site) == policy
+
+
+@pytest.mark.django_db
+def test_get_signup_policy_sees_committed_policy_writes(
+    mock_site_context, site, django_capture_on_commit_callbacks
+):
+    assert get_signup_policy(site) is None
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        policy = SiteSignupPolicy.objects.create(site=site, allow_signups=False)
+    assert get_signup_policy(site) is None
+    for callback in callbacks:
+        callback()
+    assert get_signup_policy(site) == policy
+
+    with django_capture_on_commit_callbacks(execute=True):
+        policy.allow_signups = True
+        policy.save()
+    cached = get_signup_policy(site)
+    assert cached is not None
+    assert cached.allow_signups
+
+    with django_capture_on_commit_callbacks(execute=True):
+        policy.delete()
+    assert get_signup_policy(site) is None
+
+
+@pytest.mark.django_db
+def test_get_signup_policy_returns_a_copy(mock_site_context, site):
+    SiteSignupPolicy.objects.create(
+        site=site, allow_signups=False, additional_registration_forms=[]
+    )
+    policy = get_signup_policy(site)
+    assert policy is not None
+
+    policy.allow_signups = True
+    policy.additional_registration_forms.append("myapp.forms.Extra")
+
+    cached = get_signup_policy(site)
+    assert cached is not None
+    assert not cached.allow_signups
+    assert cached.additional_registration_forms == []
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import copy
+import time
+from dataclasses import dataclass
+
 from django.contrib.sites.models import Site
 from django.http import HttpRequest
 
+from freedom_ls.site_aware_models.config import config as site_aware_config
 from freedom_ls.site_aware_models.models import get_cached_site
 
 from .config import config
@@ -45,12 +50,49 @@ def get_signup_policy_for_request(
     site = get_cached_site(request)
     if not isinstance(site, Site):
         return None
+    return get_signup_policy(site)
 
-    try:
-        policy: SiteSignupPolicy = SiteSignupPolicy.objects.get(site=site)
-    except SiteSignupPolicy.DoesNotExist:
-        return None
-    return policy
+
+@dataclass(frozen=True)
+class _PolicySnapshot:
+    by_site_id: dict[int, SiteSignupPolicy]
+    loaded_at: float
+
+
+_policy_snapshot: _PolicySnapshot | None = None
+
+
+def get_signup_policy(site: Site) -> SiteSignupPolicy | None:
+    """Return the `SiteSignupPolicy` for `site`, or `None`.
+
+    Policies for all sites are loaded in one query and kept for the process,
+    like the site registry: dropped when a write to a policy commits here (see
+    `signals`) and reloaded after `SITE_REGISTRY_TIMEOUT` seconds. The cached
+    rows are shared by every thread, so each call returns its own copy.
+    """
+    global _policy_snapshot
+    snapshot = _policy_snapshot
+    now = time.monotonic()
+    if (
+        snapshot is None
+        or now - snapshot.loaded_at > site_aware_config.SITE_REGISTRY_TIMEOUT
+    ):
+        snapshot = _PolicySnapshot(
+            by_site_id={
+                policy.site_id: policy
+                for policy in SiteSignupPolicy._base_manager.all()
+            },
+            loaded_at=now,
+        )
+        _policy_snapshot = snapshot
+    policy = snapshot.by_site_id.get(site.pk)
+    return copy.deepcopy(policy)
+
+
+def clear_signup_policy_cache() -> None:
+    """Drop the cached signup policies; the next lookup reloads them."""
+    global _policy_snapshot
+    _policy_snapshot = None
 
 
 def get_effective_require_name(policy: SiteSignupPolicy | None) -> bool:
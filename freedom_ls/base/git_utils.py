@@ -1,4 +1,5 @@
 import re
+import subprocess
 from pathlib import Path
 
 _cached_branch: str | None = None
@@ -54,6 +55,61 @@ def get_head_commit(base_dir: Path | None = None) -> str | None:
     return head_content if _looks_like_sha(head_content) else None
 
 
+class GitError(Exception):
+    """Raised when a git command fails."""
+
+
+def find_repo_root(path: Path) -> Path | None:
+    """Return the nearest directory at or above `path` that has a `.git`."""
+    path = path.resolve()
+    for directory in (path, *path.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
+def get_changed_paths(
+    repo_root: Path, since: str, until: str = "HEAD"
+) -> tuple[list[Path], list[Path]]:
+    """Return the (changed, deleted) files between two commits.
+
+    Paths are absolute. Unlike the rest of this module this runs the `git`
+    binary, since diffing commits needs the object database. Renames are
+    reported as a deletion plus a change. Raises GitError if git fails.
+    """
+    cmd = [
+        "git",
+        "-C",
+        str(repo_root),
+        "diff",
+        "--name-status",
+        "--no-renames",
+        "-z",
+        "--end-of-options",
+        since,
+        until,
+        "--",
+    ]
+    try:
+        result = subprocess.run(  # noqa: S603
+            cmd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError as e:
+        raise GitError("git is not installed") from e
+    if result.returncode != 0:
+        raise GitError(result.stderr.strip() or f"git diff {since} {until} failed")
+
+    changed: list[Path] = []
+    deleted: list[Path] = []
+    fields = result.stdout.split("\0")
+    for status, file_path in zip(fields[0::2], fields[1::2], strict=False):
+        (deleted if status == "D" else changed).append(repo_root / file_path)
+    return changed, deleted
+
+
 def _resolve_git_dir(base_dir: Path) -> Path | None:
     """Return the absolute `.git` directory, following `gitdir:` worktree files."""
     git_path = base_dir / ".git"
@@ -0,0 +1,20 @@
+"""Index helpers shared by the domain models."""
+
+from __future__ import annotations
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models import TextField
+from django.db.models.functions import Cast, Upper
+
+
+def trigram_index(field: str, name: str) -> GinIndex:
+    """GIN ``gin_trgm_ops`` index matching Django's case-insensitive lookups.
+
+    Django compiles ``icontains``/``istartswith`` on PostgreSQL to
+    ``UPPER(col::text) LIKE ...``, so the index is built over that exact
+    expression rather than the bare column. Requires the ``pg_trgm`` extension.
+    """
+    return GinIndex(
+        OpClass(Upper(Cast(field, output_field=TextField())), name="gin_trgm_ops"),
+        name=name,
+    )
@@ -3,9 +3,13 @@ from pathlib import Path
 
 import pytest
 
+from freedom_ls.accounts.tests._git_helpers import commit_all, init_repo, run_git
 from freedom_ls.base.git_utils import (
+    GitError,
     _clear_branch_cache,
     branch_to_db_name,
+    find_repo_root,
+    get_changed_paths,
     get_current_branch,
     get_head_commit,
 )
@@ -203,6 +207,49 @@ class TestGetHeadCommit:
         assert get_head_commit(base_dir=tmp_path) is None
 
 
+class TestFindRepoRoot:
+    def test_returns_nearest_directory_with_git(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        nested = tmp_path / "content" / "course"
+        nested.mkdir(parents=True)
+
+        assert find_repo_root(nested) == tmp_path.resolve()
+
+    def test_outside_a_repo_returns_none(self, tmp_path: Path) -> None:
+        assert find_repo_root(tmp_path) is None
+
+
+class TestGetChangedPaths:
+    def test_reports_changed_and_deleted_files(self, tmp_path: Path) -> None:
+        init_repo(tmp_path)
+        (tmp_path / "kept.md").write_text("kept")
+        (tmp_path / "edited.md").write_text("before")
+        (tmp_path / "removed.md").write_text("removed")
+        commit_all(tmp_path)
+        first = run_git(tmp_path, "rev-parse", "HEAD")
+        (tmp_path / "edited.md").write_text("after")
+        (tmp_path / "removed.md").unlink()
+        (tmp_path / "dir with space").mkdir()
+        (tmp_path / "dir with space" / "added.md").write_text("added")
+        commit_all(tmp_path, "second")
+
+        changed, deleted = get_changed_paths(tmp_path, first)
+
+        assert sorted(changed) == [
+            tmp_path / "dir with space" / "added.md",
+            tmp_path / "edited.md",
+        ]
+        assert deleted == [tmp_path / "removed.md"]
+
+    def test_unknown_commit_raises(self, tmp_path: Path) -> None:
+        init_repo(tmp_path)
+        (tmp_path / "file.md").write_text("file")
+        commit_all(tmp_path)
+
+        with pytest.raises(GitError):
+            get_changed_paths(tmp_path, SHA)
+
+
 # --- branch_to_db_name ---
 
 
@@ -61,6 +61,27 @@ def _clear_course_access_backend_cache():
     get_course_access_backend.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def _clear_site_registries():
+    """Reset the process-wide site registry, signup policy cache and asset
+    manifests around each test.
+
+    Test transactions are rolled back without post_delete signals, so rows
+    cached by one test would otherwise leak into the next.
+    """
+    from freedom_ls.accounts.utils import clear_signup_policy_cache
+    from freedom_ls.content_engine.assets import clear_asset_manifest
+    from freedom_ls.site_aware_models.registry import clear_site_registry
+
+    clear_site_registry()
+    clear_signup_policy_cache()
+    clear_asset_manifest()
+    yield
+    clear_site_registry()
+    clear_signup_policy_cache()
+    clear_asset_manifest()
+
+
 def reverse_url(
     live_server, viewname, urlconf=None, args=None, kwargs=None, current_app=None
 ):
@@ -104,19 +125,14 @@ def make_temp_file():
 
 @pytest.fixture
 def mock_site_context(site, mocker):
-    """Mock the thread local request and get_current_site for SiteAwareModel and templates."""
+    """Mock the current request and get_current_site for SiteAwareModel and templates."""
     from django.contrib.sites.models import SITE_CACHE
 
-    from freedom_ls.site_aware_models.models import _thread_locals
-
-    # Check if request attribute already exists
-    had_request = hasattr(_thread_locals, "request")
-    old_request = getattr(_thread_locals, "request", None) if had_request else None
+    from freedom_ls.site_aware_models.models import request_context
 
     mock_request = mocker.Mock()
     # Set _cached_site to the actual site object to prevent Mock issues in ORM queries
     mock_request._cached_site = site
-    _thread_locals.request = mock_request
 
     mocker.patch(
         "freedom_ls.site_aware_models.models.get_current_site", return_value=site
@@ -128,14 +144,11 @@ def mock_site_context(site, mocker):
     SITE_CACHE.clear()
     SITE_CACHE["testserver"] = site
 
-    yield site
+    with request_context(mock_request):
+        yield site
 
-    # Cleanup: restore original state and clear cache
+    # Cleanup: clear cache
     SITE_CACHE.clear()
-    if had_request:
-        _thread_locals.request = old_request
-    elif hasattr(_thread_locals, "request"):
-        delattr(_thread_locals, "request")
 
 
 @pytest.fixture
@@ -0,0 +1,218 @@
+"""Per-site manifest of the files that content components link to.
+
+``<c-picture>`` and friends need a File's URL, mime type and, for images,
+its dimensions. ``content_save`` records the content hash and image
+dimensions of every file it imports (see ``file_metadata``). The manifest is
+every File of a site, loaded in one query into a compact in-process map of
+path to ``(storage name, mime type, width, height, hash)``, so rendering
+resolves assets without a query per file.
+
+URLs are generated from the storage name in batches, once per page for the
+assets it references, and reused while they have at least half of the
+storage's ``querystring_expire`` (``AWS_QUERYSTRING_EXPIRE``) left, so a served
+signed URL is always valid for a while. Storages that do not sign URLs produce URLs that never expire.
+
+The manifest of a site is dropped when a write to one of its Files commits in
+this process (see ``signals``) and reloaded after
+``ASSET_MANIFEST_TIMEOUT`` seconds, so imports run by other processes are
+picked up too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import config
+
+# (storage name, mime type, width, height, content hash)
+ManifestEntry = tuple[str, str, int | None, int | None, str]
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+# JPEG start-of-frame markers; 0xC4 (DHT), 0xC8 (JPG) and 0xCC (DAC) are not.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A file resolved from the manifest, usable in templates like a File."""
+
+    file_path: str
+    name: str
+    mime_type: str
+    width: int | None
+    height: int | None
+    content_hash: str
+    url: str
+
+
+@dataclass(frozen=True)
+class _Manifest:
+    entries: dict[str, ManifestEntry]
+    loaded_at: float
+
+
+_manifests: dict[int, _Manifest] = {}
+# Storage name -> (url, monotonic time it should be regenerated).
+_urls: dict[str, tuple[str, float]] = {}
+
+
+def image_dimensions(path: Path) -> tuple[int, int] | None:
+    """Read the width and height of a PNG, GIF, JPEG or WebP from its header.
+
+    Returns None for other formats and for files that cannot be parsed.
+    """
+    with open(path, "rb") as f:
+        head = f.read(30)
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            return struct.unpack(">II", head[16:24])
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", head[6:10])
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _webp_dimensions(head)
+        if head[:2] == b"\xff\xd8":
+            f.seek(2)
+            return _jpeg_dimensions(f)
+    return None
+
+
+def _webp_dimensions(head: bytes) -> tuple[int, int] | None:
+    chunk = head[12:16]
+    if chunk == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return width, height
+    if chunk == b"VP8L" and head[20] == 0x2F:
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    return None
+
+
+def _jpeg_dimensions(f) -> tuple[int, int] | None:
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        if marker[1] in (0x01, *range(0xD0, 0xD8)):
+            # Standalone markers carry no length.
+            continue
+        (length,) = struct.unpack(">H", f.read(2))
+        if marker[1] in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+        f.seek(length - 2, 1)
+
+
+def file_hash(path: Path) -> str:
+    """Return the sha256 of a local file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_metadata(path: Path) -> tuple[str, int | None, int | None]:
+    """Return the sha256 and, for images, the dimensions of a local file."""
+    try:
+        dimensions = image_dimensions(path)
+    except (OSError, struct.error):
+        dimensions = None
+    width, height = dimensions or (None, None)
+    return file_hash(path), width, height
+
+
+def _load_manifest(site_id: int) -> _Manifest:
+    from .models import File
+
+    entries: dict[str, ManifestEntry] = {}
+    # Ordered so the first row by pk wins for duplicated paths, as in
+    # get_file_by_path.
+    for file_path, *entry in (
+        File._base_manager.filter(site_id=site_id)
+        .exclude(file="")
+        .order_by("-pk")
+        .values_list(
+            "file_path", "file", "mime_type", "width", "height", "content_hash"
+        )
+    ):
+        entries[file_path] = tuple(entry)
+    return _Manifest(entries=entries, loaded_at=time.monotonic())
+
+
+def get_asset_manifest(site_id: int) -> dict[str, ManifestEntry]:
+    """Return path -> manifest entry for every File of the site."""
+    manifest = _manifests.get(site_id)
+    if (
+        manifest is None
+        or time.monotonic() - manifest.loaded_at > config.ASSET_MANIFEST_TIMEOUT
+    ):
+        manifest = _manifests[site_id] = _load_manifest(site_id)
+    return manifest.entries
+
+
+def build_asset_manifest(site_id: int) -> int:
+    """Reload the manifest of a site now, e.g. after an import. Returns its size."""
+    _manifests[site_id] = manifest = _load_manifest(site_id)
+    return len(manifest.entries)
+
+
+def asset_urls(names: Iterable[str]) -> dict[str, str]:
+    """Return the URL of every storage name, signing the stale ones in one batch."""
+    from .models import File
+
+    storage = File._meta.get_field("file").storage
+    # S3-compatible storages sign URLs when querystring_auth is on.
+    signs_urls = getattr(storage, "querystring_auth", False)
+    # The lifetime File.url signs with too, as configured on the storage.
+    expire: int = getattr(storage, "querystring_expire", 3600)
+    now = time.monotonic()
+    urls: dict[str, str] = {}
+    stale: list[str] = []
+    for name in names:
+        cached = _urls.get(name)
+        if cached is not None and cached[1] > now:
+            urls[name] = cached[0]
+        else:
+            stale.append(name)
+    for name in stale:
+        if signs_urls:
+            url = storage.url(name, expire=expire)  # type: ignore[call-arg]
+            _urls[name] = (url, now + expire / 2)
+        else:
+            url = storage.url(name)
+            _urls[name] = (url, float("inf"))
+        urls[name] = url
+    return urls
+
+
+def get_assets(site_id: int, file_paths: Iterable[str]) -> dict[str, Asset]:
+    """Resolve paths from the manifest; paths it does not list are left out."""
+    manifest = get_asset_manifest(site_id)
+    found = {path: manifest[path] for path in file_paths if path in manifest}
+    urls = asset_urls(entry[0] for entry in found.values())
+    return {
+        path: Asset(path, name, mime_type, width, height, content_hash, urls[name])
+        for path, (name, mime_type, width, height, content_hash) in found.items()
+    }
+
+
+def clear_asset_manifest(site_id: int | None = None, **kwargs: object) -> None:
+    """Drop the manifest of one site, or of every site along with all URLs.
+
+    URLs depend only on the storage name, so they outlive a single site's
+    manifest. Accepts signal kwargs so it can be
+    used as a receiver.
+    """
+    if site_id is None:
+        _manifests.clear()
+        _urls.clear()
+    else:
+        _manifests.pop(site_id, None)
@@ -7,6 +7,7 @@ class ContentEngineConfig(AppSettings):
     COURSE_ACCESS_CONFIG_VALIDATOR: str | None
     ADMONITION_TYPES: dict[str, dict[str, str]]
     COTTON_SNAKE_CASED_NAMES: bool
+    ASSET_MANIFEST_TIMEOUT: int
 
     declared_settings = {
         "COURSE_ACCESS_CONFIG_VALIDATOR": Setting(default=None),
@@ -16,6 +17,8 @@ class ContentEngineConfig(AppSettings):
         # No FLS consumer reads this: django-cotton reads it itself. Declared
         # here purely so it appears in the ownership map for this app.
         "COTTON_SNAKE_CASED_NAMES": Setting(default=False),
+        # Seconds before a process reloads a site's asset manifest.
+        "ASSET_MANIFEST_TIMEOUT": Setting(default=300),
     }
 
 
@@ -7,9 +7,11 @@ import contextlib
 import logging
 import mimetypes
 import re
+import time
 import uuid
 from collections import defaultdict
 from pathlib import Path
+from typing import Any
 
 import djclick as click
 import frontmatter
@@ -19,13 +21,27 @@ from django.contrib.contenttypes.models import ContentType as DjangoContentType
 from django.contrib.sites.models import Site
 from django.core.files import File as DjangoFile
 from django.db import transaction
+from django.template import TemplateSyntaxError
 from django.utils.module_loading import import_string
 from django.utils.text import slugify
 
+from freedom_ls.base.git_utils import (
+    GitError,
+    find_repo_root,
+    get_changed_paths,
+    get_head_commit,
+)
+from freedom_ls.content_engine.assets import (
+    build_asset_manifest,
+    file_hash,
+    file_metadata,
+)
 from freedom_ls.content_engine.config import config
 from freedom_ls.content_engine.models import (
     Activity,
     ContentCollectionItem,
+    ContentImport,
+    ContentSourceFile,
     Course,
     CoursePart,
     File,
@@ -33,6 +49,7 @@ from freedom_ls.content_engine.models import (
     FormContent,
     FormPage,
     FormQuestion,
+    MarkdownContent,
     QuestionOption,
     Topic,
 )
@@ -42,6 +59,10 @@ from freedom_ls.content_engine.validate import (
     parse_single_file,
     validate,
 )
+from freedom_ls.markdown_rendering.markdown_utils import (
+    get_markdown_template,
+    markdown_digest,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -286,24 +307,45 @@ def save_with_uuid(
         base_slug = slugify(fields["title"])
         fields["slug"] = get_unique_slug(model_class, site, base_slug, item.uuid)
 
+    if getattr(item, "content", None):
+        fields["content"] = markdown_translate(fields["content"])
+
     if item.uuid:
-        instance, _ = model_class.objects.update_or_create(
-            id=uuid.UUID(item.uuid), site=site, defaults=fields
-        )
+        item_id = uuid.UUID(item.uuid)
+        instance = model_class.objects.filter(id=item_id, site=site).first()
+        if instance is None:
+            instance = model_class.objects.create(id=item_id, site=site, **fields)
+        else:
+            # Rows whose data did not change are left untouched.
+            changed = changed_fields(instance, fields)
+            if changed:
+                for name in changed:
+                    setattr(instance, name, fields[name])
+                instance.save()
     else:
         instance = model_class.objects.create(site=site, **fields)
         if update_file:
             update_file_with_uuid(item.file_path, instance.id)
-    try:
-        if item.content:
-            instance.content = markdown_translate(instance.content)
-            instance.save()
-    except AttributeError:
-        pass  # nothing to do
 
     return instance
 
 
+def changed_fields(instance, fields):
+    """Return the names of ``fields`` whose values differ from ``instance``'s."""
+    changed = []
+    for name, value in fields.items():
+        field = instance._meta.get_field(name)
+        if field.many_to_one:
+            # Compare foreign keys by id so the related row isn't fetched.
+            current = getattr(instance, field.attname)
+            value = getattr(value, "pk", value)
+        else:
+            current = getattr(instance, name)
+        if current != value:
+            changed.append(name)
+    return changed
+
+
 def markdown_translate(markdown_content):
     # look for markdown pictures
     # Eg with title: `![[Chewy tubes.jpg | Chewy Tubes]]`
@@ -491,6 +533,8 @@ def save_file_to_db(file_path, site, base_path):
     # Get mime type
     mime_type, _ = mimetypes.guess_type(str(file_path))
 
+    content_hash, width, height = file_metadata(file_path)
+
     # Get or create the File record (without the file field)
     file_obj, created = File.objects.get_or_create(
         site=site,
@@ -499,6 +543,9 @@ def save_file_to_db(file_path, site, base_path):
             "file_type": file_type,
             "original_filename": file_path.name,
             "mime_type": mime_type or "",
+            "content_hash": content_hash,
+            "width": width,
+            "height": height,
         },
     )
 
@@ -507,6 +554,9 @@ def save_file_to_db(file_path, site, base_path):
         file_obj.file_type = file_type
         file_obj.original_filename = file_path.name
         file_obj.mime_type = mime_type or ""
+        file_obj.content_hash = content_hash
+        file_obj.width = width
+        file_obj.height = height
 
     # Always update the actual file
     with open(file_path, "rb") as f:
@@ -521,27 +571,307 @@ def save_file_to_db(file_path, site, base_path):
     logger.info(f"{action} {file_type} file: {relative_path}")
 
 
+MARKDOWN_MODELS: list[type[MarkdownContent]] = [
+    Topic,
+    Activity,
+    Course,
+    Form,
+    FormContent,
+]
+
+_RENDERED_FIELDS = ["rendered_html", "rendered_template", "rendered_html_digest"]
+
+# Every model with a stored render: the markdown field it is made from and the
+# fields prerender() sets.
+PRERENDERED_MODELS: list[
+    tuple[type[MarkdownContent | FormQuestion], str, list[str]]
+] = [
+    *(
+        (model_class, "content", [*_RENDERED_FIELDS, "rendered_references"])
+        for model_class in MARKDOWN_MODELS
+    ),
+    (FormQuestion, "question", _RENDERED_FIELDS),
+]
+
+
+def precompile_markdown(site, file_paths=None):
+    """Store the request-independent render of every stale markdown row.
+
+    Rows whose stored render was made from other content or another renderer
+    config are compiled; the template pass at request time then only renders.
+    Only rows saved from ``file_paths`` are checked when it is given. Logs how
+    many rows were compiled and how long it took.
+    """
+    compiled_count = 0
+    template_count = 0
+    up_to_date = 0
+    compile_seconds = 0.0
+    parse_seconds = 0.0
+    for model_class, source_field, rendered_fields in PRERENDERED_MODELS:
+        stale: list[Any] = []
+        rows = model_class._base_manager.filter(site=site).exclude(**{source_field: ""})
+        if file_paths is not None:
+            rows = rows.filter(file_path__in=file_paths)
+        for instance in rows:
+            source = getattr(instance, source_field)
+            if instance.rendered_html_digest == markdown_digest(source):
+                up_to_date += 1
+                continue
+            started = time.perf_counter()
+            compiled = instance.prerender()
+            compile_seconds += time.perf_counter() - started
+            if compiled.template_source:
+                # Parse once here so template syntax errors surface at import.
+                started = time.perf_counter()
+                try:
+                    get_markdown_template(compiled.template_source)
+                except TemplateSyntaxError as e:
+                    raise ValueError(
+                        f"Cannot compile markdown in {instance.file_path}: {e}"
+                    ) from e
+                parse_seconds += time.perf_counter() - started
+                template_count += 1
+            stale.append(instance)
+        model_class._base_manager.bulk_update(stale, rendered_fields, batch_size=500)
+        compiled_count += len(stale)
+
+    logger.info(
+        f"Precompiled markdown for {compiled_count} item(s) "
+        f"({template_count} with templates, {up_to_date} already up to date): "
+        f"compile {compile_seconds:.2f}s, template parse {parse_seconds:.2f}s"
+    )
+
+
+CONTENT_SUFFIXES = [".md", ".yaml", ".yml"]
+
+# (content hash, mtime, size)
+SourceState = tuple[str, float, int]
+
+
+def source_file_state(
+    file_path: Path, recorded: SourceState | None = None
+) -> SourceState:
+    """Return the content hash, mtime and size of a source file.
+
+    The hash is taken from ``recorded`` instead of reading the file when the
+    mtime and size still match it.
+    """
+    stat = file_path.stat()
+    if recorded is not None and recorded[1:] == (stat.st_mtime, stat.st_size):
+        return recorded
+    return file_hash(file_path), stat.st_mtime, stat.st_size
+
+
+def get_recorded_states(site, file_paths=None) -> dict[str, SourceState]:
+    """Return relative path -> state of the source files the last import read.
+
+    All of them, or only those in ``file_paths``.
+    """
+    records = ContentSourceFile.objects.filter(site=site)
+    if file_paths is not None:
+        records = records.filter(file_path__in=file_paths)
+    return {
+        file_path: (content_hash, mtime, size)
+        for file_path, content_hash, mtime, size in records.values_list(
+            "file_path", "content_hash", "mtime", "size"
+        )
+    }
+
+
+def find_changed_files(site, base_path, states, recorded):
+    """Return the files whose content differs from what the last import saved.
+
+    Content files are compared with their recorded hash, and assets with the
+    hash of their stored File, so an asset that was never uploaded is too.
+    """
+    stored_assets = dict(
+        File.objects.filter(site=site)
+        .exclude(file="")
+        .values_list("file_path", "content_hash")
+    )
+    changed = []
+    for file_path, (content_hash, _, _) in states.items():
+        relative_path = str(file_path.relative_to(base_path))
+        if file_path.suffix in CONTENT_SUFFIXES:
+            saved_hash = recorded.get(relative_path, ("",))[0]
+        else:
+            saved_hash = stored_assets.get(relative_path, "")
+        if saved_hash != content_hash:
+            changed.append(file_path)
+    return changed
+
+
+def record_source_files(site, base_path, states, recorded, reread, removed):
+    """Store the state of the files an import read for the next incremental one.
+
+    Files in ``reread`` are stat'ed again, since saving may have written UUIDs
+    into them. The records of the ``removed`` relative paths are deleted.
+    """
+    records = []
+    for file_path in states.keys() | reread:
+        relative_path = str(file_path.relative_to(base_path))
+        state = states.get(file_path)
+        if file_path in reread:
+            state = source_file_state(file_path, state or recorded.get(relative_path))
+        if recorded.get(relative_path) != state:
+            content_hash, mtime, size = state
+            records.append(
+                ContentSourceFile(
+                    site=site,
+                    file_path=relative_path,
+                    content_hash=content_hash,
+                    mtime=mtime,
+                    size=size,
+                )
+            )
+    ContentSourceFile.objects.bulk_create(
+        records,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["site", "file_path"],
+        update_fields=["content_hash", "mtime", "size"],
+    )
+    if removed:
+        ContentSourceFile.objects.filter(site=site, file_path__in=removed).delete()
+
+
+def get_git_changes(path, since):
+    """Return the (changed, deleted) files under ``path`` from ``since`` to HEAD.
+
+    Paths are ``path`` joined with the file's path relative to it, like the
+    paths ``get_all_files`` returns, and changed files it skips are left out.
+    Raises GitError if git fails.
+    """
+    path = Path(path)
+    repo_root = find_repo_root(path)
+    if repo_root is None:
+        raise GitError(f"{path} is not in a git repository")
+    content_root = path.resolve()
+    changed, deleted = (
+        [
+            path / file_path.relative_to(content_root)
+            for file_path in file_paths
+            if file_path.is_relative_to(content_root)
+        ]
+        for file_paths in get_changed_paths(repo_root, since)
+    )
+    content_files = set(get_all_files(path))
+    return [file_path for file_path in changed if file_path in content_files], deleted
+
+
+def record_import_commit(site, path):
+    """Store the HEAD commit of the repository ``path`` is in, if it is in one."""
+    repo_root = find_repo_root(Path(path))
+    commit = get_head_commit(repo_root) if repo_root else None
+    if commit:
+        ContentImport.objects.update_or_create(site=site, defaults={"commit": commit})
+
+
+def load_saved_content(site, base_path, paths):
+    """Map ``paths`` to the content rows that earlier imports saved from them."""
+    relative_paths = {}
+    for file_path in paths:
+        with contextlib.suppress(ValueError):
+            relative_paths[str(file_path.relative_to(base_path))] = file_path
+    found: dict[Path, Any] = {}
+    if not relative_paths:
+        return found
+    for model_class in (Topic, Activity, Course, CoursePart, Form):
+        for content_obj in model_class.objects.filter(
+            site=site, file_path__in=relative_paths
+        ):
+            found[relative_paths[content_obj.file_path]] = content_obj
+    return found
+
+
 @transaction.atomic
-def save_content_to_db(path, site_name):
-    """Scan through all validated files and save them to the database."""
+def save_content_to_db(path, site_name, incremental=False, changes=None):
+    """Scan through all validated files and save them to the database.
+
+    With ``incremental``, only files that changed since the last import are
+    read, along with the forms and collections that depend on them.
+    ``changes`` is a ``(changed, deleted)`` pair of file paths, e.g. from
+    ``get_git_changes``; when given, the import is incremental and only those
+    files are considered, without hashing the others.
+    """
     path = Path(path)
     # Get the site
     site = Site.objects.get(
         name=site_name,
     )
 
-    # Parse all files using existing validation code
     all_files = get_all_files(path)
-    all_parsed = []
+    current_paths = {str(file_path.relative_to(path)) for file_path in all_files}
+    if changes is not None:
+        incremental = True
+        changed, deleted = (set(file_paths) for file_paths in changes)
+        changed_files = [file_path for file_path in all_files if file_path in changed]
+        removed_paths = {
+            str(file_path.relative_to(path)) for file_path in deleted
+        } - current_paths
+        recorded = get_recorded_states(
+            site, [str(file_path.relative_to(path)) for file_path in changed_files]
+        )
+        states = {
+            file_path: source_file_state(
+                file_path, recorded.get(str(file_path.relative_to(path)))
+            )
+            for file_path in changed_files
+        }
+    else:
+        recorded = get_recorded_states(site)
+        removed_paths = set(recorded) - current_paths
+        states = {
+            file_path: source_file_state(
+                file_path, recorded.get(str(file_path.relative_to(path)))
+            )
+            for file_path in all_files
+        }
+        if incremental:
+            changed_files = find_changed_files(site, path, states, recorded)
+        else:
+            changed_files = all_files
+    if incremental:
+        logger.info(f"Skipping {len(all_files) - len(changed_files)} unchanged file(s)")
 
-    for file_path in all_files:
-        if file_path.suffix in [".md", ".yaml", ".yml"]:
+    # Parse all changed files using existing validation code
+    all_parsed = []
+    parsed_files = set()
+    for file_path in changed_files:
+        if file_path.suffix in CONTENT_SUFFIXES:
             parsed_items = parse_single_file(file_path)
             all_parsed.extend(parsed_items)
+            parsed_files.add(file_path)
         else:
             # Save non-content files (images, documents, etc.) to the database
             save_file_to_db(file_path, site, path)
 
+    # Directories where content files changed, were added or were removed.
+    removed_dirs = {
+        (path / removed).parent
+        for removed in removed_paths
+        if Path(removed).suffix in CONTENT_SUFFIXES
+    }
+    dirty_dirs = {file_path.parent for file_path in parsed_files} | removed_dirs
+
+    if incremental:
+        # Page order depends on every page of a form, so a change to a form's
+        # directory reads the whole form.
+        form_dirs = removed_dirs | {
+            item.file_path.parent
+            for item in all_parsed
+            if item.content_type
+            in (SchemaContentType.FORM, SchemaContentType.FORM_PAGE)
+        }
+        for file_path in all_files:
+            if (
+                file_path.parent in form_dirs
+                and file_path.suffix in CONTENT_SUFFIXES
+                and file_path not in parsed_files
+            ):
+                all_parsed.extend(parse_single_file(file_path))
+                parsed_files.add(file_path)
+
     # Group by content type
     grouped = defaultdict(list)
     for item in all_parsed:
@@ -576,6 +906,27 @@ def save_content_to_db(path, site_name):
         collections_data.append((collection, item))
         logger.info(f"Saved CoursePart: {collection.title}")
 
+    if incremental:
+        # Unchanged collections get their children again when anything below
+        # their directory changed.
+        for model_class in (Course, CoursePart):
+            for collection in model_class.objects.filter(site=site):
+                file_path = path / collection.file_path
+                if (
+                    file_path in parsed_files
+                    or collection.file_path not in current_paths
+                ):
+                    continue
+                if any(
+                    directory == file_path.parent
+                    or file_path.parent in directory.parents
+                    for directory in dirty_dirs
+                ):
+                    content_by_path[file_path] = collection
+                    collections_data.extend(
+                        (collection, item) for item in parse_single_file(file_path)
+                    )
+
     # Save Forms and track them by directory
     forms_by_dir = {}
     for item in grouped.get(SchemaContentType.FORM, []):
@@ -694,30 +1045,62 @@ def save_content_to_db(path, site_name):
                             type("Child", (), {"path": main_file, "overrides": None})()
                         )
 
+        if incremental:
+            # Children that did not change are looked up from earlier imports.
+            content_by_path.update(
+                load_saved_content(
+                    site,
+                    path,
+                    [
+                        child.path
+                        for child in children_list
+                        if child.path not in content_by_path
+                    ],
+                )
+            )
+
+        collection_content_type = DjangoContentType.objects.get_for_model(collection)
+        existing_items = {
+            (collection_item.child_type_id, collection_item.child_id): collection_item
+            for collection_item in ContentCollectionItem.objects.filter(
+                site=site,
+                collection_type=collection_content_type,
+                collection_id=collection.id,
+            )
+        }
+
         # Create ContentCollectionItem entries for each child
         for order, child in enumerate(children_list):
             child_content = content_by_path.get(child.path)
             if child_content:
-                # Get the Django ContentType for both collection and child
-                collection_content_type = DjangoContentType.objects.get_for_model(
-                    collection
-                )
                 child_content_type = DjangoContentType.objects.get_for_model(
                     child_content
                 )
 
-                # Create or update the ContentCollectionItem
-                ContentCollectionItem.objects.update_or_create(
-                    site=site,
-                    collection_type=collection_content_type,
-                    collection_id=collection.id,
-                    child_type=child_content_type,
-                    child_id=child_content.id,
-                    defaults={
-                        "order": order,
-                        "overrides": child.overrides,
-                    },
+                # Create or update the ContentCollectionItem, leaving it
+                # untouched when nothing changed
+                collection_item = existing_items.get(
+                    (child_content_type.id, child_content.id)
                 )
+                if collection_item is None:
+                    ContentCollectionItem.objects.create(
+                        site=site,
+                        collection_type=collection_content_type,
+                        collection_id=collection.id,
+                        child_type=child_content_type,
+                        child_id=child_content.id,
+                        order=order,
+                        overrides=child.overrides,
+                    )
+                elif (collection_item.order, collection_item.overrides) != (
+                    order,
+                    child.overrides,
+                ):
+                    collection_item.order = order
+                    collection_item.overrides = child.overrides
+                    collection_item.save()
+                else:
+                    continue
                 logger.info(
                     f"Added {child_content.__class__.__name__} '{child_content.title}' "
                     f"to {collection.__class__.__name__} '{collection.title}' (order={order})"
@@ -728,17 +1111,76 @@ def save_content_to_db(path, site_name):
                     f"in collection '{collection.title}'"
                 )
 
+    record_source_files(site, path, states, recorded, parsed_files, removed_paths)
+    record_import_commit(site, path)
+    if incremental:
+        # Only rows saved from the files read here can have changed.
+        precompile_markdown(
+            site,
+            file_paths=[str(file_path.relative_to(path)) for file_path in parsed_files],
+        )
+    else:
+        precompile_markdown(site)
+    asset_count = build_asset_manifest(site.pk)
+    logger.info(f"Built asset manifest with {asset_count} file(s)")
+
     logger.info(f"✓ Successfully saved all content for site: {site_name}")
 
 
 @click.command()
 @click.argument("path")
 @click.argument("site_name")
-def command(path, site_name):
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only save files that changed since the last import.",
+)
+@click.option(
+    "--since",
+    metavar="COMMIT",
+    default=None,
+    help="Only save files that changed in git between COMMIT and HEAD.",
+)
+@click.option(
+    "--since-last-import",
+    is_flag=True,
+    help=(
+        "Only save files that changed in git since the commit of the site's "
+        "last import."
+    ),
+)
+def command(path, site_name, incremental, since, since_last_import):
     """Validate and save content to database."""
+    if since is not None and since_last_import:
+        raise click.UsageError(
+            "--since and --since-last-import cannot be used together."
+        )
+    if since_last_import:
+        since = (
+            ContentImport.objects.filter(site__name=site_name)
+            .values_list("commit", flat=True)
+            .first()
+        )
+        if since is None:
+            raise click.ClickException(
+                f"No import of {site_name} has been recorded; "
+                "run content_save without --since-last-import first."
+            )
+    changes = None
+    if since is not None:
+        try:
+            changes = get_git_changes(path, since)
+        except GitError as e:
+            raise click.ClickException(str(e)) from e
+
     logger.info("Validating content...")
-    validate(path)
+    if changes is None:
+        validate(path)
+    else:
+        for file_path in changes[0]:
+            if file_path.suffix in CONTENT_SUFFIXES:
+                validate(file_path)
     logger.info("Validation complete!")
 
     logger.info("Saving to database...")
-    save_content_to_db(path, site_name)
+    save_content_to_db(path, site_name, incremental=incremental, changes=changes)
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.9 on 2026-10-18 23:38
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_accounts', '0006_user_search_trgm_indexes'),
+        ('freedom_ls_content_engine', '0014_course_table_of_contents_in_development'),
+        ('sites', '0002_alter_domain_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('title', output_field=models.TextField())), name='gin_trgm_ops'), name='course_title_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 6.0.9 on 2026-10-19 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_content_engine', '0015_course_title_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='rendered_html',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Sanitised HTML for content, stored by content_save'),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='rendered_html_digest',
+            field=models.CharField(blank=True, default='', editable=False, help_text='markdown_digest of the content rendered_html was made from', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rendered_html',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Sanitised HTML for content, stored by content_save'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rendered_html_digest',
+            field=models.CharField(blank=True, default='', editable=False, help_text='markdown_digest of the content rendered_html was made from', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='rendered_html',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Sanitised HTML for content, stored by content_save'),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='rendered_html_digest',
+            field=models.CharField(blank=True, default='', editable=False, help_text='markdown_digest of the content rendered_html was made from', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='formcontent',
+            name='rendered_html',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Sanitised HTML for content, stored by content_save'),
+        ),
+        migrations.AddField(
+            model_name='formcontent',
+            name='rendered_html_digest',
+            field=models.CharField(blank=True, default='', editable=False, help_text='markdown_digest of the content rendered_html was made from', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='rendered_html',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Sanitised HTML for content, stored by content_save'),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='rendered_html_digest',
+            field=models.CharField(blank=True, default='', editable=False, help_text='markdown_digest of the content rendered_html was made from', max_length=64),
+        ),
+    ]
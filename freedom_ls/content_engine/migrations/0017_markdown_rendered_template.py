@@ -0,0 +1,38 @@
+# Generated by Django 6.0.9 on 2026-10-19 01:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_content_engine', '0016_markdown_rendered_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='rendered_template',
+            field=models.TextField(blank=True, default='', editable=False, help_text='rendered_html compiled to Django template source, or empty when no template pass is needed'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rendered_template',
+            field=models.TextField(blank=True, default='', editable=False, help_text='rendered_html compiled to Django template source, or empty when no template pass is needed'),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='rendered_template',
+            field=models.TextField(blank=True, default='', editable=False, help_text='rendered_html compiled to Django template source, or empty when no template pass is needed'),
+        ),
+        migrations.AddField(
+            model_name='formcontent',
+            name='rendered_template',
+            field=models.TextField(blank=True, default='', editable=False, help_text='rendered_html compiled to Django template source, or empty when no template pass is needed'),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='rendered_template',
+            field=models.TextField(blank=True, default='', editable=False, help_text='rendered_html compiled to Django template source, or empty when no template pass is needed'),
+        ),
+    ]
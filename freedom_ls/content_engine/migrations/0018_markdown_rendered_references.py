@@ -0,0 +1,46 @@
+# Generated by Django 6.0.9 on 2026-10-19 01:19
+
+from django.db import migrations, models
+
+
+def reset_stored_renders(apps, schema_editor):
+    """Mark stored renders stale so content_save extracts their references."""
+    for model_name in ["Topic", "Activity", "Course", "Form", "FormContent"]:
+        model = apps.get_model("freedom_ls_content_engine", model_name)
+        model.objects.exclude(rendered_html_digest="").update(rendered_html_digest="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_content_engine', '0017_markdown_rendered_template'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='rendered_references',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Paths of files and content referenced by rendered_html'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rendered_references',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Paths of files and content referenced by rendered_html'),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='rendered_references',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Paths of files and content referenced by rendered_html'),
+        ),
+        migrations.AddField(
+            model_name='formcontent',
+            name='rendered_references',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Paths of files and content referenced by rendered_html'),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='rendered_references',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Paths of files and content referenced by rendered_html'),
+        ),
+        migrations.RunPython(reset_stored_renders, reverse_code=migrations.RunPython.noop),
+    ]
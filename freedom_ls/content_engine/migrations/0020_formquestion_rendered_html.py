@@ -0,0 +1,28 @@
+# Generated by Django 6.0.9 on 2026-10-19 01:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_content_engine', '0019_file_asset_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formquestion',
+            name='rendered_html',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Sanitised HTML for question, stored by content_save'),
+        ),
+        migrations.AddField(
+            model_name='formquestion',
+            name='rendered_html_digest',
+            field=models.CharField(blank=True, default='', editable=False, help_text='markdown_digest of the question rendered_html was made from', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='formquestion',
+            name='rendered_template',
+            field=models.TextField(blank=True, default='', editable=False, help_text='rendered_html compiled to Django template source, or empty when no template pass is needed'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.9 on 2026-10-19 02:04
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_content_engine', '0020_formquestion_rendered_html'),
+        ('sites', '0002_alter_domain_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentSourceFile',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file_path', models.CharField(help_text='Relative path to the source file', max_length=500)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('mtime', models.FloatField()),
+                ('size', models.PositiveBigIntegerField()),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='sites.site')),
+            ],
+            options={
+                'unique_together': {('site', 'file_path')},
+            },
+        ),
+    ]
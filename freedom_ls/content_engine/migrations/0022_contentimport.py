@@ -0,0 +1,28 @@
+# Generated by Django 6.0.9 on 2026-10-19 02:16
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_content_engine', '0021_contentsourcefile'),
+        ('sites', '0002_alter_domain_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentImport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('commit', models.CharField(max_length=40)),
+                ('imported_at', models.DateTimeField(auto_now=True)),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='sites.site')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('site',), name='unique_content_import_per_site')],
+            },
+        ),
+    ]
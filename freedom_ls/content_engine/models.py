@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from pathlib import Path
 
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
@@ -7,10 +8,25 @@ from django.db import models
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
-from freedom_ls.markdown_rendering.markdown_utils import render_markdown
+from freedom_ls.base.indexes import trigram_index
+from freedom_ls.markdown_rendering.markdown_utils import (
+    CompiledMarkdown,
+    compile_markdown,
+    get_compiled_markdown,
+    markdown_digest,
+    render_markdown,
+    split_markdown_sections,
+)
 from freedom_ls.site_aware_models.models import SiteAwareModel
 
 from .course_accent import PALETTE
+from .references import (
+    RESOLVED_REFERENCES_ATTR,
+    MarkdownReferences,
+    ResolvedReferences,
+    extract_references,
+    resolve_references,
+)
 from .schema import ContentType as SchemaContentTypes
 
 
@@ -120,19 +136,100 @@ class MarkdownContent(BaseContent):
     """Base content model with markdown content."""
 
     content = models.TextField(blank=True, default="", help_text=_("Markdown content"))
+    rendered_html = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_("Sanitised HTML for content, stored by content_save"),
+    )
+    rendered_template = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_(
+            "rendered_html compiled to Django template source, or empty when "
+            "no template pass is needed"
+        ),
+    )
+    rendered_html_digest = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_("markdown_digest of the content rendered_html was made from"),
+    )
 
-    def rendered_content(self):
-        from threading import local
+    rendered_references = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text=_("Paths of files and content referenced by rendered_html"),
+    )
 
+    def prerender(self) -> CompiledMarkdown:
+        """Store the request-independent render of ``content`` on the instance."""
+        compiled = compile_markdown(self.content)
+        self.rendered_html = compiled.html
+        self.rendered_template = compiled.template_source
+        self.rendered_references = extract_references(compiled.html).to_json()
+        self.rendered_html_digest = markdown_digest(self.content)
+        return compiled
+
+    def rendered_content(self):
         if not self.content:
             return ""
 
-        _thread_locals = local()
-        request = getattr(_thread_locals, "request", None)
+        # The stored render is only used while content and renderer config are
+        # unchanged, e.g. not after an admin edit or a settings change.
+        if self.rendered_html_digest == markdown_digest(self.content):
+            compiled = CompiledMarkdown(
+                html=self.rendered_html, template_source=self.rendered_template
+            )
+            references = MarkdownReferences.from_json(self.rendered_references)
+        else:
+            compiled = get_compiled_markdown(self.content)
+            references = extract_references(compiled.html)
+        if compiled.template_source and RESOLVED_REFERENCES_ATTR not in self.__dict__:
+            # Read by the get_file_by_path / get_content_by_path filters.
+            self.__dict__[RESOLVED_REFERENCES_ATTR] = resolve_references(
+                self, references
+            )
         return render_markdown(
-            self.content, request, context={"content_instance": self}
+            self.content, None, context={"content_instance": self}, compiled=compiled
         )
 
+    def rendered_sections(self) -> Iterator[str]:
+        """Render ``content`` one top-level section at a time, for streaming.
+
+        See ``split_markdown_sections`` for how content is split. Sections are
+        compiled through the cache like whole content; content with a single
+        section is rendered by ``rendered_content``.
+        """
+        sections = split_markdown_sections(self.content)
+        if len(sections) < 2:
+            yield self.rendered_content()
+            return
+
+        stored = self.rendered_html_digest == markdown_digest(self.content)
+        if stored and RESOLVED_REFERENCES_ATTR not in self.__dict__:
+            self.__dict__[RESOLVED_REFERENCES_ATTR] = resolve_references(
+                self, MarkdownReferences.from_json(self.rendered_references)
+            )
+        for section in sections:
+            compiled = get_compiled_markdown(section)
+            if compiled.template_source and not stored:
+                resolved = self.__dict__.setdefault(
+                    RESOLVED_REFERENCES_ATTR, ResolvedReferences()
+                )
+                section_resolved = resolve_references(
+                    self, extract_references(compiled.html)
+                )
+                resolved.files.update(section_resolved.files)
+                resolved.content.update(section_resolved.content)
+            yield render_markdown(
+                section, None, context={"content_instance": self}, compiled=compiled
+            )
+
     class Meta:
         abstract = True
 
@@ -233,6 +330,7 @@ class Course(MarkdownContent, TitledContent):
 
     class Meta:
         unique_together = ["site", "slug"]
+        indexes = [trigram_index("title", name="course_title_trgm_idx")]
 
     @property
     def accent_slot_key(self) -> str:
@@ -441,6 +539,22 @@ class Form(TitledContent, MarkdownContent):
         ),
     )
 
+    def question_numbers(self) -> dict:
+        """Map each question's pk to its number in the form, across pages.
+
+        Computed with one query, once per instance.
+        """
+        numbers = self.__dict__.get("_question_numbers")
+        if numbers is None:
+            question_pks = (
+                FormQuestion.objects.filter(form_page__form=self)
+                .order_by("form_page__order", "order")
+                .values_list("pk", flat=True)
+            )
+            numbers = {pk: number for number, pk in enumerate(question_pks, start=1)}
+            self.__dict__["_question_numbers"] = numbers
+        return numbers
+
     class Meta:
         unique_together = ["site", "slug"]
 
@@ -512,30 +626,56 @@ class FormQuestion(BaseContent):
         choices=QuestionType.choices,
     )
     required = models.BooleanField(default=True)
+    rendered_html = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_("Sanitised HTML for question, stored by content_save"),
+    )
+    rendered_template = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_(
+            "rendered_html compiled to Django template source, or empty when "
+            "no template pass is needed"
+        ),
+    )
+    rendered_html_digest = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        help_text=_("markdown_digest of the question rendered_html was made from"),
+    )
 
-    def rendered_question(self):
-        from threading import local
+    def prerender(self) -> CompiledMarkdown:
+        """Store the request-independent render of ``question`` on the instance."""
+        compiled = compile_markdown(self.question)
+        self.rendered_html = compiled.html
+        self.rendered_template = compiled.template_source
+        self.rendered_html_digest = markdown_digest(self.question)
+        return compiled
 
-        _thread_locals = local()
-        request = getattr(_thread_locals, "request", None)
-        return render_markdown(self.question, request)
+    def rendered_question(self):
+        # A form page shows each prompt more than once (e.g. as a visible
+        # heading and as a screen-reader label), so render it once per instance.
+        rendered = self.__dict__.get("_rendered_question")
+        if rendered is None:
+            compiled = None
+            if self.rendered_html_digest == markdown_digest(self.question):
+                compiled = CompiledMarkdown(
+                    html=self.rendered_html, template_source=self.rendered_template
+                )
+            rendered = render_markdown(self.question, None, compiled=compiled)
+            self.__dict__["_rendered_question"] = rendered
+        return rendered
 
     def question_number(self):
         """
         Return 1 for the first question in the Form, 2 for the second etc. Note that this might not be the same as the order attribute because form pages contain more than just questions
         """
-        form = self.form_page.form
-        question_count = 0
-
-        # Iterate through all pages in order
-        for page in form.pages.all():
-            # Get all questions on this page in order
-            for question in page.questions.all():
-                question_count += 1
-                if question.pk == self.pk:
-                    return question_count
-
-        return None
+        return self.form_page.form.question_numbers().get(self.pk)
 
     class Meta:
         ordering = ["order"]
@@ -592,9 +732,61 @@ class File(SiteAwareModel):
     )
     original_filename = models.CharField(max_length=255)
     mime_type = models.CharField(max_length=100, blank=True)
+    # Recorded by content_save for the asset manifest (see assets.py).
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
 
     class Meta:
         unique_together = ["site", "file_path"]
 
     def __str__(self):
         return f"{self.original_filename} ({self.get_file_type_display()})"
+
+    @property
+    def url(self) -> str:
+        """The file's URL; matches ``assets.Asset.url`` for templates."""
+        return self.file.url
+
+
+class ContentSourceFile(SiteAwareModel):
+    """The state of a source file as of the last ``content_save`` that read it.
+
+    ``content_save --incremental`` compares files against these records to
+    skip the ones that have not changed since.
+    """
+
+    file_path = models.CharField(
+        max_length=500,
+        help_text=_("Relative path to the source file"),
+    )
+    content_hash = models.CharField(max_length=64)
+    mtime = models.FloatField()
+    size = models.PositiveBigIntegerField()
+
+    class Meta:
+        unique_together = ["site", "file_path"]
+
+    def __str__(self):
+        return self.file_path
+
+
+class ContentImport(SiteAwareModel):
+    """The git commit a site's content was last imported from.
+
+    ``content_save --since-last-import`` imports only what changed after it.
+    """
+
+    commit = models.CharField(max_length=40)
+    imported_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["site"],
+                name="unique_content_import_per_site",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.site} @ {self.commit[:7]}"
@@ -0,0 +1,126 @@
+"""Batch resolution of the files and content that markdown components link to.
+
+``<c-picture src=...>`` and friends look files up with the
+``get_file_by_path`` filter, and ``<c-content-link path=...>`` looks content
+up with ``get_content_by_path``; each lookup is a query. The referenced paths
+are extracted once, when markdown is compiled (see
+``MarkdownContent.prerender``), and before rendering they are resolved with
+one query per model. Files come from the site's asset manifest (see
+``assets``), which lists every File of the site. The filters read the
+resolved objects from the content instance and only query for paths that
+were not resolved up front.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+    from .assets import Asset
+    from .models import BaseContent, File
+
+# Component tags whose attribute names a File, by ``get_file_by_path``.
+FILE_REFERENCE_ATTRIBUTES = {
+    "c-picture": "src",
+    "c-file-download": "src",
+    "c-pdf-embed": "src",
+    "c-card": "src",
+}
+# Component tags whose attribute names a Topic or Form, by
+# ``get_content_by_path``.
+CONTENT_REFERENCE_ATTRIBUTES = {"c-content-link": "path"}
+
+RESOLVED_REFERENCES_ATTR = "_resolved_references"
+
+_OPENING_TAG_RE = re.compile(r"<(c-[\w-]+)(\s[^>]*)?>")
+# nh3 output always double-quotes attribute values.
+_ATTRIBUTE_RE = re.compile(r'([\w:.-]+)="([^"]*)"')
+
+
+@dataclass(frozen=True)
+class MarkdownReferences:
+    """Raw paths referenced by components, relative to the content file."""
+
+    file_paths: tuple[str, ...] = ()
+    content_paths: tuple[str, ...] = ()
+
+    def to_json(self) -> dict[str, list[str]]:
+        return {"files": list(self.file_paths), "content": list(self.content_paths)}
+
+    @classmethod
+    def from_json(cls, data: dict[str, list[str]]) -> MarkdownReferences:
+        return cls(
+            file_paths=tuple(data.get("files", ())),
+            content_paths=tuple(data.get("content", ())),
+        )
+
+
+@dataclass
+class ResolvedReferences:
+    """Objects by path relative to the content root; None when not found."""
+
+    files: dict[str, Asset | File | None] = field(default_factory=dict)
+    content: dict[str, Model | None] = field(default_factory=dict)
+
+
+def extract_references(html: str) -> MarkdownReferences:
+    """Collect the paths that components in sanitised ``html`` look up."""
+    file_paths: dict[str, None] = {}
+    content_paths: dict[str, None] = {}
+    for match in _OPENING_TAG_RE.finditer(html):
+        tag = match.group(1)
+        attributes = dict(_ATTRIBUTE_RE.findall(match.group(2) or ""))
+        for mapping, paths in (
+            (FILE_REFERENCE_ATTRIBUTES, file_paths),
+            (CONTENT_REFERENCE_ATTRIBUTES, content_paths),
+        ):
+            value = attributes.get(mapping.get(tag, ""), "").strip()
+            # Values computed by template syntax are only known at render time.
+            if value and "{" not in value:
+                paths[value] = None
+    return MarkdownReferences(
+        file_paths=tuple(file_paths), content_paths=tuple(content_paths)
+    )
+
+
+def resolve_references(
+    instance: BaseContent, references: MarkdownReferences
+) -> ResolvedReferences:
+    """Look up every referenced path with one query per model.
+
+    Paths are resolved like the filters resolve them: relative to
+    ``instance``, files from the asset manifest, content as a Topic and then
+    as a Form, taking the first row by pk when a path is duplicated.
+    """
+    from .assets import get_assets
+    from .models import Form, Topic
+
+    resolved = ResolvedReferences()
+    file_paths = {
+        instance.calculate_path_from_root(path) for path in references.file_paths
+    }
+    if file_paths:
+        resolved.files = dict.fromkeys(file_paths)
+        resolved.files.update(get_assets(instance.site_id, file_paths))
+
+    content_paths = {
+        instance.calculate_path_from_root(path) for path in references.content_paths
+    }
+    if content_paths:
+        resolved.content = dict.fromkeys(content_paths)
+        remaining = set(content_paths)
+        for model_class in (Topic, Form):
+            if not remaining:
+                break
+            for content_obj in model_class.objects.filter(
+                site_id=instance.site_id, file_path__in=remaining
+            ).order_by("-pk"):
+                resolved.content[content_obj.file_path] = content_obj
+            remaining -= {
+                path for path, obj in resolved.content.items() if obj is not None
+            }
+    return resolved
@@ -0,0 +1,26 @@
+"""Keep the process-wide asset manifests in step with File writes."""
+
+from __future__ import annotations
+
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .assets import clear_asset_manifest
+from .models import File
+
+
+@receiver(post_save, sender=File)
+@receiver(post_delete, sender=File)
+def file_changed(sender: type[File], instance: File, **kwargs) -> None:
+    # Dropped on commit: a render before then, e.g. during content_save's
+    # atomic import, would cache a manifest that may still be rolled back.
+    site_id = instance.site_id
+    transaction.on_commit(lambda: clear_asset_manifest(site_id))
+
+
+@receiver(setting_changed)
+def asset_settings_changed(setting: str, **kwargs) -> None:
+    if setting == "STORAGES":
+        clear_asset_manifest()
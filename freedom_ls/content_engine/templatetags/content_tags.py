@@ -5,8 +5,10 @@ from django import template
 from django.utils.html import escape
 from django.utils.safestring import SafeString
 
+from freedom_ls.content_engine.assets import get_assets
 from freedom_ls.content_engine.config import config
 from freedom_ls.content_engine.models import File, Form, Topic
+from freedom_ls.content_engine.references import RESOLVED_REFERENCES_ATTR
 from freedom_ls.icons.render import render_icon
 from freedom_ls.markdown_rendering.markdown_utils import render_markdown
 
@@ -122,6 +124,16 @@ def get_file_by_path(file_path, content_instance):
 
     final_path = content_instance.calculate_path_from_root(file_path)
 
+    resolved = getattr(content_instance, RESOLVED_REFERENCES_ATTR, None)
+    if resolved is not None and final_path in resolved.files:
+        return resolved.files[final_path]
+
+    site_id = getattr(content_instance, "site_id", None)
+    if site_id is not None:
+        asset = get_assets(site_id, [final_path]).get(final_path)
+        if asset is not None:
+            return asset
+
     try:
         return File.objects.get(file_path=final_path)
     except File.DoesNotExist:
@@ -154,6 +166,10 @@ def get_content_by_path(file_path, content_instance):
 
     final_path = content_instance.calculate_path_from_root(file_path)
 
+    resolved = getattr(content_instance, RESOLVED_REFERENCES_ATTR, None)
+    if resolved is not None and final_path in resolved.content:
+        return resolved.content[final_path]
+
     # Try to find as Topic first
     try:
         return Topic.objects.get(file_path=final_path)
@@ -0,0 +1,120 @@
+"""Tests for the per-site asset manifest."""
+
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from django.contrib.sites.models import Site
+
+from freedom_ls.content_engine import assets
+from freedom_ls.content_engine.assets import (
+    file_metadata,
+    get_assets,
+    image_dimensions,
+)
+from freedom_ls.content_engine.factories import FileFactory
+from freedom_ls.content_engine.models import File
+
+
+def _png(width: int, height: int) -> bytes:
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    ihdr = struct.pack(">I", len(header)) + b"IHDR" + header
+    return b"\x89PNG\r\n\x1a\n" + ihdr + struct.pack(">I", zlib.crc32(b"IHDR" + header))
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHH", 11, 8, height, width) + b"\x01\x11\x00"
+    return b"\xff\xd8" + app0 + sof0 + b"\xff\xd9"
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (_png(640, 480), (640, 480)),
+        (b"GIF89a" + struct.pack("<HH", 32, 16) + b"\x00" * 10, (32, 16)),
+        (_jpeg(1024, 768), (1024, 768)),
+        (b"%PDF-1.7\n", None),
+    ],
+)
+def test_image_dimensions_reads_headers(
+    tmp_path: Path, data: bytes, expected: tuple[int, int] | None
+) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(data)
+
+    assert image_dimensions(path) == expected
+
+
+def test_file_metadata_hashes_and_measures(tmp_path: Path) -> None:
+    path = tmp_path / "image.png"
+    path.write_bytes(_png(2, 3))
+
+    content_hash, width, height = file_metadata(path)
+
+    assert len(content_hash) == 64
+    assert (width, height) == (2, 3)
+
+
+@pytest.mark.django_db
+class TestAssetManifest:
+    def test_resolves_assets_without_queries_once_loaded(
+        self, mock_site_context: Site, django_assert_num_queries
+    ) -> None:
+        image = FileFactory(file_path="course/a.png", width=640, height=480)
+        get_assets(mock_site_context.pk, ["course/a.png"])
+
+        with django_assert_num_queries(0):
+            found = get_assets(mock_site_context.pk, ["course/a.png", "missing.png"])
+
+        asset = found["course/a.png"]
+        assert asset.url == image.url
+        assert (asset.width, asset.height) == (640, 480)
+        assert "missing.png" not in found
+
+    def test_file_writes_drop_the_site_manifest_on_commit(
+        self, mock_site_context: Site, django_capture_on_commit_callbacks
+    ) -> None:
+        image = FileFactory(file_path="course/a.png")
+        assert get_assets(mock_site_context.pk, ["course/a.png"])
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            image.delete()
+        # A rollback would restore the file, so the manifest is kept until then.
+        assert get_assets(mock_site_context.pk, ["course/a.png"])
+
+        for callback in callbacks:
+            callback()
+        assert get_assets(mock_site_context.pk, ["course/a.png"]) == {}
+
+    def test_signed_urls_are_generated_once_per_window(
+        self, mock_site_context: Site, monkeypatch
+    ) -> None:
+        signed: list[tuple[str, int]] = []
+
+        class SigningStorage:
+            querystring_auth = True
+            querystring_expire = 600
+
+            def url(self, name: str, expire: int) -> str:
+                signed.append((name, expire))
+                return f"https://bucket.example.com/{name}?sig={len(signed)}"
+
+        FileFactory(file_path="course/a.png")
+        FileFactory(file_path="course/b.png")
+        monkeypatch.setattr(File._meta.get_field("file"), "storage", SigningStorage())
+        paths = ["course/a.png", "course/b.png"]
+
+        first = get_assets(mock_site_context.pk, paths)
+        second = get_assets(mock_site_context.pk, paths)
+
+        assert len(signed) == 2
+        assert {expire for _, expire in signed} == {600}
+        assert first == second
+
+        # Past half the window, URLs are signed again.
+        monkeypatch.setattr(assets.time, "monotonic", lambda: 10**9)
+        get_assets(mock_site_context.pk, paths)
+        assert len(signed) == 4
@@ -0,0 +1,328 @@
+"""Tests for incremental and git-diff driven imports with content_save."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import djclick as click
+import pytest
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+
+from freedom_ls.accounts.tests._git_helpers import commit_all, init_repo, run_git
+from freedom_ls.content_engine.management.commands import content_save
+from freedom_ls.content_engine.management.commands.content_save import (
+    save_content_to_db,
+)
+from freedom_ls.content_engine.models import (
+    ContentImport,
+    ContentSourceFile,
+    Course,
+    FormPage,
+    Topic,
+)
+
+# A 1x1 PNG.
+PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
+    b"\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\xf8\x0f"
+    b"\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+
+def _write_course(course_dir: Path) -> None:
+    """Write a course with two topics, an image and a two-page quiz."""
+    course_dir.mkdir()
+    (course_dir / "course.md").write_text("""---
+content_type: COURSE
+title: Incremental Course
+uuid: 20000000-0000-0000-0000-000000000001
+---
+""")
+    (course_dir / "1. first.md").write_text("""---
+content_type: TOPIC
+title: First
+uuid: 20000000-0000-0000-0000-000000000002
+---
+
+First content
+""")
+    (course_dir / "2. second.md").write_text("""---
+content_type: TOPIC
+title: Second
+uuid: 20000000-0000-0000-0000-000000000003
+---
+
+Second content
+""")
+    (course_dir / "images").mkdir()
+    (course_dir / "images" / "dot.png").write_bytes(PNG)
+
+    quiz_dir = course_dir / "3. quiz"
+    quiz_dir.mkdir()
+    (quiz_dir / "form.md").write_text("""---
+content_type: FORM
+strategy: CATEGORY_VALUE_SUM
+title: Quiz
+uuid: 20000000-0000-0000-0000-000000000004
+---
+""")
+    for number in (1, 2):
+        (quiz_dir / f"{number}. page.yaml").write_text(f"""---
+content_type: FORM_PAGE
+title: Page {number}
+uuid: 20000000-0000-0000-0000-00000000001{number}
+---
+question: Question {number}?
+type: short_text
+uuid: 20000000-0000-0000-0000-00000000002{number}
+""")
+
+
+def _edit(file_path: Path, old: str, new: str) -> None:
+    file_path.write_text(file_path.read_text().replace(old, new))
+
+
+def _writes(queries: CaptureQueriesContext) -> list[str]:
+    return [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+    ]
+
+
+@pytest.fixture
+def course_dir(tmp_path, site, mock_site_context):
+    course_dir = tmp_path / "course"
+    _write_course(course_dir)
+    save_content_to_db(course_dir, site.name)
+    return course_dir
+
+
+@pytest.mark.django_db
+def test_import_records_every_source_file(course_dir, site):
+    recorded = dict(
+        ContentSourceFile.objects.filter(site=site).values_list(
+            "file_path", "content_hash"
+        )
+    )
+
+    assert set(recorded) == {
+        "course.md",
+        "1. first.md",
+        "2. second.md",
+        "images/dot.png",
+        "3. quiz/form.md",
+        "3. quiz/1. page.yaml",
+        "3. quiz/2. page.yaml",
+    }
+    assert all(len(content_hash) == 64 for content_hash in recorded.values())
+
+
+@pytest.mark.django_db
+def test_incremental_import_of_unchanged_content_writes_nothing(course_dir, site):
+    with (
+        mock.patch.object(
+            content_save, "parse_single_file", wraps=content_save.parse_single_file
+        ) as parse,
+        mock.patch.object(content_save, "save_file_to_db") as save_file,
+        CaptureQueriesContext(connection) as queries,
+    ):
+        save_content_to_db(course_dir, site.name, incremental=True)
+
+    parse.assert_not_called()
+    save_file.assert_not_called()
+    assert _writes(queries) == []
+
+
+@pytest.mark.django_db
+def test_unchanged_files_with_new_mtime_are_not_reread(course_dir, site):
+    os.utime(course_dir / "1. first.md")
+    os.utime(course_dir / "images" / "dot.png")
+
+    with (
+        mock.patch.object(
+            content_save, "parse_single_file", wraps=content_save.parse_single_file
+        ) as parse,
+        mock.patch.object(content_save, "save_file_to_db") as save_file,
+    ):
+        save_content_to_db(course_dir, site.name, incremental=True)
+
+    parse.assert_not_called()
+    save_file.assert_not_called()
+    record = ContentSourceFile.objects.get(site=site, file_path="1. first.md")
+    assert record.mtime == (course_dir / "1. first.md").stat().st_mtime
+
+
+@pytest.mark.django_db
+def test_incremental_import_saves_only_the_changed_topic(course_dir, site):
+    _edit(course_dir / "2. second.md", "Second content", "Second contents")
+    saved = []
+
+    def record_save(sender, instance, **kwargs):
+        saved.append(f"{sender.__name__}: {instance}")
+
+    post_save.connect(record_save)
+    try:
+        with mock.patch.object(
+            content_save, "parse_single_file", wraps=content_save.parse_single_file
+        ) as parse:
+            save_content_to_db(course_dir, site.name, incremental=True)
+    finally:
+        post_save.disconnect(record_save)
+
+    # The topic itself, then the course it belongs to for its children; the
+    # other topic is not read.
+    parsed = [call.args[0].name for call in parse.call_args_list]
+    assert parsed[:2] == ["2. second.md", "course.md"]
+    assert "1. first.md" not in parsed
+    assert saved == ["Topic: Second"]
+    assert Topic.objects.get(title="Second").content.strip() == "Second contents"
+
+
+@pytest.mark.django_db
+def test_changed_asset_is_uploaded_again(course_dir, site):
+    (course_dir / "images" / "dot.png").write_bytes(PNG + b"\x00")
+
+    with mock.patch.object(
+        content_save, "save_file_to_db", wraps=content_save.save_file_to_db
+    ) as save_file:
+        save_content_to_db(course_dir, site.name, incremental=True)
+
+    assert [call.args[0].name for call in save_file.call_args_list] == ["dot.png"]
+
+
+@pytest.mark.django_db
+def test_new_topic_is_added_to_unchanged_course(course_dir, site):
+    (course_dir / "4. third.md").write_text("""---
+content_type: TOPIC
+title: Third
+uuid: 20000000-0000-0000-0000-000000000005
+---
+
+Third content
+""")
+
+    save_content_to_db(course_dir, site.name, incremental=True)
+
+    course = Course.objects.get(site=site)
+    assert [item.child.title for item in course.items.order_by("order")] == [
+        "First",
+        "Second",
+        "Quiz",
+        "Third",
+    ]
+
+
+@pytest.mark.django_db
+def test_changed_form_page_keeps_page_order(course_dir, site):
+    _edit(course_dir / "3. quiz" / "2. page.yaml", "Question 2?", "Question two?")
+
+    save_content_to_db(course_dir, site.name, incremental=True)
+
+    pages = FormPage.objects.filter(site=site).order_by("order")
+    assert [(page.title, page.order) for page in pages] == [
+        ("Page 1", 0),
+        ("Page 2", 1),
+    ]
+    assert pages[1].children()[0].question == "Question two?"
+
+
+@pytest.fixture
+def git_course_dir(tmp_path, site, mock_site_context):
+    init_repo(tmp_path)
+    course_dir = tmp_path / "course"
+    _write_course(course_dir)
+    commit_all(tmp_path)
+    call_command("content_save", str(course_dir), site.name)
+    return course_dir
+
+
+@pytest.mark.django_db
+def test_import_records_the_head_commit(git_course_dir, site):
+    head = run_git(git_course_dir, "rev-parse", "HEAD")
+
+    assert ContentImport.objects.get(site=site).commit == head
+
+
+@pytest.mark.django_db
+def test_since_last_import_reads_only_files_changed_in_git(git_course_dir, site):
+    _edit(git_course_dir / "2. second.md", "Second content", "Second contents")
+    (git_course_dir / "3. quiz" / "2. page.yaml").unlink()
+    # Skipped by imports, so neither validated nor read.
+    (git_course_dir / "README.md").write_text("# Notes\n")
+    commit_all(git_course_dir, "second")
+
+    with (
+        mock.patch.object(
+            content_save, "parse_single_file", wraps=content_save.parse_single_file
+        ) as parse,
+        mock.patch.object(
+            content_save, "file_hash", wraps=content_save.file_hash
+        ) as hash_file,
+    ):
+        call_command(
+            "content_save", str(git_course_dir), site.name, "--since-last-import"
+        )
+
+    parsed = [call.args[0].name for call in parse.call_args_list]
+    assert parsed[:3] == ["2. second.md", "1. page.yaml", "form.md"]
+    assert "1. first.md" not in parsed
+    # Files outside the diff are not hashed either, except the rest of the
+    # form, which is read because its page order may have changed.
+    assert {call.args[0].name for call in hash_file.call_args_list} == {
+        "2. second.md",
+        "1. page.yaml",
+        "form.md",
+    }
+    assert Topic.objects.get(title="Second").content.strip() == "Second contents"
+    assert not ContentSourceFile.objects.filter(
+        site=site, file_path="3. quiz/2. page.yaml"
+    ).exists()
+    head = run_git(git_course_dir, "rev-parse", "HEAD")
+    assert ContentImport.objects.get(site=site).commit == head
+
+
+@pytest.mark.django_db
+def test_since_accepts_an_explicit_commit(git_course_dir, site):
+    first = run_git(git_course_dir, "rev-parse", "HEAD")
+    _edit(git_course_dir / "1. first.md", "First content", "First contents")
+    commit_all(git_course_dir, "second")
+    ContentImport.objects.filter(site=site).delete()
+
+    # The commit is the option's value, not the PATH argument.
+    call_command("content_save", "--since", first, str(git_course_dir), site.name)
+
+    assert Topic.objects.get(title="First").content.strip() == "First contents"
+
+
+@pytest.mark.django_db
+def test_since_last_import_without_a_recorded_import_fails(
+    tmp_path, site, mock_site_context
+):
+    init_repo(tmp_path)
+    _write_course(tmp_path / "course")
+    commit_all(tmp_path)
+
+    with pytest.raises(click.ClickException, match="No import"):
+        call_command(
+            "content_save", str(tmp_path / "course"), site.name, "--since-last-import"
+        )
+
+
+@pytest.mark.django_db
+def test_since_and_since_last_import_are_exclusive(git_course_dir, site):
+    head = run_git(git_course_dir, "rev-parse", "HEAD")
+
+    with pytest.raises(click.UsageError, match="cannot be used together"):
+        call_command(
+            "content_save",
+            str(git_course_dir),
+            site.name,
+            "--since",
+            head,
+            "--since-last-import",
+        )
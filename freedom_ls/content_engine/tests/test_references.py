@@ -0,0 +1,84 @@
+"""Tests for batch resolution of component file and content references."""
+
+import pytest
+
+from django.contrib.sites.models import Site
+
+from freedom_ls.content_engine.factories import (
+    FileFactory,
+    FormFactory,
+    TopicFactory,
+)
+from freedom_ls.content_engine.references import (
+    MarkdownReferences,
+    extract_references,
+    resolve_references,
+)
+
+
+def test_extract_references_collects_component_paths() -> None:
+    html = (
+        '<c-picture src="images/a.png" title="A"></c-picture>'
+        '<c-picture src=" images/a.png "></c-picture>'
+        '<c-file-download src="docs/b.pdf"></c-file-download>'
+        '<c-card src="{{ computed }}"></c-card>'
+        '<c-content-link path="../other/topic.md">Other</c-content-link>'
+        '<c-youtube video_id="abc"></c-youtube>'
+        '<img src="not-a-component.png">'
+    )
+
+    references = extract_references(html)
+
+    assert references == MarkdownReferences(
+        file_paths=("images/a.png", "docs/b.pdf"),
+        content_paths=("../other/topic.md",),
+    )
+    assert MarkdownReferences.from_json(references.to_json()) == references
+
+
+@pytest.mark.django_db
+def test_resolve_references_runs_one_query_per_model(
+    mock_site_context: Site, django_assert_num_queries
+) -> None:
+    instance = TopicFactory(file_path="course/topic.md")
+    image = FileFactory(file_path="course/images/a.png")
+    linked_topic = TopicFactory(file_path="course/other.md")
+    linked_form = FormFactory(file_path="course/quiz/form.md")
+    references = MarkdownReferences(
+        file_paths=("images/a.png", "images/missing.png"),
+        content_paths=("other.md", "quiz/form.md", "missing.md"),
+    )
+
+    # The asset manifest, Topic and Form.
+    with django_assert_num_queries(3):
+        resolved = resolve_references(instance, references)
+
+    asset = resolved.files["course/images/a.png"]
+    assert asset is not None
+    assert asset.url == image.url
+    assert resolved.files["course/images/missing.png"] is None
+    assert resolved.content == {
+        "course/other.md": linked_topic,
+        "course/quiz/form.md": linked_form,
+        "course/missing.md": None,
+    }
+
+
+@pytest.mark.django_db
+def test_rendered_content_resolves_pictures_in_one_query(
+    mock_site_context: Site, django_assert_max_num_queries
+) -> None:
+    for i in range(20):
+        FileFactory(file_path=f"course/images/{i}.png")
+    topic = TopicFactory(
+        file_path="course/topic.md",
+        content="\n\n".join(
+            f'<c-picture src="images/{i}.png" alt=""></c-picture>' for i in range(20)
+        ),
+    )
+    topic.prerender()
+
+    with django_assert_max_num_queries(1):
+        html = topic.rendered_content()
+
+    assert html.count('x-data="contentLightbox"') == 20
@@ -0,0 +1,122 @@
+"""Tests for the sanitised HTML stored on markdown content."""
+
+import logging
+import tempfile
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from django.contrib.sites.models import Site
+
+from freedom_ls.content_engine import models as content_models
+from freedom_ls.content_engine.factories import FormQuestionFactory, TopicFactory
+from freedom_ls.content_engine.management.commands.content_save import (
+    precompile_markdown,
+    save_content_to_db,
+)
+from freedom_ls.content_engine.models import FormQuestion, Topic
+from freedom_ls.markdown_rendering import markdown_utils
+from freedom_ls.markdown_rendering.markdown_utils import markdown_digest
+
+
+def _write_topic(directory: str, title: str, body: str) -> None:
+    (Path(directory) / f"{title}.md").write_text(
+        f"---\ncontent_type: TOPIC\ntitle: {title}\n---\n\n{body}\n"
+    )
+
+
+@pytest.mark.django_db
+def test_content_save_stores_rendered_html(
+    mock_site_context: Site, caplog: pytest.LogCaptureFixture
+) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_topic(tmpdir, "Stored", "Some **bold** text")
+        _write_topic(tmpdir, "Video", '<c-youtube video_id="abc"></c-youtube>')
+        with caplog.at_level(logging.INFO):
+            save_content_to_db(tmpdir, mock_site_context.name)
+        assert "Precompiled markdown for 2 item(s) (1 with templates" in caplog.text
+
+        caplog.clear()
+        with caplog.at_level(logging.INFO):
+            save_content_to_db(tmpdir, mock_site_context.name)
+        assert "for 0 item(s) (0 with templates, 2 already up to date)" in caplog.text
+
+    topic = Topic.objects.get(title="Stored")
+    assert topic.rendered_html == "<p>Some <strong>bold</strong> text</p>"
+    assert topic.rendered_template == ""
+    assert topic.rendered_html_digest == markdown_digest(topic.content)
+    video = Topic.objects.get(title="Video")
+    assert "{% cotton youtube" in video.rendered_template
+
+
+@pytest.mark.django_db
+def test_content_save_reports_template_errors(mock_site_context: Site) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_topic(tmpdir, "Broken", "Uses {% no_such_tag %} here")
+        with pytest.raises(ValueError, match=r"Broken\.md"):
+            save_content_to_db(tmpdir, mock_site_context.name)
+
+
+@pytest.mark.django_db
+def test_rendered_content_uses_stored_html(
+    mock_site_context: Site, mocker: MockerFixture
+) -> None:
+    topic = TopicFactory(content="Fresh")
+    topic.prerender()
+    spy = mocker.spy(markdown_utils, "markdown_to_html")
+
+    assert topic.rendered_content() == "<p>Fresh</p>"
+    assert spy.call_count == 0
+
+
+@pytest.mark.django_db
+def test_rendered_content_ignores_stale_stored_html(mock_site_context: Site) -> None:
+    """Edits made after content_save (e.g. in the admin) are not masked."""
+    topic = TopicFactory(content="Old")
+    topic.prerender()
+    topic.content = "New"
+
+    assert topic.rendered_content() == "<p>New</p>"
+
+
+@pytest.mark.django_db
+def test_rendered_sections_render_each_top_level_section(
+    mock_site_context: Site, django_assert_max_num_queries
+) -> None:
+    image_topic = TopicFactory(
+        file_path="course/topic.md",
+        content=(
+            "Intro\n\n# First\n\n"
+            '<c-picture src="images/a.png" alt=""></c-picture>\n\n'
+            "# Second\n\nText\n"
+        ),
+    )
+    image_topic.prerender()
+
+    # The asset manifest, loaded once for every section.
+    with django_assert_max_num_queries(1):
+        sections = list(image_topic.rendered_sections())
+
+    assert len(sections) == 3
+    assert "First" in sections[1]
+    assert "Image not found" in sections[1]
+    assert "Second" in sections[2]
+
+
+@pytest.mark.django_db
+def test_question_prompts_render_once_from_the_stored_render(
+    mock_site_context: Site, mocker: MockerFixture
+) -> None:
+    question = FormQuestionFactory(question="Pick **one**")
+    precompile_markdown(mock_site_context)
+    question = FormQuestion.objects.get(pk=question.pk)
+    assert question.rendered_html_digest == markdown_digest(question.question)
+    compile_spy = mocker.spy(markdown_utils, "markdown_to_html")
+    render_spy = mocker.spy(content_models, "render_markdown")
+
+    # A form page shows each prompt as a heading and as a screen-reader label.
+    assert question.rendered_question() == "<p>Pick <strong>one</strong></p>"
+    assert question.rendered_question() == "<p>Pick <strong>one</strong></p>"
+    assert compile_spy.call_count == 0
+    assert render_spy.call_count == 1
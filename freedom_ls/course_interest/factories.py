@@ -14,7 +14,7 @@ class CourseInterestFactory(SiteAwareFactory):
     """Factory for CourseInterest instances.
 
     Extends SiteAwareFactory so that site is set automatically from the
-    thread-local mock_site_context in tests. Never set site_id manually.
+    mock_site_context in tests. Never set site_id manually.
     """
 
     class Meta:
@@ -50,6 +50,18 @@ DATABASE_TASKS: dict[str, dict[str, str]] = {
     "default": {"BACKEND": "django_tasks_db.DatabaseBackend"},
 }
 
+# Shared cache for production. Panel fragments and accessible-object ids are
+# cached across requests and invalidated by bumping counters in the default
+# cache; with Django's per-process LocMemCache, a write handled by one Gunicorn
+# worker would leave the others serving stale data. The database cache needs no
+# extra service, only its table: run `python manage.py createcachetable` on deploy.
+DATABASE_CACHES: dict[str, dict[str, str]] = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "freedom_ls_cache",
+    },
+}
+
 
 def require_secret_key() -> str:
     """Return SECRET_KEY from the environment, raising ImproperlyConfigured if
@@ -463,3 +463,66 @@ def test_item_deadlines_shown_in_column_headers(mock_site_context, site_aware_re
     # Hard deadline should have error styling, soft should have warning styling
     assert "text-error" in content
     assert "text-warning" in content
+
+
+@pytest.mark.django_db
+def test_overdue_only_filter_hides_students_without_overdue_items(
+    mock_site_context, site_aware_request
+):
+    cohort = CohortFactory()
+    course = CourseFactory()
+    educator_user = UserFactory(staff=True)
+    registration = CohortCourseRegistrationFactory(cohort=cohort, collection=course)
+    topic = TopicFactory(title="Topic 1")
+    ContentCollectionItemFactory(collection_object=course, child_object=topic, order=0)
+
+    late = _make_user("late@example.com", cohort)
+    done = _make_user("done@example.com", cohort)
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=topic,
+        deadline=timezone.now() - timedelta(days=1),
+    )
+    progress = TopicProgressFactory(user=done, topic=topic)
+    progress.complete_time = timezone.now()
+    progress.save()
+
+    panel = CohortCourseProgressPanel(cohort)
+    request = site_aware_request.get("/?overdue=1")
+    request.user = educator_user
+    content = panel.get_content(request)
+
+    assert late.email in content
+    assert done.email not in content
+    assert "1 overdue" in content
+
+
+@pytest.mark.django_db
+def test_sort_by_overdue_lists_most_overdue_first(
+    mock_site_context, site_aware_request
+):
+    cohort = CohortFactory()
+    course = CourseFactory()
+    educator_user = UserFactory(staff=True)
+    registration = CohortCourseRegistrationFactory(cohort=cohort, collection=course)
+    topic = TopicFactory(title="Topic 1")
+    ContentCollectionItemFactory(collection_object=course, child_object=topic, order=0)
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=topic,
+        deadline=timezone.now() - timedelta(days=1),
+    )
+
+    # a_done sorts first by email and progress; b_late is the only overdue one.
+    a_done = _make_user("a_done@example.com", cohort)
+    _make_user("b_late@example.com", cohort)
+    progress = TopicProgressFactory(user=a_done, topic=topic)
+    progress.complete_time = timezone.now()
+    progress.save()
+
+    panel = CohortCourseProgressPanel(cohort)
+    request = site_aware_request.get("/?sort=overdue")
+    request.user = educator_user
+    content = panel.get_content(request)
+
+    assert content.find("b_late@example.com") < content.find("a_done@example.com")
@@ -0,0 +1,168 @@
+import csv
+import io
+from datetime import timedelta
+
+import pytest
+from guardian.shortcuts import assign_perm
+
+from django.utils import timezone
+
+from freedom_ls.accounts.factories import UserFactory
+from freedom_ls.content_engine.factories import (
+    ContentCollectionItemFactory,
+    CourseFactory,
+    TopicFactory,
+)
+from freedom_ls.educator_interface.views import (
+    CohortCourseProgressPanel,
+    ExportCourseProgressCsvAction,
+)
+from freedom_ls.student_management.factories import (
+    CohortCourseRegistrationFactory,
+    CohortDeadlineFactory,
+    CohortFactory,
+    CohortMembershipFactory,
+    UserCohortDeadlineOverrideFactory,
+)
+from freedom_ls.student_progress.factories import TopicProgressFactory
+
+
+def _read_csv(response) -> list[list[str]]:
+    body = b"".join(response.streaming_content).decode()
+    return list(csv.reader(io.StringIO(body)))
+
+
+@pytest.fixture
+def cohort_with_course(mock_site_context):
+    cohort = CohortFactory(name="Spring Intake")
+    course = CourseFactory(title="Intro Course")
+    registration = CohortCourseRegistrationFactory(cohort=cohort, collection=course)
+    topics = []
+    for i in range(2):
+        topic = TopicFactory(title=f"Topic {i}")
+        ContentCollectionItemFactory(
+            collection_object=course, child_object=topic, order=i
+        )
+        topics.append(topic)
+    return cohort, registration, topics
+
+
+@pytest.mark.django_db
+def test_export_streams_every_student_across_chunks(
+    cohort_with_course, site_aware_request
+):
+    cohort, _, topics = cohort_with_course
+    for i in range(5):
+        user = UserFactory(email=f"student{i}@example.com")
+        CohortMembershipFactory(cohort=cohort, user=user)
+    completed = TopicProgressFactory(
+        user=cohort.cohortmembership_set.get(user__email="student3@example.com").user,
+        topic=topics[0],
+    )
+    completed.complete_time = timezone.now()
+    completed.save()
+
+    action = ExportCourseProgressCsvAction(CohortCourseProgressPanel(cohort))
+    action.EXPORT_CHUNK_SIZE = 2
+    response = action.get_response(site_aware_request.get("/"), cohort)
+
+    rows = _read_csv(response)
+    assert response["Content-Type"] == "text/csv"
+    disposition = response["Content-Disposition"]
+    assert disposition == 'attachment; filename="spring-intake-intro-course.csv"'
+    assert rows[0] == [
+        "Student",
+        "Email",
+        "Progress %",
+        "Topic 0",
+        "Topic 0 deadline",
+        "Topic 1",
+        "Topic 1 deadline",
+    ]
+    assert [row[1] for row in rows[1:]] == [f"student{i}@example.com" for i in range(5)]
+    assert rows[4][3] == "Completed"
+    assert rows[1][3] == "Not started"
+
+
+@pytest.mark.django_db
+def test_export_reports_effective_deadline_and_overdue_status(
+    cohort_with_course, site_aware_request
+):
+    cohort, registration, topics = cohort_with_course
+    past = timezone.now() - timedelta(days=1)
+    future = timezone.now() + timedelta(days=3)
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=topics[0],
+        deadline=past,
+        is_hard_deadline=False,
+    )
+    late = UserFactory(email="late@example.com")
+    extended = UserFactory(email="extended@example.com")
+    CohortMembershipFactory(cohort=cohort, user=late)
+    CohortMembershipFactory(cohort=cohort, user=extended)
+    UserCohortDeadlineOverrideFactory(
+        cohort_course_registration=registration,
+        user=extended,
+        content_item=topics[0],
+        deadline=future,
+    )
+
+    action = ExportCourseProgressCsvAction(CohortCourseProgressPanel(cohort))
+    rows = _read_csv(action.get_response(site_aware_request.get("/"), cohort))
+
+    by_email = {row[1]: row for row in rows[1:]}
+    assert by_email["late@example.com"][3] == "Not started (overdue)"
+    assert by_email["late@example.com"][4] == past.isoformat()
+    assert by_email["extended@example.com"][3] == "Not started"
+    assert by_email["extended@example.com"][4] == future.isoformat()
+
+
+@pytest.mark.django_db
+def test_export_quotes_cells_spreadsheets_would_run_as_formulas(
+    cohort_with_course, site_aware_request
+):
+    cohort, _, topics = cohort_with_course
+    topics[0].title = "=SUM(A1:A2)"
+    topics[0].save()
+    user = UserFactory(
+        first_name='=HYPERLINK("http://evil")',
+        last_name="Smith",
+        email="-cmd@example.com",
+    )
+    CohortMembershipFactory(cohort=cohort, user=user)
+
+    action = ExportCourseProgressCsvAction(CohortCourseProgressPanel(cohort))
+    rows = _read_csv(action.get_response(site_aware_request.get("/"), cohort))
+
+    assert rows[0][3:5] == ["'=SUM(A1:A2)", "'=SUM(A1:A2) deadline"]
+    assert rows[1][:2] == ['\'=HYPERLINK("http://evil") Smith', "'-cmd@example.com"]
+
+
+@pytest.mark.django_db
+def test_export_requires_view_cohort_permission(cohort_with_course, site_aware_request):
+    cohort, _, _ = cohort_with_course
+    educator = UserFactory(staff=True)
+    request = site_aware_request.get("/")
+    request.user = educator
+    action = ExportCourseProgressCsvAction(CohortCourseProgressPanel(cohort))
+
+    assert not action.has_permission(request, cohort)
+    assign_perm("freedom_ls_student_management.view_cohort", educator, cohort)
+    assert action.has_permission(request, cohort)
+
+
+@pytest.mark.django_db
+def test_export_is_linked_from_panel_content_not_panel_actions(
+    cohort_with_course, site_aware_request
+):
+    cohort, registration, _ = cohort_with_course
+    educator = UserFactory(staff=True)
+    assign_perm("freedom_ls_student_management.view_cohort", educator, cohort)
+    request = site_aware_request.get("/")
+    request.user = educator
+
+    html = CohortCourseProgressPanel(cohort).render(request, base_url="/cohorts/x")
+
+    assert html.count("/cohorts/x/__actions/export_csv") == 1
+    assert f"/cohorts/x/__actions/export_csv?registration={registration.pk}" in html
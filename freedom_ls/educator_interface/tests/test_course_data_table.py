@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from freedom_ls.accounts.factories import UserFactory
+from freedom_ls.content_engine.factories import CourseFactory
+from freedom_ls.content_engine.models import Course
+from freedom_ls.educator_interface.views import CourseDataTable
+from freedom_ls.student_management.factories import (
+    CohortCourseRegistrationFactory,
+    CohortFactory,
+    CohortMembershipFactory,
+    UserCourseRegistrationFactory,
+)
+
+
+def _total_student_count(request, course: Course) -> int:
+    columns = CourseDataTable._prepare_columns()
+    page = CourseDataTable.get_rows(request, columns)
+    for row in page.object_list:
+        if row.pk == course.pk:
+            return int(row.total_student_count)
+    raise AssertionError("course not found in table rows")
+
+
+@pytest.mark.django_db
+def test_total_student_count_unions_direct_and_cohort_students(
+    mock_site_context, site_aware_request
+):
+    """A student registered directly and through a cohort is counted once."""
+    course = CourseFactory()
+    cohort = CohortFactory()
+    CohortCourseRegistrationFactory(cohort=cohort, collection=course)
+    both = UserFactory()
+    CohortMembershipFactory(cohort=cohort, user=both)
+    UserCourseRegistrationFactory(collection=course, user=both)
+    CohortMembershipFactory(cohort=cohort)
+    UserCourseRegistrationFactory(collection=course)
+
+    assert _total_student_count(site_aware_request.get("/"), course) == 3
+
+
+@pytest.mark.django_db
+def test_total_student_count_dedupes_students_across_cohorts(
+    mock_site_context, site_aware_request
+):
+    course = CourseFactory()
+    student = UserFactory()
+    for _ in range(2):
+        cohort = CohortFactory()
+        CohortCourseRegistrationFactory(cohort=cohort, collection=course)
+        CohortMembershipFactory(cohort=cohort, user=student)
+
+    assert _total_student_count(site_aware_request.get("/"), course) == 1
+
+
+@pytest.mark.django_db
+def test_total_student_count_ignores_inactive_registrations(
+    mock_site_context, site_aware_request
+):
+    course = CourseFactory()
+    inactive_cohort = CohortFactory()
+    CohortCourseRegistrationFactory(
+        cohort=inactive_cohort, collection=course, is_active=False
+    )
+    CohortMembershipFactory(cohort=inactive_cohort)
+    UserCourseRegistrationFactory(collection=course, is_active=False)
+    UserCourseRegistrationFactory(collection=course)
+
+    assert _total_student_count(site_aware_request.get("/"), course) == 1
+
+
+@pytest.mark.django_db
+def test_total_student_count_is_zero_without_students(
+    mock_site_context, site_aware_request
+):
+    course = CourseFactory()
+
+    assert _total_student_count(site_aware_request.get("/"), course) == 0
@@ -1,30 +1,29 @@
 from __future__ import annotations
 
+import csv
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from itertools import batched
 from typing import TypedDict
 from uuid import UUID
 
-from guardian.shortcuts import get_objects_for_user
-
 from django.contrib.auth.decorators import login_required
 from django.contrib.contenttypes.models import ContentType as DjangoContentType
 from django.core.paginator import Page, Paginator
 from django.db.models import (
     Count,
     F,
-    IntegerField,
     Model,
-    OuterRef,
+    OrderBy,
     Q,
     QuerySet,
-    Subquery,
-    Value,
 )
-from django.db.models.functions import Coalesce
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone as tz
+from django.utils.text import slugify
 
 from freedom_ls.accounts.models import User
 from freedom_ls.content_engine.models import Course, CoursePart, Form, Topic
@@ -33,13 +32,17 @@ from freedom_ls.educator_interface.forms import CohortForm
 from freedom_ls.panel_framework.actions import (
     CreateInstanceAction,
     DeleteAction,
+    DownloadAction,
     PanelAction,
 )
+from freedom_ls.panel_framework.pagination import KeysetPagination
 from freedom_ls.panel_framework.panels import (
     DataTablePanel,
     InstanceDetailsPanel,
     Panel,
 )
+from freedom_ls.panel_framework.permissions import has_object_perm
+from freedom_ls.panel_framework.search import TrigramSearch
 from freedom_ls.panel_framework.tables import DataTable
 from freedom_ls.panel_framework.tabs import Tab
 from freedom_ls.panel_framework.views import (
@@ -47,6 +50,7 @@ from freedom_ls.panel_framework.views import (
     ListViewConfig,
     panel_framework_view,
 )
+from freedom_ls.role_based_permissions.access import get_objects_for_user_cached
 from freedom_ls.student_management.models import (
     Cohort,
     CohortCourseRegistration,
@@ -55,11 +59,16 @@ from freedom_ls.student_management.models import (
     UserCohortDeadlineOverride,
     UserCourseRegistration,
 )
+from freedom_ls.student_management.queries import active_student_count_expression
 from freedom_ls.student_progress.models import (
-    CourseProgress,
+    CohortProgressSummary,
     FormProgress,
     TopicProgress,
 )
+from freedom_ls.student_progress.summaries import (
+    ensure_cohort_progress_summaries,
+    overdue_q,
+)
 
 
 class FormProgressData(TypedDict):
@@ -79,20 +88,20 @@ class FormProgressData(TypedDict):
 
 
 class CohortDataTable(DataTable):
+    search_fields = ["name"]
+    search_strategy = TrigramSearch()
+
     @staticmethod
     def get_queryset(request: HttpRequest) -> QuerySet:
-        return (
-            get_objects_for_user(
-                request.user,
-                "view_cohort",
-                klass=Cohort,
-            )
+        queryset: QuerySet = (
+            get_objects_for_user_cached(request.user, "view_cohort", Cohort)
             .annotate(
                 student_count=Count("cohortmembership", distinct=True),
             )
             .prefetch_related("course_registrations__collection")
             .order_by("name")
         )
+        return queryset
 
     @staticmethod
     def get_columns() -> list[dict[str, object]]:
@@ -119,14 +128,14 @@ class CohortDataTable(DataTable):
 
 class UserDataTable(DataTable):
     search_fields = ["first_name", "last_name", "email"]
+    search_strategy = TrigramSearch()
+    pagination = KeysetPagination(count="capped")
 
     @staticmethod
     def get_queryset(request: HttpRequest) -> QuerySet:
         # Get cohorts user has access to
-        accessible_cohorts = get_objects_for_user(
-            request.user,
-            "view_cohort",
-            klass=Cohort,
+        accessible_cohorts = get_objects_for_user_cached(
+            request.user, "view_cohort", Cohort
         )
 
         # Get users from accessible cohorts
@@ -182,6 +191,8 @@ class UserDataTable(DataTable):
 
 
 class UserDetailsPanel(InstanceDetailsPanel):
+    cache_timeout = 300
+    cache_depends_on = (User,)
     fields = [
         "first_name",
         "last_name",
@@ -205,6 +216,8 @@ class UserInstanceView(InstanceView):
 
 
 class CohortDetailsPanel(InstanceDetailsPanel):
+    cache_timeout = 300
+    cache_depends_on = (Cohort,)
     fields = ["name"]
     editable = True
     form_class = CohortForm
@@ -257,8 +270,27 @@ class CourseRegistrationsPanel(DataTablePanel):
         return {"cohort": self.instance}
 
 
+# Student orderings for the course progress grid, all served by the
+# (registration, column) indexes on CohortProgressSummary.
+STUDENT_SORTS: dict[str, tuple[str | OrderBy, ...]] = {
+    "progress": ("progress_percentage", "membership__user__email"),
+    "overdue": ("-overdue_count", "progress_percentage", "membership__user__email"),
+    "activity": (
+        F("last_activity").asc(nulls_first=True),
+        "membership__user__email",
+    ),
+}
+STUDENT_SORT_CHOICES = [
+    ("progress", "Least progress first"),
+    ("overdue", "Most overdue first"),
+    ("activity", "Least recently active first"),
+]
+DEFAULT_STUDENT_SORT = "progress"
+
+
 class CohortCourseProgressPanel(Panel):
     title = "Course Progress"
+    lazy = True
 
     COLUMN_PAGE_SIZE = 15
     STUDENT_PAGE_SIZE = 20
@@ -314,29 +346,36 @@ class CohortCourseProgressPanel(Panel):
 
         return visible_items, visible_parts, bool(part_children_map), col_page
 
+    def _student_summaries(
+        self,
+        selected_reg: CohortCourseRegistration,
+        sort: str = DEFAULT_STUDENT_SORT,
+        overdue_only: bool = False,
+    ) -> QuerySet[CohortProgressSummary]:
+        """Progress summaries of the cohort's students for the selected course.
+
+        Sorting and the overdue filter run on the summary table's indexed
+        columns; rows missing for older data are built first.
+        """
+        ensure_cohort_progress_summaries(selected_reg)
+        summaries = CohortProgressSummary.objects.filter(
+            cohort_course_registration=selected_reg
+        ).select_related("membership__user")
+        if overdue_only:
+            summaries = summaries.filter(overdue_q())
+        ordering = STUDENT_SORTS.get(sort, STUDENT_SORTS[DEFAULT_STUDENT_SORT])
+        return summaries.order_by(*ordering)
+
     def _paginate_students(
         self,
-        cohort: Cohort,
-        course: Course,
+        selected_reg: CohortCourseRegistration,
         page_num: int | str,
+        sort: str = DEFAULT_STUDENT_SORT,
+        overdue_only: bool = False,
     ) -> Page:
-        """Return a paginated page of cohort memberships annotated with progress."""
-        progress_subquery = Subquery(
-            CourseProgress.objects.filter(
-                user=OuterRef("user"),
-                course=course,
-            ).values("progress_percentage")[:1],
-            output_field=IntegerField(),
-        )
-
-        memberships = (
-            CohortMembership.objects.filter(cohort=cohort)
-            .select_related("user")
-            .annotate(progress=Coalesce(progress_subquery, Value(0)))
-            .order_by("progress", "user__email")
-        )
-
-        student_paginator = Paginator(memberships, self.STUDENT_PAGE_SIZE)
+        """Return a paginated page of the students' progress summaries."""
+        summaries = self._student_summaries(selected_reg, sort, overdue_only)
+        student_paginator = Paginator(summaries, self.STUDENT_PAGE_SIZE)
         return student_paginator.get_page(page_num)
 
     def _fetch_progress_maps(
@@ -386,7 +425,7 @@ class CohortCourseProgressPanel(Panel):
         self,
         selected_reg: CohortCourseRegistration,
         visible_items: list[Topic | Form],
-        student_page: Page,
+        memberships: Iterable[CohortMembership],
     ) -> tuple[
         CohortDeadline | None,
         dict[tuple[int, UUID | None], CohortDeadline],
@@ -426,7 +465,7 @@ class CohortCourseProgressPanel(Panel):
         student_override_map: dict[
             tuple[int, int | None, UUID | None], UserCohortDeadlineOverride
         ] = {}
-        user_ids = [m.user_id for m in student_page.object_list]
+        user_ids = [m.user_id for m in memberships]
         if user_ids:
             overrides = UserCohortDeadlineOverride.objects.filter(
                 cohort_course_registration=selected_reg,
@@ -561,8 +600,8 @@ class CohortCourseProgressPanel(Panel):
         """Build row data for each student on the current page."""
         now = tz.now()
         rows = []
-        for membership in student_page.object_list:
-            user = membership.user
+        for summary in student_page.object_list:
+            user = summary.membership.user
             cells = [
                 self._build_cell(
                     item,
@@ -589,7 +628,8 @@ class CohortCourseProgressPanel(Panel):
                         "educator_interface:interface",
                         kwargs={"path_string": f"users/{user.pk}"},
                     ),
-                    "progress": membership.progress,
+                    "progress": summary.progress_percentage,
+                    "overdue_count": summary.overdue_count,
                     "cells": cells,
                 }
             )
@@ -644,13 +684,19 @@ class CohortCourseProgressPanel(Panel):
             request.GET.get("col_page", 1),
         )
 
+        sort = request.GET.get("sort", DEFAULT_STUDENT_SORT)
+        if sort not in STUDENT_SORTS:
+            sort = DEFAULT_STUDENT_SORT
+        overdue_only = request.GET.get("overdue") == "1"
         student_page = self._paginate_students(
-            cohort,
-            course,
+            selected_reg,
             request.GET.get("page", 1),
+            sort=sort,
+            overdue_only=overdue_only,
         )
+        memberships = [summary.membership for summary in student_page.object_list]
 
-        visible_user_ids = [m.user.id for m in student_page.object_list]
+        visible_user_ids = [m.user_id for m in memberships]
 
         topic_progress_map, form_progress_map = self._fetch_progress_maps(
             visible_user_ids,
@@ -658,7 +704,7 @@ class CohortCourseProgressPanel(Panel):
         )
 
         course_deadline, deadline_map, student_override_map, topic_ct, form_ct = (
-            self._fetch_deadline_data(selected_reg, visible_items, student_page)
+            self._fetch_deadline_data(selected_reg, visible_items, memberships)
         )
 
         rows = self._build_rows(
@@ -690,11 +736,18 @@ class CohortCourseProgressPanel(Panel):
             "has_parts": has_parts,
             "col_page": col_page,
             "student_page": student_page,
+            "sort": sort,
+            "sort_choices": STUDENT_SORT_CHOICES,
+            "overdue_only": overdue_only,
             "rows": rows,
             "deadline_map": deadline_map,
             "topic_ct": topic_ct,
             "form_ct": form_ct,
             "base_url": base_url,
+            "export_url": (
+                f"{ExportCourseProgressCsvAction(self).get_download_url(base_url)}"
+                f"?registration={selected_reg.pk}"
+            ),
             "now": tz.now(),
         }
 
@@ -704,12 +757,175 @@ class CohortCourseProgressPanel(Panel):
             request=request,
         )
 
+    def get_actions(
+        self, request: HttpRequest, base_url: str = ""
+    ) -> list[PanelAction]:
+        return [ExportCourseProgressCsvAction(self)]
+
     def render(self, request, base_url: str = "", panel_name: str = "") -> str:
         if request.headers.get("HX-Target") == "course-progress-content":
             return self.get_content(request, base_url=base_url, panel_name=panel_name)
         return super().render(request, base_url=base_url, panel_name=panel_name)
 
 
+class _Echo:
+    """Pseudo-buffer for csv.writer: write() hands the line back to the caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+# Leading characters that make Excel and Sheets read a cell as a formula.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_text(value: str) -> str:
+    """Quote user-controlled text so spreadsheets show it rather than run it."""
+    return f"'{value}" if value.startswith(_FORMULA_PREFIXES) else value
+
+
+def _export_status(cell: dict[str, object]) -> str:
+    if cell["is_completed"]:
+        status = "Completed"
+    elif cell["is_started"]:
+        status = "In progress"
+    else:
+        status = "Not started"
+    if cell["is_hard_overdue"]:
+        return f"{status} (hard deadline missed)"
+    if cell["is_overdue"]:
+        return f"{status} (overdue)"
+    return status
+
+
+class ExportCourseProgressCsvAction(DownloadAction):
+    """Stream the full course progress grid of a cohort as CSV.
+
+    Students are read in chunks of ``EXPORT_CHUNK_SIZE``; progress and deadline
+    lookups are batched per chunk with the same helpers the panel uses for a
+    single page, so memory stays flat however large the cohort is.
+    """
+
+    label = "Export CSV"
+    action_name = "export_csv"
+    show_in_panel = False
+
+    EXPORT_CHUNK_SIZE = 200
+
+    def __init__(self, panel: CohortCourseProgressPanel):
+        self.panel = panel
+
+    def has_permission(
+        self, request: HttpRequest, instance: Model | None = None
+    ) -> bool:
+        return has_object_perm(
+            request, "freedom_ls_student_management.view_cohort", instance
+        )
+
+    def get_response(
+        self, request: HttpRequest, instance: Model | None = None
+    ) -> StreamingHttpResponse | HttpResponse:
+        if not isinstance(instance, Cohort):
+            raise TypeError(f"Expected Cohort instance, got {type(instance)}")
+        registrations = list(
+            CohortCourseRegistration.objects.filter(cohort=instance)
+            .select_related("collection")
+            .order_by("-is_active", "collection__title")
+        )
+        if not registrations:
+            return HttpResponse(status=404)
+        selected_reg = self.panel._get_selected_registration(
+            registrations, request.GET.get("registration")
+        )
+
+        response = StreamingHttpResponse(
+            self.iter_csv(instance, selected_reg), content_type="text/csv"
+        )
+        filename = slugify(f"{instance.name} {selected_reg.collection.title}")
+        response["Content-Disposition"] = (
+            f'attachment; filename="{filename or "course-progress"}.csv"'
+        )
+        return response
+
+    def iter_csv(
+        self, cohort: Cohort, selected_reg: CohortCourseRegistration
+    ) -> Iterator[str]:
+        """Yield the CSV one line at a time.
+
+        Everything request-dependent is resolved by the caller: the generator
+        runs after the view returns, once the site middleware has dropped the
+        current request. Every query below is scoped by cohort, user or item.
+        """
+        panel = self.panel
+        course: Course = selected_reg.collection
+        items = [
+            child
+            for child in course.children_flat()
+            if not isinstance(child, CoursePart)
+        ]
+
+        writer = csv.writer(_Echo())
+        header = ["Student", "Email", "Progress %"]
+        for item in items:
+            title = _csv_text(item.title)
+            header.append(title)
+            if isinstance(item, Form) and item.strategy == "QUIZ":
+                header.append(f"{title} score %")
+            header.append(f"{title} deadline")
+        yield writer.writerow(header)
+
+        now = tz.now()
+        summaries = panel._student_summaries(selected_reg).order_by(
+            "membership__user__email", "pk"
+        )
+        for chunk in batched(
+            summaries.iterator(chunk_size=self.EXPORT_CHUNK_SIZE),
+            self.EXPORT_CHUNK_SIZE,
+            strict=False,
+        ):
+            memberships = [summary.membership for summary in chunk]
+            topic_progress_map, form_progress_map = panel._fetch_progress_maps(
+                [m.user_id for m in memberships], items
+            )
+            _, deadline_map, student_override_map, topic_ct, form_ct = (
+                panel._fetch_deadline_data(selected_reg, items, memberships)
+            )
+            for summary in chunk:
+                user = summary.membership.user
+                row: list[object] = [
+                    _csv_text(
+                        " ".join(p for p in (user.first_name, user.last_name) if p)
+                    ),
+                    _csv_text(user.email),
+                    summary.progress_percentage,
+                ]
+                for item in items:
+                    cell = panel._build_cell(
+                        item,
+                        user,
+                        topic_ct,
+                        form_ct,
+                        topic_progress_map,
+                        form_progress_map,
+                        deadline_map,
+                        student_override_map,
+                        now,
+                    )
+                    row.append(_export_status(cell))
+                    if isinstance(item, Form) and item.strategy == "QUIZ":
+                        score = cell["quiz_percentage"]
+                        row.append("" if score is None else score)
+                    deadline = cell["effective_deadline"]
+                    row.append(
+                        deadline.deadline.isoformat()
+                        if isinstance(
+                            deadline, CohortDeadline | UserCohortDeadlineOverride
+                        )
+                        else ""
+                    )
+                yield writer.writerow(row)
+
+
 class CohortInstanceView(InstanceView):
     tabs = {
         "course_progress": Tab(
@@ -775,6 +991,10 @@ class UserConfig(ListViewConfig):
 
 
 class CourseDataTable(DataTable):
+    search_fields = ["title"]
+    search_strategy = TrigramSearch()
+    pagination = KeysetPagination(count="capped")
+
     @staticmethod
     def get_queryset(request: HttpRequest) -> QuerySet:
         qs: QuerySet = (
@@ -791,44 +1011,13 @@ class CourseDataTable(DataTable):
                     distinct=True,
                 ),
                 interest_count=Count("interests", distinct=True),
+                total_student_count=active_student_count_expression(),
             )
-            .prefetch_related(
-                "cohort_registrations__cohort__cohortmembership_set",
-                "user_registrations",
-            )
+            .prefetch_related("cohort_registrations__cohort")
             .order_by("title")
         )
         return qs
 
-    @staticmethod
-    def _annotate_total_student_count(page_obj: Page) -> None:
-        """Calculate total unique active users (direct + through cohorts) for each course.
-
-        Uses .all() instead of .filter() to leverage the prefetch cache and avoid N+1 queries.
-        """
-        for course in page_obj.object_list:
-            cohort_user_ids: set[UUID] = set()
-            for cohort_reg in course.cohort_registrations.all():
-                if not cohort_reg.is_active:
-                    continue
-                cohort_user_ids.update(
-                    m.user_id for m in cohort_reg.cohort.cohortmembership_set.all()
-                )
-
-            direct_user_ids = {
-                reg.user_id for reg in course.user_registrations.all() if reg.is_active
-            }
-
-            course.total_student_count = len(cohort_user_ids | direct_user_ids)
-
-    @classmethod
-    def get_rows(
-        cls, request: HttpRequest, columns: list[dict], filters: dict | None = None
-    ) -> Page:
-        page_obj = super().get_rows(request, columns, filters=filters)
-        cls._annotate_total_student_count(page_obj)
-        return page_obj
-
     @staticmethod
     def get_columns() -> list[dict[str, object]]:
         return [
@@ -871,6 +1060,8 @@ class CourseDataTable(DataTable):
 
 
 class CourseDetailsPanel(InstanceDetailsPanel):
+    cache_timeout = 300
+    cache_depends_on = (Course,)
     fields = ["title", "category"]
 
 
@@ -1035,7 +1226,7 @@ interface_config: dict[str, type[ListViewConfig]] = {
 
 
 @login_required
-def interface(request: HttpRequest, path_string: str = "") -> HttpResponse:
+def interface(request: HttpRequest, path_string: str = "") -> HttpResponseBase:
     return panel_framework_view(
         config=interface_config,
         request=request,
@@ -5,3 +5,7 @@ class MarkdownRenderingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "freedom_ls.markdown_rendering"
     label = "freedom_ls_markdown_rendering"
+
+    def ready(self) -> None:
+        # Register the renderer config invalidation receiver.
+        from . import signals  # noqa: F401
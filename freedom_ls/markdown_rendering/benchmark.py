@@ -0,0 +1,245 @@
+"""Benchmark harness for markdown rendering.
+
+Renders a corpus of markdown files (by default ``demo_content``) stage by
+stage, timing the markdown conversion, nh3 sanitising, the cotton compile,
+template parsing and template rendering separately, and then end to end
+through ``render_markdown``. A separate pass under ``tracemalloc`` records
+the peak memory each stage allocates. Both ``MARKDOWN_TEMPLATE_RENDER_ON``
+modes are measured.
+
+Results are plain JSON-able dicts, so a run can be saved as a baseline and
+later runs compared against it with ``compare_to_baseline``. Run it with
+``manage.py markdown_benchmark``.
+"""
+
+from __future__ import annotations
+
+import platform
+import posixpath
+import statistics
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import frontmatter
+import nh3
+
+from django.template import engines
+from django.test.utils import override_settings
+
+from freedom_ls.markdown_rendering.markdown_utils import (
+    _TEMPLATE_SYNTAX_RE,
+    _cotton_compiler,
+    _get_renderer_config,
+    compile_markdown,
+    render_markdown,
+    renderer_fingerprint,
+)
+
+STAGES = ("markdown", "nh3", "cotton", "template_parse", "template_render")
+MODES = {"template_render_on": True, "template_render_off": False}
+
+# Runs a stage: (stage name, function, *args, **kwargs) -> function result.
+StageRunner = Callable[..., Any]
+
+
+@dataclass
+class CorpusDocument:
+    """A markdown file of the corpus, standing in for the content instance.
+
+    Components resolve paths with ``calculate_path_from_root`` and, when
+    ``site_id`` is set, look files up in that site's asset manifest.
+    """
+
+    file_path: str
+    content: str
+    site_id: int | None = None
+
+    def calculate_path_from_root(self, other_relative_path: str) -> str:
+        return posixpath.normpath(
+            posixpath.join(posixpath.dirname(self.file_path), other_relative_path)
+        )
+
+
+def load_corpus(root: Path, site_id: int | None = None) -> list[CorpusDocument]:
+    """Read the body of every markdown file under ``root``."""
+    return [
+        CorpusDocument(
+            file_path=path.relative_to(root).as_posix(),
+            content=frontmatter.loads(path.read_text()).content,
+            site_id=site_id,
+        )
+        for path in sorted(root.rglob("*.md"))
+    ]
+
+
+def _render_stages(
+    document: CorpusDocument, template_render_on: bool, run: StageRunner
+) -> object:
+    """Render ``document`` like ``compile_markdown`` then ``render_markdown``.
+
+    Each stage runs through ``run``, and nothing is cached.
+    """
+    renderer_config = _get_renderer_config()
+    with renderer_config.pool.converter() as md:
+        converted = run("markdown", md.convert, document.content)
+    html = run(
+        "nh3",
+        nh3.clean,
+        converted,
+        tags=renderer_config.allowed_tags,
+        attributes=renderer_config.attributes,
+    )
+    if not _TEMPLATE_SYNTAX_RE.search(html):
+        return html
+    source = run("cotton", _cotton_compiler.process, html)
+    if not template_render_on:
+        return html
+    template = run("template_parse", engines["django"].from_string, source)
+    return run("template_render", template.render, {"content_instance": document}, None)
+
+
+class _StageTimer:
+    def __init__(self) -> None:
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+
+    def __call__(self, stage: str, function: Callable[..., Any], *args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.seconds[stage] += perf_counter() - start
+
+
+class _StageAllocations:
+    def __init__(self) -> None:
+        self.peak_bytes = dict.fromkeys(STAGES, 0)
+
+    def __call__(self, stage: str, function: Callable[..., Any], *args, **kwargs):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak_bytes[stage] = max(self.peak_bytes[stage], peak - before)
+
+
+def _summary(seconds: list[float]) -> dict[str, float]:
+    return {
+        "min_ms": round(min(seconds) * 1000, 3),
+        "median_ms": round(statistics.median(seconds) * 1000, 3),
+    }
+
+
+def _benchmark_mode(
+    documents: list[CorpusDocument], template_render_on: bool, iterations: int
+) -> dict[str, Any]:
+    stage_runs: list[dict[str, float]] = []
+    render_runs: list[float] = []
+    # The first round warms the converter pool and template loaders.
+    for _ in range(iterations + 1):
+        timer = _StageTimer()
+        for document in documents:
+            _render_stages(document, template_render_on, timer)
+        stage_runs.append(timer.seconds)
+
+        start = perf_counter()
+        for document in documents:
+            render_markdown(
+                document.content,
+                None,
+                context={"content_instance": document},
+                compiled=compile_markdown(document.content),
+            )
+        render_runs.append(perf_counter() - start)
+
+    allocations = _StageAllocations()
+    tracemalloc.start()
+    try:
+        for document in documents:
+            _render_stages(document, template_render_on, allocations)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "stages": {
+            stage: _summary([run[stage] for run in stage_runs[1:]]) for stage in STAGES
+        },
+        "render_markdown": _summary(render_runs[1:]),
+        "peak_kib": {
+            stage: round(peak / 1024, 1)
+            for stage, peak in allocations.peak_bytes.items()
+        },
+    }
+
+
+def run_benchmark(
+    documents: list[CorpusDocument], iterations: int = 5
+) -> dict[str, Any]:
+    """Time and profile rendering ``documents`` in both template modes.
+
+    Timings are totals over the corpus: the fastest and the median of
+    ``iterations`` rounds.
+    """
+    results: dict[str, Any] = {
+        "renderer": renderer_fingerprint(),
+        "python": platform.python_version(),
+        "documents": len(documents),
+        "bytes": sum(len(document.content.encode()) for document in documents),
+        "iterations": iterations,
+        "modes": {},
+    }
+    for mode, template_render_on in MODES.items():
+        with override_settings(MARKDOWN_TEMPLATE_RENDER_ON=template_render_on):
+            results["modes"][mode] = _benchmark_mode(
+                documents, template_render_on, iterations
+            )
+    return results
+
+
+def compare_to_baseline(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2
+) -> list[str]:
+    """Describe every timing or peak allocation that regressed.
+
+    A value regressed when it is more than ``tolerance`` (a fraction) above
+    the baseline's. Values the baseline lacks are skipped.
+    """
+    regressions = []
+    for mode, measured in results["modes"].items():
+        reference = baseline.get("modes", {}).get(mode)
+        if reference is None:
+            continue
+        pairs = [
+            (
+                f"{stage} min_ms",
+                measured["stages"][stage]["min_ms"],
+                reference.get("stages", {}).get(stage, {}).get("min_ms"),
+            )
+            for stage in STAGES
+        ]
+        pairs.append(
+            (
+                "render_markdown min_ms",
+                measured["render_markdown"]["min_ms"],
+                reference.get("render_markdown", {}).get("min_ms"),
+            )
+        )
+        pairs.extend(
+            (
+                f"{stage} peak_kib",
+                measured["peak_kib"][stage],
+                reference.get("peak_kib", {}).get(stage),
+            )
+            for stage in STAGES
+        )
+        for name, value, reference_value in pairs:
+            if reference_value and value > reference_value * (1 + tolerance):
+                regressions.append(
+                    f"{mode}: {name} {value} > baseline {reference_value}"
+                )
+    return regressions
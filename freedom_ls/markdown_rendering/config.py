@@ -6,10 +6,14 @@ from freedom_ls.base.app_settings import AppSettings, Setting
 class MarkdownRenderingConfig(AppSettings):
     MARKDOWN_ALLOWED_TAGS: dict[str, set[str]]
     MARKDOWN_TEMPLATE_RENDER_ON: bool
+    MARKDOWN_CACHE_TIMEOUT: int | None
 
     declared_settings = {
         "MARKDOWN_ALLOWED_TAGS": Setting(default={}),
         "MARKDOWN_TEMPLATE_RENDER_ON": Setting(default=True),
+        # Seconds to keep sanitised HTML in the Django cache. Keys include the
+        # source and renderer config hashes, so entries never go stale.
+        "MARKDOWN_CACHE_TIMEOUT": Setting(default=60 * 60 * 24 * 7),
     }
 
 
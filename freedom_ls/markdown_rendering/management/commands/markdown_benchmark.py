@@ -0,0 +1,82 @@
+"""Benchmark markdown rendering over a content corpus.
+
+    manage.py markdown_benchmark demo_content --output baseline.json
+    manage.py markdown_benchmark demo_content --baseline baseline.json
+
+With ``--site`` the corpus renders against that site's imported files, so
+components resolve as they do in production; without it they render their
+"not found" fallbacks. Exits non-zero when ``--baseline`` is given and a
+timing or allocation regressed by more than ``--tolerance``.
+"""
+
+import json
+from contextlib import nullcontext
+from pathlib import Path
+
+import djclick as click
+
+from django.contrib.sites.models import Site
+
+from freedom_ls.markdown_rendering.benchmark import (
+    STAGES,
+    compare_to_baseline,
+    load_corpus,
+    run_benchmark,
+)
+from freedom_ls.site_aware_models.models import site_context
+
+
+@click.command()
+@click.argument("path", default="demo_content")
+@click.option("--iterations", default=5, show_default=True)
+@click.option("--site", "site_name", default=None, help="Resolve files for this site.")
+@click.option("--output", default=None, help="Write the results to this JSON file.")
+@click.option("--baseline", default=None, help="Compare against this JSON file.")
+@click.option(
+    "--tolerance",
+    default=0.2,
+    show_default=True,
+    help="Allowed slowdown over the baseline, as a fraction.",
+)
+def command(path, iterations, site_name, output, baseline, tolerance):
+    """Time each markdown rendering stage over the markdown files under PATH."""
+    site = Site.objects.get(name=site_name) if site_name else None
+    documents = load_corpus(Path(path), site_id=site.pk if site else None)
+    if not documents:
+        raise click.ClickException(f"No markdown files found under {path}")
+
+    with site_context(site) if site else nullcontext():
+        results = run_benchmark(documents, iterations=iterations)
+
+    click.echo(
+        f"{results['documents']} document(s), {results['bytes']} bytes, "
+        f"best of {iterations}"
+    )
+    for mode, measured in results["modes"].items():
+        click.echo(f"\n{mode}")
+        for stage in STAGES:
+            timing = measured["stages"][stage]
+            click.echo(
+                f"  {stage:<16} {timing['min_ms']:>10.3f} ms "
+                f"(median {timing['median_ms']:.3f}) "
+                f"peak {measured['peak_kib'][stage]:.1f} KiB"
+            )
+        timing = measured["render_markdown"]
+        click.echo(
+            f"  {'render_markdown':<16} {timing['min_ms']:>10.3f} ms "
+            f"(median {timing['median_ms']:.3f})"
+        )
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2) + "\n")
+        click.echo(f"\nWrote {output}")
+
+    if baseline:
+        regressions = compare_to_baseline(
+            results, json.loads(Path(baseline).read_text()), tolerance
+        )
+        if regressions:
+            raise click.ClickException(
+                "Regressions against the baseline:\n" + "\n".join(regressions)
+            )
+        click.echo(f"\nNo regressions against {baseline}")
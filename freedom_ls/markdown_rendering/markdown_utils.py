@@ -1,73 +1,308 @@
-from copy import deepcopy
+"""Markdown to HTML rendering.
+
+Rendering runs in two phases:
+
+1. ``compile_markdown``: markdown conversion, nh3 sanitising and, when the
+   result contains cotton components or template tags, the cotton compile to
+   Django template source. The output depends only on the source text and the
+   renderer configuration, so it is cached in the Django cache under
+   ``markdown_cache_key`` and stored on content rows by ``content_save`` (see
+   ``MarkdownContent.prerender``).
+2. ``render_markdown``: the template pass. Components look up files and
+   generate element ids per render, so this pass runs per request, on a
+   ``Template`` parsed once per process by ``get_markdown_template``. Content
+   without template syntax skips it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from importlib.metadata import version
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING
 
 import markdown
 import nh3
 from django_cotton.compiler_regex import CottonCompiler
 
+from django.core.cache import cache as django_cache
 from django.template import engines
 from django.utils.safestring import mark_safe
 
 from freedom_ls.markdown_rendering.config import config
+from freedom_ls.site_aware_models.models import get_context_site
 
-_cotton_compiler = CottonCompiler()
+if TYPE_CHECKING:
+    from django.template.backends.base import _EngineTemplate
+
+CACHE_PREFIX = "markdown_rendering:html"
+
+# Bump when a change to this module alters the HTML or template source
+# produced for the same input, so cached and stored renders are not reused.
+RENDERER_VERSION = 2
 
+MARKDOWN_EXTENSIONS = [
+    "fenced_code",
+    "mdx_headdown",
+    "tables",
+    # Renders GitHub-style `- [ ]` / `- [x]` task lists as read-only
+    # (disabled) checkbox inputs. Powers the `checklist` admonition.
+    "pymdownx.tasklist",
+]
 
-def render_markdown(markdown_text, request, context=None):
-    context = context or {}
+# Cotton tags and Django template syntax; HTML without them renders verbatim.
+_TEMPLATE_SYNTAX_RE = re.compile(r"<c-|\{[{%#]")
 
-    md = markdown.Markdown(
-        extensions=[
-            "fenced_code",
-            "mdx_headdown",
-            "tables",
-            # Renders GitHub-style `- [ ]` / `- [x]` task lists as read-only
-            # (disabled) checkbox inputs. Powers the `checklist` admonition.
-            "pymdownx.tasklist",
-        ]
+# Parsed templates kept per process; see get_markdown_template.
+TEMPLATE_CACHE_SIZE = 1024
+
+# Line-level syntax tracked by split_markdown_sections.
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_COMPONENT_OPEN_RE = re.compile(r"<c-[\w.-]+(?:\s[^>]*)?(?<!/)>")
+_COMPONENT_CLOSE_RE = re.compile(r"</c-[\w.-]+\s*>")
+
+_cotton_compiler = CottonCompiler()
+
+
+@cache
+def _package_versions() -> tuple[str, ...]:
+    return tuple(
+        version(name)
+        for name in ("markdown", "nh3", "pymdown-extensions", "django-cotton")
     )
-    md.parser.blockprocessors.deregister("code")  # Disable indented code blocks
 
-    for key in config.MARKDOWN_ALLOWED_TAGS:
-        md.block_level_elements.append(key)
 
-    rendered_content = md.convert(markdown_text)
+class _ConverterPool:
+    """Reusable ``markdown.Markdown`` instances for one renderer config.
 
-    # now clean it
+    Loading the extensions is most of the cost of a short render, so
+    converters are built once, ``reset()`` after each use and handed out
+    again. A converter is used by one thread at a time; the pool grows to the
+    number of concurrent renders.
+    """
 
-    allowed_attribute_tags = config.MARKDOWN_ALLOWED_TAGS
+    def __init__(self, block_level_elements: tuple[str, ...]) -> None:
+        self._block_level_elements = block_level_elements
+        self._idle: SimpleQueue[markdown.Markdown] = SimpleQueue()
 
-    allowed_tags = deepcopy(nh3.ALLOWED_TAGS)
-    allowed_tags.update(allowed_attribute_tags.keys())
+    def _build(self) -> markdown.Markdown:
+        md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        md.parser.blockprocessors.deregister("code")  # Disable indented code blocks
+        md.block_level_elements.extend(self._block_level_elements)
+        return md
 
-    attributes = deepcopy(nh3.ALLOWED_ATTRIBUTES)
-    for k, v in allowed_attribute_tags.items():
-        attributes[k] = v
+    @contextmanager
+    def converter(self) -> Iterator[markdown.Markdown]:
+        try:
+            md = self._idle.get_nowait()
+        except Empty:
+            md = self._build()
+        try:
+            yield md
+        finally:
+            md.reset()
+            self._idle.put(md)
 
+
+@dataclass(frozen=True)
+class _RendererConfig:
+    """Everything derived from ``MARKDOWN_ALLOWED_TAGS``, computed once."""
+
+    fingerprint: str
+    allowed_tags: frozenset[str]
+    attributes: dict[str, frozenset[str]]
+    pool: _ConverterPool
+
+
+_renderer_config: _RendererConfig | None = None
+
+
+def _build_renderer_config() -> _RendererConfig:
+    allowed_attribute_tags = config.MARKDOWN_ALLOWED_TAGS
+    spec = {
+        "renderer": RENDERER_VERSION,
+        "packages": _package_versions(),
+        "extensions": MARKDOWN_EXTENSIONS,
+        "allowed_tags": {
+            tag: sorted(attributes)
+            for tag, attributes in allowed_attribute_tags.items()
+        },
+    }
+
+    attributes = {
+        tag: frozenset(values) for tag, values in nh3.ALLOWED_ATTRIBUTES.items()
+    }
+    attributes.update(
+        (tag, frozenset(values)) for tag, values in allowed_attribute_tags.items()
+    )
     # Permit the read-only checkbox markup emitted by pymdownx.tasklist. The
     # checkboxes are always rendered `disabled`, so they carry no interactive
     # capability; allowing the tag through lets `- [ ]` task lists survive
     # sanitising. The `class` hooks let the frontend style the list.
-    allowed_tags.add("input")
-    attributes["input"] = {"type", "checked", "disabled", "class"}
-    attributes["li"] = {"class"}
-    attributes["ul"] = {"class"}
+    attributes["input"] = frozenset({"type", "checked", "disabled", "class"})
+    attributes["li"] = frozenset({"class"})
+    attributes["ul"] = frozenset({"class"})
+
+    return _RendererConfig(
+        fingerprint=hashlib.sha256(
+            json.dumps(spec, sort_keys=True).encode()
+        ).hexdigest(),
+        allowed_tags=frozenset(
+            nh3.ALLOWED_TAGS | allowed_attribute_tags.keys() | {"input"}
+        ),
+        attributes=attributes,
+        pool=_ConverterPool(tuple(allowed_attribute_tags)),
+    )
+
+
+def _get_renderer_config() -> _RendererConfig:
+    global _renderer_config
+    renderer_config = _renderer_config
+    if renderer_config is None:
+        renderer_config = _renderer_config = _build_renderer_config()
+    return renderer_config
 
-    rendered_content = nh3.clean(
-        rendered_content, tags=allowed_tags, attributes=attributes
+
+def clear_renderer_config(**kwargs: object) -> None:
+    """Drop the derived config and pooled converters, e.g. after a settings change.
+
+    Accepts signal kwargs so it can be used as a receiver.
+    """
+    global _renderer_config
+    _renderer_config = None
+
+
+def renderer_fingerprint() -> str:
+    """Hash of everything besides the source text that shapes the HTML."""
+    return _get_renderer_config().fingerprint
+
+
+def markdown_digest(markdown_text: str) -> str:
+    """Identify the sanitised HTML for ``markdown_text`` under this renderer."""
+    digest = hashlib.sha256(renderer_fingerprint().encode())
+    digest.update(markdown_text.encode())
+    return digest.hexdigest()
+
+
+def markdown_cache_key(markdown_text: str) -> str:
+    """Cache key for ``markdown_text``, scoped to the current site."""
+    site = get_context_site()
+    site_part = "-" if site is None else str(site.pk)
+    return f"{CACHE_PREFIX}:{site_part}:{markdown_digest(markdown_text)}"
+
+
+def markdown_to_html(markdown_text: str) -> str:
+    """Convert markdown to sanitised HTML, without the template pass."""
+    renderer_config = _get_renderer_config()
+    with renderer_config.pool.converter() as md:
+        rendered_content = md.convert(markdown_text)
+    return nh3.clean(
+        rendered_content,
+        tags=renderer_config.allowed_tags,
+        attributes=renderer_config.attributes,
     )
 
-    # do the cotton rendering
 
-    if config.MARKDOWN_TEMPLATE_RENDER_ON:
+@dataclass(frozen=True)
+class CompiledMarkdown:
+    """The request-independent result of rendering markdown.
+
+    ``template_source`` is ``html`` with cotton tags compiled to template
+    tags, or empty when ``html`` has no component or template syntax and so
+    renders verbatim.
+    """
+
+    html: str
+    template_source: str
+
+
+def compile_markdown(markdown_text: str) -> CompiledMarkdown:
+    """Run everything in rendering that does not depend on the request."""
+    html = markdown_to_html(markdown_text)
+    template_source = ""
+    if _TEMPLATE_SYNTAX_RE.search(html):
         # Cotton's loader normally compiles `<c-foo>` to `{% cotton foo %}` when
         # reading templates from disk. Since we're rendering from a string we
         # have to invoke the compiler directly before handing the source to the
         # template engine.
-        compiled = _cotton_compiler.process(rendered_content)
-        template = engines["django"].from_string(compiled)
-        content = template.render(context, request)
+        template_source = _cotton_compiler.process(html)
+    return CompiledMarkdown(html=html, template_source=template_source)
+
+
+def get_compiled_markdown(markdown_text: str) -> CompiledMarkdown:
+    """``compile_markdown`` through the Django cache."""
+    key = markdown_cache_key(markdown_text)
+    compiled: CompiledMarkdown | None = django_cache.get(key)
+    if compiled is None:
+        compiled = compile_markdown(markdown_text)
+        django_cache.set(key, compiled, config.MARKDOWN_CACHE_TIMEOUT)
+    return compiled
+
+
+def split_markdown_sections(markdown_text: str) -> list[str]:
+    """Split markdown before each top-level (``# ``) heading.
+
+    Headings inside fenced code blocks or inside a component are not split
+    on, so each section renders on its own the way it renders within the
+    whole text. Markdown that refers across sections, such as a
+    reference-style link defined in another section, is the exception.
+    """
+    sections: list[str] = []
+    current: list[str] = []
+    fence = ""
+    depth = 0
+    for line in markdown_text.splitlines(keepends=True):
+        if not fence and depth == 0 and line.startswith("# ") and current:
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+        fence_match = _FENCE_RE.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if not fence:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence):
+                fence = ""
+        elif not fence:
+            depth += len(_COMPONENT_OPEN_RE.findall(line))
+            depth = max(depth - len(_COMPONENT_CLOSE_RE.findall(line)), 0)
+    if current:
+        sections.append("".join(current))
+    return sections
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def get_markdown_template(template_source: str) -> _EngineTemplate:
+    """Parse ``template_source`` once per process.
+
+    Template objects hold no per-render state, so one instance is safely
+    rendered by many threads.
+    """
+    return engines["django"].from_string(template_source)
+
+
+def render_markdown(markdown_text, request, context=None, compiled=None):
+    """Render markdown to safe HTML.
+
+    ``compiled`` is the ``CompiledMarkdown`` for ``markdown_text`` when the
+    caller already has it (e.g. stored at import time); otherwise it comes
+    from the cache. Only the template pass runs here, and only when the
+    content needs one.
+    """
+    if compiled is None:
+        compiled = get_compiled_markdown(markdown_text)
+
+    if config.MARKDOWN_TEMPLATE_RENDER_ON and compiled.template_source:
+        template = get_markdown_template(compiled.template_source)
+        content = template.render(context or {}, request)
     else:
         # Safe: content is sanitized by nh3.clean() above with strict allowlist
-        content = mark_safe(rendered_content)  # noqa: S308  # nosec B308 B703
+        content = mark_safe(compiled.html)  # noqa: S308  # nosec B308 B703
 
     return content
@@ -0,0 +1,14 @@
+"""Rebuild the derived renderer config when markdown settings change."""
+
+from __future__ import annotations
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .markdown_utils import clear_renderer_config
+
+
+@receiver(setting_changed)
+def markdown_setting_changed(setting: str, **kwargs) -> None:
+    if setting == "MARKDOWN_ALLOWED_TAGS":
+        clear_renderer_config()
@@ -0,0 +1,96 @@
+"""Tests for the markdown rendering benchmark harness."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click import ClickException
+
+from django.core.management import call_command
+
+from freedom_ls.markdown_rendering.benchmark import (
+    STAGES,
+    compare_to_baseline,
+    load_corpus,
+    run_benchmark,
+)
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    (tmp_path / "course").mkdir()
+    (tmp_path / "course" / "topic.md").write_text(
+        "---\ntitle: Topic\n---\n# Heading\n\nSome *text*.\n"
+    )
+    (tmp_path / "course" / "components.md").write_text(
+        '<c-youtube video_id="abc"></c-youtube>\n'
+    )
+    return tmp_path
+
+
+def test_load_corpus_reads_markdown_bodies(corpus: Path) -> None:
+    documents = load_corpus(corpus)
+
+    assert [document.file_path for document in documents] == [
+        "course/components.md",
+        "course/topic.md",
+    ]
+    assert documents[1].content.startswith("# Heading")
+    assert documents[1].calculate_path_from_root("../img/a.png") == "img/a.png"
+
+
+@pytest.mark.django_db
+def test_run_benchmark_times_every_stage_in_both_modes(corpus: Path) -> None:
+    results = run_benchmark(load_corpus(corpus), iterations=1)
+
+    on = results["modes"]["template_render_on"]
+    off = results["modes"]["template_render_off"]
+    assert set(on["stages"]) == set(STAGES)
+    assert on["stages"]["template_render"]["min_ms"] > 0
+    assert off["stages"]["template_render"]["min_ms"] == 0
+    assert on["peak_kib"]["markdown"] > 0
+    assert compare_to_baseline(results, results) == []
+
+
+def test_compare_to_baseline_reports_regressions() -> None:
+    def results(markdown_ms: float) -> dict:
+        stages = {stage: {"min_ms": 1.0} for stage in STAGES}
+        stages["markdown"] = {"min_ms": markdown_ms}
+        return {
+            "modes": {
+                "template_render_on": {
+                    "stages": stages,
+                    "render_markdown": {"min_ms": 5.0},
+                    "peak_kib": dict.fromkeys(STAGES, 1.0),
+                }
+            }
+        }
+
+    assert compare_to_baseline(results(1.1), results(1.0)) == []
+    assert compare_to_baseline(results(2.0), results(1.0)) == [
+        "template_render_on: markdown min_ms 2.0 > baseline 1.0"
+    ]
+
+
+@pytest.mark.django_db
+def test_command_writes_and_checks_a_baseline(corpus: Path, tmp_path: Path) -> None:
+    output = tmp_path / "baseline.json"
+    call_command(
+        "markdown_benchmark", str(corpus), "--iterations", "1", "--output", str(output)
+    )
+    baseline = json.loads(output.read_text())
+    assert baseline["documents"] == 2
+
+    # Any real timing regresses against a near-zero baseline.
+    for measured in baseline["modes"].values():
+        measured["render_markdown"]["min_ms"] = 0.000001
+    output.write_text(json.dumps(baseline))
+    with pytest.raises(ClickException, match="render_markdown"):
+        call_command(
+            "markdown_benchmark",
+            str(corpus),
+            "--iterations",
+            "1",
+            "--baseline",
+            str(output),
+        )
@@ -915,3 +915,159 @@ class TestInjectTableCaption:
         assert (
             result.index("<table") < result.index("<caption") < result.index("<thead")
         )
+
+
+@pytest.mark.django_db
+class TestRenderMarkdownCache:
+    """The request-independent pass is cached; the template pass runs only when needed."""
+
+    def test_second_render_reuses_cached_html(self, mock_request, mocker):
+        from freedom_ls.markdown_rendering import markdown_utils
+
+        spy = mocker.spy(markdown_utils, "markdown_to_html")
+        text = "# Cached\n\n<c-youtube video_id='abc'></c-youtube>"
+
+        first = render_markdown(text, mock_request)
+        second = render_markdown(text, mock_request)
+
+        assert spy.call_count == 1
+        assert first == second
+        assert "youtube.com/embed/abc" in second
+
+    def test_key_changes_with_renderer_config_and_site(self, mock_site_context):
+        from freedom_ls.accounts.factories import SiteFactory
+        from freedom_ls.markdown_rendering.markdown_utils import markdown_cache_key
+        from freedom_ls.site_aware_models.models import site_context
+
+        key = markdown_cache_key("text")
+        assert markdown_cache_key("text") == key
+        assert markdown_cache_key("other text") != key
+        with override_settings(MARKDOWN_ALLOWED_TAGS={"c-youtube": {"video_id"}}):
+            assert markdown_cache_key("text") != key
+        with site_context(SiteFactory(name="Other", domain="other.example.com")):
+            assert markdown_cache_key("text") != key
+
+    def test_plain_markdown_skips_template_pass(self, mock_request, mocker):
+        from freedom_ls.markdown_rendering import markdown_utils
+
+        spy = mocker.spy(markdown_utils._cotton_compiler, "process")
+
+        result = render_markdown("Just *text* & more", mock_request)
+
+        assert isinstance(result, SafeString)
+        assert result == "<p>Just <em>text</em> &amp; more</p>"
+        assert spy.call_count == 0
+
+    def test_given_compiled_markdown_is_rendered_without_conversion(
+        self, mock_request, mocker
+    ):
+        from freedom_ls.markdown_rendering import markdown_utils
+
+        spy = mocker.spy(markdown_utils, "markdown_to_html")
+        compiled = markdown_utils.CompiledMarkdown(
+            html="<p>stored</p>", template_source=""
+        )
+
+        result = render_markdown("ignored", mock_request, compiled=compiled)
+
+        assert result == "<p>stored</p>"
+        assert spy.call_count == 0
+
+    def test_templates_are_parsed_once_per_source(self, mock_request):
+        from freedom_ls.markdown_rendering.markdown_utils import (
+            compile_markdown,
+            get_markdown_template,
+        )
+
+        text = '<c-youtube video_id="parse-once"></c-youtube>'
+        compiled = compile_markdown(text)
+        assert "{% cotton youtube" in compiled.template_source
+        get_markdown_template.cache_clear()
+
+        first = render_markdown(text, mock_request, compiled=compiled)
+        second = render_markdown(text, mock_request, compiled=compiled)
+
+        assert first == second
+        assert get_markdown_template.cache_info().misses == 1
+        assert get_markdown_template.cache_info().hits == 1
+
+
+class TestConverterPool:
+    """Converters are built once per renderer config and reused."""
+
+    def test_converters_are_reused(self, mocker):
+        from freedom_ls.markdown_rendering import markdown_utils
+
+        markdown_utils.clear_renderer_config()
+        spy = mocker.spy(markdown_utils._ConverterPool, "_build")
+
+        outputs = [markdown_utils.markdown_to_html(f"# Title {i}") for i in range(3)]
+
+        assert spy.call_count == 1
+        assert outputs == [f"<h2>Title {i}</h2>" for i in range(3)]
+
+    def test_converter_state_does_not_leak_between_uses(self):
+        from freedom_ls.markdown_rendering.markdown_utils import markdown_to_html
+
+        markdown_to_html("```\nfenced\n```\n\n<div>raw</div>")
+
+        assert markdown_to_html("plain") == "<p>plain</p>"
+
+    def test_allowed_tags_change_rebuilds_config(self):
+        from freedom_ls.markdown_rendering.markdown_utils import (
+            markdown_to_html,
+            renderer_fingerprint,
+        )
+
+        before = renderer_fingerprint()
+        with override_settings(MARKDOWN_ALLOWED_TAGS={"c-test": {"name"}}):
+            assert renderer_fingerprint() != before
+            assert 'c-test name="x"' in markdown_to_html('<c-test name="x"></c-test>')
+        assert renderer_fingerprint() == before
+
+    def test_concurrent_conversions(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from freedom_ls.markdown_rendering.markdown_utils import markdown_to_html
+
+        texts = [f"*item {i}*" for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(markdown_to_html, texts))
+
+        assert results == [f"<p><em>item {i}</em></p>" for i in range(200)]
+
+
+class TestSplitMarkdownSections:
+    """Long content is split before top-level headings for streaming."""
+
+    def test_splits_before_top_level_headings(self):
+        from freedom_ls.markdown_rendering.markdown_utils import (
+            split_markdown_sections,
+        )
+
+        text = "Intro\n\n# One\n\nBody\n\n## Sub\n\n# Two\n\nMore\n"
+
+        assert split_markdown_sections(text) == [
+            "Intro\n\n",
+            "# One\n\nBody\n\n## Sub\n\n",
+            "# Two\n\nMore\n",
+        ]
+
+    def test_does_not_split_inside_fences_or_components(self):
+        from freedom_ls.markdown_rendering.markdown_utils import (
+            split_markdown_sections,
+        )
+
+        text = (
+            "# One\n\n"
+            "```bash\n# a comment\n```\n\n"
+            '<c-admonition type="note">\n\n# Inside\n\n</c-admonition>\n\n'
+            '<c-picture src="a.png" />\n\n'
+            "# Two\n"
+        )
+
+        sections = split_markdown_sections(text)
+
+        assert len(sections) == 2
+        assert sections[1] == "# Two\n"
+        assert "".join(sections) == text
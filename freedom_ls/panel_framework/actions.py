@@ -6,13 +6,19 @@ from collections.abc import Callable
 from django import forms
 from django.db.models import Model
 from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
 from django.template.loader import render_to_string
 
+from freedom_ls.panel_framework.permissions import has_object_perm
+
 
 class PanelAction:
     label: str = ""
     variant: str = "primary"
     action_name: str = ""
+    # False for actions the panel links to from inside its own content, so the
+    # panel chrome does not render them a second time.
+    show_in_panel: bool = True
 
     def has_permission(
         self, request: HttpRequest, instance: Model | None = None
@@ -25,6 +31,12 @@ class PanelAction:
         """Process action submission. Override in subclasses."""
         raise NotImplementedError
 
+    def handle_get(
+        self, request: HttpRequest, instance: Model | None = None, base_url: str = ""
+    ) -> HttpResponseBase:
+        """Respond to a GET on the action URL. Renders the action by default."""
+        return HttpResponse(self.render(request, instance, base_url))
+
     def render(self, request: HttpRequest, context: object, base_url: str) -> str:
         """Render the action button HTML."""
         return render_to_string(
@@ -211,7 +223,7 @@ class EditAction(FormPanelAction):
         instance = instance or self._instance
         model_name = instance._meta.model_name
         app_label = instance._meta.app_label
-        return request.user.has_perm(f"{app_label}.change_{model_name}", instance)
+        return has_object_perm(request, f"{app_label}.change_{model_name}", instance)
 
 
 class DeleteAction(PanelAction):
@@ -271,4 +283,45 @@ class DeleteAction(PanelAction):
             return False
         model_name = instance._meta.model_name
         app_label = instance._meta.app_label
-        return request.user.has_perm(f"{app_label}.delete_{model_name}", instance)
+        return has_object_perm(request, f"{app_label}.delete_{model_name}", instance)
+
+
+class DownloadAction(PanelAction):
+    """Action whose GET returns a file download (e.g. a streamed CSV export).
+
+    Subclasses must define: label, action_name.
+    Subclasses must implement: get_response(request, instance).
+    """
+
+    variant: str = "secondary"
+
+    def get_download_url(self, base_url: str) -> str:
+        return f"{base_url}/__actions/{self.action_name}"
+
+    def get_response(
+        self, request: HttpRequest, instance: Model | None = None
+    ) -> HttpResponseBase:
+        """Build the download response. Override in subclasses."""
+        raise NotImplementedError
+
+    def handle_get(
+        self, request: HttpRequest, instance: Model | None = None, base_url: str = ""
+    ) -> HttpResponseBase:
+        return self.get_response(request, instance)
+
+    def handle_submit(
+        self, request: HttpRequest, instance: Model | None = None, base_url: str = ""
+    ) -> HttpResponse:
+        return HttpResponse(status=405)
+
+    def render(self, request: HttpRequest, context: object, base_url: str) -> str:
+        """Render a plain download link styled as a button."""
+        return render_to_string(
+            "panel_framework/partials/download_button.html",
+            {
+                "label": self.label,
+                "variant": self.variant,
+                "download_url": self.get_download_url(base_url),
+            },
+            request=request,
+        )
@@ -5,3 +5,8 @@ class PanelFrameworkConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "freedom_ls.panel_framework"
     label = "freedom_ls_panel_framework"
+
+    def ready(self) -> None:
+        from freedom_ls.panel_framework.caching import connect_signals
+
+        connect_signals()
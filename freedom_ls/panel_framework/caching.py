@@ -0,0 +1,166 @@
+"""Fragment caching for ``Panel`` and ``DataTable`` renders.
+
+Caching is opt-in per class: set ``cache_timeout`` (seconds) to cache the
+rendered HTML. The cache key is built from:
+
+- the class, the instance pk and its ``updated_at`` (when the model has one),
+- the query string, the ``HX-Target`` header and the panel's ``base_url``,
+- the requesting user, their active/superuser/staff flags and the CSRF
+  secret, so action forms embedded in the fragment keep a valid token,
+- a *generation* counter for every model the fragment depends on, plus the
+  generations of the permission and role assignment tables.
+
+A generation is a counter kept in the cache for each model. ``post_save``,
+``post_delete`` and ``m2m_changed`` bump the generation of a *watched* model
+(see ``watch_models``), which changes every key built from it, so stale
+fragments are never read again and simply expire. Generations are bumped once
+the write commits, so a request running meanwhile cannot cache the old HTML
+under the new generation. Receivers are connected per
+model so that saves of unrelated models pay nothing. Watched are the
+permission tables, the ``cache_depends_on`` of every cacheable class as it is
+defined, and the instance or queryset model of a fragment once it is first
+rendered. List the latter in ``cache_depends_on`` as well, so that every
+process watches it from startup. ``invalidate_fragments`` bumps generations by
+hand, e.g. after ``QuerySet.update()``, which sends no signals.
+
+Generations and fragments live in the default cache, so it must be shared by
+every process serving requests (``config/settings_prod.py`` uses the database
+cache). With a per-process cache such as ``LocMemCache``, a write handled by
+one worker leaves the other workers serving stale fragments until they expire.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Iterable
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpRequest
+
+CACHE_PREFIX = "panel_framework"
+
+
+def _generation_key(model: type[Model]) -> str:
+    return f"{CACHE_PREFIX}:gen:{model._meta.label_lower}"
+
+
+def _bump_generations(models: Iterable[type[Model]]) -> None:
+    for model in models:
+        key = _generation_key(model)
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr(); a fresh generation works too.
+            cache.set(key, 1, timeout=None)
+
+
+def invalidate_fragments(*models: type[Model]) -> None:
+    """Invalidate every cached fragment that depends on any of ``models``.
+
+    Inside a transaction, the fragments are invalidated when it commits.
+    """
+    transaction.on_commit(lambda: _bump_generations(models))
+
+
+def _permission_models() -> list[type[Model]]:
+    """Models whose changes can alter what a user is allowed to see or do."""
+    from guardian.models import GroupObjectPermission, UserObjectPermission
+
+    from freedom_ls.role_based_permissions.models import (
+        ObjectRoleAssignment,
+        SiteRoleAssignment,
+        SystemRoleAssignment,
+    )
+
+    user_model = get_user_model()
+    return [
+        UserObjectPermission,
+        GroupObjectPermission,
+        ObjectRoleAssignment,
+        SiteRoleAssignment,
+        SystemRoleAssignment,
+        user_model.groups.through,
+        user_model.user_permissions.through,
+        Group.permissions.through,
+    ]
+
+
+def fragment_cache_key(
+    name: str,
+    request: HttpRequest,
+    instance: Model | None = None,
+    depends_on: Iterable[type[Model]] = (),
+    extra: Iterable[object] = (),
+) -> str:
+    """Build the cache key for a fragment rendered for ``request``."""
+    models = list(depends_on) + _permission_models()
+    if instance is not None:
+        models.append(type(instance))
+    watch_models(*models)
+    generation_keys = [_generation_key(model) for model in models]
+    generations = cache.get_many(generation_keys)
+
+    user = request.user
+    parts: list[object] = [
+        name,
+        request.get_host(),
+        sorted(request.GET.lists()),
+        request.headers.get("HX-Target", ""),
+        user.pk,
+        user.is_active,
+        user.is_superuser,
+        user.is_staff,
+        request.META.get("CSRF_COOKIE", ""),
+        [generations.get(key, 0) for key in generation_keys],
+        *extra,
+    ]
+    if instance is not None:
+        parts += [instance.pk, getattr(instance, "updated_at", None)]
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+    return f"{CACHE_PREFIX}:fragment:{digest}"
+
+
+def _bump_sender(sender: type[Model], raw: bool = False, **kwargs: object) -> None:
+    if raw:
+        return
+    invalidate_fragments(sender)
+
+
+def _bump_m2m(sender: type[Model], action: str, **kwargs: object) -> None:
+    if action.startswith("post_"):
+        invalidate_fragments(sender)
+
+
+def cached_fragment(key: str, timeout: int, render: Callable[[], str]) -> str:
+    """Return the fragment cached under ``key``, rendering and caching it if absent."""
+    html = cache.get(key)
+    if not isinstance(html, str):
+        html = render()
+        cache.set(key, html, timeout)
+    return html
+
+
+_watched_models: set[type[Model]] = set()
+
+
+def watch_models(*models: type[Model]) -> None:
+    """Bump the generation of each of ``models`` whenever its rows change."""
+    for model in models:
+        if model in _watched_models:
+            continue
+        uid = f"panel_framework_fragment:{model._meta.label_lower}"
+        post_save.connect(_bump_sender, sender=model, dispatch_uid=uid)
+        post_delete.connect(_bump_sender, sender=model, dispatch_uid=uid)
+        m2m_changed.connect(_bump_m2m, sender=model, dispatch_uid=uid)
+        _watched_models.add(model)
+
+
+def connect_signals() -> None:
+    """Watch the permission tables, which every fragment key depends on."""
+    watch_models(*_permission_models())
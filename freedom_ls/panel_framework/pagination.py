@@ -0,0 +1,269 @@
+"""Pagination modes used by ``DataTable.get_rows``.
+
+``PageNumberPagination`` is Django's ``Paginator``: numbered pages backed by an
+exact ``COUNT(*)`` and ``OFFSET``. Both get slower the larger and more heavily
+annotated the queryset is, and ``OFFSET`` makes deep pages progressively
+slower.
+
+``KeysetPagination`` seeks from the last row of the previous page instead
+(``WHERE (sort, pk) > (:last_sort, :last_pk)``), so every page costs the same.
+It pairs with an optional cheap row count:
+
+- ``None``: no count at all.
+- ``"capped"``: count at most ``count_cap`` rows, then report "cap+".
+- ``"estimated"``: the planner's row estimate, which reads ``pg_class.reltuples``
+  and column statistics rather than scanning the table.
+- ``"exact"``: a full ``COUNT(*)``.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Literal
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest
+
+CountMode = Literal["exact", "capped", "estimated"]
+
+AFTER_PARAM = "after"
+BEFORE_PARAM = "before"
+
+
+class Pagination:
+    """Split a sorted queryset into the page shown by a DataTable."""
+
+    def paginate(
+        self, queryset: QuerySet, request: HttpRequest, page_size: int
+    ) -> Page | KeysetPage:
+        raise NotImplementedError
+
+
+class PageNumberPagination(Pagination):
+    """Numbered pages via Django's ``Paginator`` (exact count + OFFSET)."""
+
+    def paginate(
+        self, queryset: QuerySet, request: HttpRequest, page_size: int
+    ) -> Page:
+        paginator = Paginator(queryset, page_size)
+        return paginator.get_page(request.GET.get("page", 1))
+
+
+@dataclass
+class KeysetPage:
+    """One page of keyset-paginated rows.
+
+    Quacks like ``django.core.paginator.Page`` where the templates need it
+    (``object_list``, iteration, ``has_next``/``has_previous``) and exposes
+    opaque cursors instead of page numbers.
+    """
+
+    object_list: list
+    has_next: bool
+    has_previous: bool
+    next_cursor: str = ""
+    previous_cursor: str = ""
+    count: int | None = None
+    count_is_estimate: bool = False
+    count_is_capped: bool = False
+    is_keyset: bool = field(default=True, init=False)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __bool__(self) -> bool:
+        return bool(self.object_list)
+
+    def has_other_pages(self) -> bool:
+        return self.has_next or self.has_previous
+
+
+def encode_cursor(values: list[object]) -> str:
+    payload = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[object] | None:
+    """Decode a cursor, returning None for anything malformed."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    return values if isinstance(values, list) else None
+
+
+def _ordering_fields(queryset: QuerySet) -> list[tuple[str, bool]] | None:
+    """Return the queryset ordering as (field, descending) pairs with pk last.
+
+    The primary key is appended as a tie-breaker so the ordering is total,
+    which keyset pagination requires to avoid skipping or repeating rows.
+    Returns None when the ordering includes an expression, whose value can't
+    be read back from a row to build a cursor.
+    """
+    ordering: list[tuple[str, bool]] = []
+    for item in queryset.query.order_by or queryset.model._meta.ordering:
+        if not isinstance(item, str):
+            return None
+        descending = item.startswith("-")
+        name = item.lstrip("-")
+        ordering.append(("pk" if name == "id" else name, descending))
+    if not any(name == "pk" for name, _ in ordering):
+        ordering.append(("pk", False))
+    return ordering
+
+
+def _row_value(row: object, field_path: str) -> object:
+    value: object = row
+    for part in field_path.split("__"):
+        if value is None:
+            return None
+        value = getattr(value, part)
+    return value
+
+
+def _strictly_after(name: str, value: object, descending: bool) -> Q | None:
+    """Rows that sort strictly after ``value`` on one field.
+
+    Mirrors PostgreSQL's default NULL placement: NULLS LAST for ascending,
+    NULLS FIRST for descending.
+    """
+    if descending:
+        if value is None:
+            return Q(**{f"{name}__isnull": False})
+        return Q(**{f"{name}__lt": value})
+    if value is None:
+        return None
+    return Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
+
+
+def _equal(name: str, value: object) -> Q:
+    if value is None:
+        return Q(**{f"{name}__isnull": True})
+    return Q(**{name: value})
+
+
+def _seek_filter(ordering: list[tuple[str, bool]], values: list[object]) -> Q:
+    """Lexicographic "row sorts after cursor" filter for a multi-column ordering."""
+    seek = Q(pk__in=[])
+    prefix = Q()
+    for (name, descending), value in zip(ordering, values, strict=True):
+        after = _strictly_after(name, value, descending)
+        if after is not None:
+            seek |= prefix & after
+        prefix &= _equal(name, value)
+    return seek
+
+
+def _order_by(ordering: list[tuple[str, bool]]) -> list[str]:
+    return [f"-{name}" if descending else name for name, descending in ordering]
+
+
+@dataclass
+class KeysetPagination(Pagination):
+    """Seek pagination on the table's current ordering.
+
+    Sorting by a column in the DataTable changes ``order_by``, so the cursor
+    always follows whatever column the user sorted on (plus pk). Querysets
+    ordered by an expression fall back to ``PageNumberPagination``.
+    """
+
+    count: CountMode | None = "capped"
+    count_cap: int = 1000
+
+    def paginate(
+        self, queryset: QuerySet, request: HttpRequest, page_size: int
+    ) -> Page | KeysetPage:
+        ordering = _ordering_fields(queryset)
+        if ordering is None:
+            return PageNumberPagination().paginate(queryset, request, page_size)
+        after = decode_cursor(request.GET.get(AFTER_PARAM, ""))
+        before = decode_cursor(request.GET.get(BEFORE_PARAM, ""))
+        if after is not None and len(after) != len(ordering):
+            after = None
+        if before is not None and len(before) != len(ordering):
+            before = None
+
+        total, is_estimate, is_capped = self._count(queryset)
+
+        # Paging backwards walks the reversed ordering from the cursor, then
+        # flips the fetched rows back into display order.
+        page_qs = queryset.order_by(*_order_by(ordering))
+        try:
+            if before is not None and after is None:
+                reversed_ordering = [(name, not desc) for name, desc in ordering]
+                page_qs = queryset.filter(_seek_filter(reversed_ordering, before))
+                page_qs = page_qs.order_by(*_order_by(reversed_ordering))
+            elif after is not None:
+                page_qs = queryset.filter(_seek_filter(ordering, after))
+                page_qs = page_qs.order_by(*_order_by(ordering))
+        except (ValidationError, ValueError, TypeError):
+            # A tampered cursor whose values don't fit the fields: first page.
+            after = before = None
+        backwards = before is not None and after is None
+
+        rows = list(page_qs[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, after is not None
+
+        def cursor_for(row: object) -> str:
+            return encode_cursor([_row_value(row, name) for name, _ in ordering])
+
+        return KeysetPage(
+            object_list=rows,
+            has_next=has_next and bool(rows),
+            has_previous=has_previous and bool(rows),
+            next_cursor=cursor_for(rows[-1]) if rows else "",
+            previous_cursor=cursor_for(rows[0]) if rows else "",
+            count=total,
+            count_is_estimate=is_estimate,
+            count_is_capped=is_capped,
+        )
+
+    def _count(self, queryset: QuerySet) -> tuple[int | None, bool, bool]:
+        """Return (count, is_estimate, is_capped) according to ``self.count``."""
+        if self.count is None:
+            return None, False, False
+        if self.count == "exact":
+            return queryset.count(), False, False
+        if self.count == "estimated":
+            estimate = estimate_count(queryset)
+            if estimate is not None:
+                return estimate, True, False
+        capped = queryset.order_by().values("pk")[: self.count_cap + 1].count()
+        if capped > self.count_cap:
+            return self.count_cap, False, True
+        return capped, False, False
+
+
+def estimate_count(queryset: QuerySet) -> int | None:
+    """Planner row estimate for ``queryset``; None when unavailable.
+
+    For an unfiltered table this is ``pg_class.reltuples``; with filters the
+    planner scales it by column statistics. Only PostgreSQL is supported.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
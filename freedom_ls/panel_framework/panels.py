@@ -6,6 +6,12 @@ from django.db.models import Model
 from django.http import HttpRequest
 from django.template.loader import render_to_string
 
+from freedom_ls.panel_framework.caching import (
+    cached_fragment,
+    fragment_cache_key,
+    watch_models,
+)
+from freedom_ls.panel_framework.permissions import prefetch_object_permissions
 from freedom_ls.panel_framework.tables import DEFAULT_TABLE_ID, DataTable
 
 if TYPE_CHECKING:
@@ -14,6 +20,20 @@ if TYPE_CHECKING:
 
 class Panel:
     title: str = ""
+    # Seconds to cache the rendered panel for; None disables caching. The key
+    # covers the instance, query string and user (see panel_framework.caching).
+    cache_timeout: int | None = None
+    # Models whose changes invalidate the panel; include the instance's own.
+    cache_depends_on: tuple[type[Model], ...] = ()
+    # Lazy panels render as a placeholder that HTMX swaps for the panel, fetched
+    # from its own __panels URL once lazy_trigger fires ("load" or "revealed").
+    lazy: bool = False
+    lazy_trigger: str = "load"
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.cache_timeout is not None:
+            watch_models(*cls.cache_depends_on)
 
     def __init__(self, instance: Model):
         self.instance = instance
@@ -28,13 +48,58 @@ class Panel:
     ) -> str:
         raise NotImplementedError
 
+    def get_cache_key(
+        self, request: HttpRequest, base_url: str = "", panel_name: str = ""
+    ) -> str:
+        return fragment_cache_key(
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            request,
+            instance=self.instance,
+            depends_on=self.cache_depends_on,
+            extra=(base_url, panel_name),
+        )
+
     def render(
         self, request: HttpRequest, base_url: str = "", panel_name: str = ""
+    ) -> str:
+        if self.cache_timeout is None:
+            return self._render_container(request, base_url, panel_name)
+        key = self.get_cache_key(request, base_url=base_url, panel_name=panel_name)
+        return cached_fragment(
+            key,
+            self.cache_timeout,
+            lambda: self._render_container(request, base_url, panel_name),
+        )
+
+    def render_placeholder(
+        self, request: HttpRequest, base_url: str = "", panel_name: str = ""
+    ) -> str:
+        """Render the skeleton shown in place of a lazy panel; base_url loads it."""
+        return render_to_string(
+            "panel_framework/partials/panel_placeholder.html",
+            {
+                "title": self.title,
+                "panel_name": panel_name,
+                "load_url": base_url,
+                "trigger": self.lazy_trigger,
+            },
+            request=request,
+        )
+
+    def _render_container(
+        self, request: HttpRequest, base_url: str, panel_name: str
     ) -> str:
         content = self.get_content(request, base_url=base_url, panel_name=panel_name)
+        shown_actions = [
+            action
+            for action in self.get_actions(request, base_url)
+            if action.show_in_panel
+        ]
+        if shown_actions:
+            prefetch_object_permissions(request, [self.instance])
         actions = [
             action.render(request, self, base_url)
-            for action in self.get_actions(request, base_url)
+            for action in shown_actions
             if action.has_permission(request, self.instance)
         ]
         return render_to_string(
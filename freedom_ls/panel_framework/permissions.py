@@ -0,0 +1,99 @@
+"""Request-scoped object permission checks for panel actions.
+
+``request.user.has_perm(perm, obj)`` asks guardian's ``ObjectPermissionBackend``,
+which builds a fresh ``ObjectPermissionChecker`` (and runs its queries) on
+every call. A panel with an edit and a delete action, an instance view with its
+own actions and a table of rows would each repeat those queries.
+
+Instead, ``prefetch_object_permissions`` loads the user's and their groups'
+permissions for a batch of objects with guardian's ``prefetch_perms``, one
+query each, into a checker kept on the request's user.
+``PrefetchedObjectPermissionBackend`` takes guardian's place in
+``AUTHENTICATION_BACKENDS`` and answers prefetched objects from that checker,
+so ``has_object_perm`` still goes through ``user.has_perm`` and every other
+backend is consulted as usual. Objects that were not prefetched get guardian's
+usual per-call checker.
+
+Prefetched permissions are not re-read for the rest of the request, so a
+change made in between is not seen; callers prefetch right before rendering.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from guardian.backends import ObjectPermissionBackend
+from guardian.core import ObjectPermissionChecker
+
+from django.db.models import Model
+from django.http import HttpRequest
+
+_PREFETCH_ATTR = "_panel_permission_prefetch"
+
+
+class _Prefetched:
+    """A user's guardian checker and the objects prefetched into it."""
+
+    def __init__(self, user: Any) -> None:
+        self.checker = ObjectPermissionChecker(user)
+        self.keys: set[tuple] = set()
+
+    def covers(self, obj: Model) -> bool:
+        return self.checker.get_local_cache_key(obj) in self.keys
+
+
+def _get_prefetched(user: Any) -> _Prefetched | None:
+    prefetched: _Prefetched | None = getattr(user, _PREFETCH_ATTR, None)
+    return prefetched
+
+
+def _prefetched_for(user: Any) -> _Prefetched:
+    prefetched = _get_prefetched(user)
+    if prefetched is None:
+        prefetched = _Prefetched(user)
+        setattr(user, _PREFETCH_ATTR, prefetched)
+    return prefetched
+
+
+def get_permission_checker(request: HttpRequest) -> ObjectPermissionChecker:
+    """Return the guardian permission checker cached on ``request.user``."""
+    return _prefetched_for(request.user).checker
+
+
+def prefetch_object_permissions(request: HttpRequest, objects: Iterable[Model]) -> None:
+    """Load the permissions ``request.user`` has on ``objects`` in bulk.
+
+    Objects may be of mixed models; each model is prefetched separately.
+    Objects that were already prefetched are skipped.
+    """
+    user = request.user
+    if not user.is_authenticated or not user.is_active:
+        return
+    prefetched = _prefetched_for(user)
+    by_model: dict[type[Model], list[Model]] = defaultdict(list)
+    for obj in objects:
+        if obj.pk is not None and not prefetched.covers(obj):
+            by_model[type(obj)].append(obj)
+    for model_objects in by_model.values():
+        # Accepts any iterable of same-model objects despite its annotation.
+        prefetched.checker.prefetch_perms(model_objects)  # type: ignore[arg-type]
+        prefetched.keys.update(
+            prefetched.checker.get_local_cache_key(obj) for obj in model_objects
+        )
+
+
+def has_object_perm(request: HttpRequest, perm: str, obj: Model | None) -> bool:
+    """``request.user.has_perm(perm, obj)``, answered from the prefetch if possible."""
+    return request.user.has_perm(perm, obj)
+
+
+class PrefetchedObjectPermissionBackend(ObjectPermissionBackend):
+    """Guardian's backend, answering prefetched objects without a query."""
+
+    def has_perm(self, user_obj: Any, perm: str, obj: Model | None = None) -> bool:
+        prefetched = _get_prefetched(user_obj)
+        if obj is not None and prefetched is not None and prefetched.covers(obj):
+            return prefetched.checker.has_perm(perm, obj)
+        return super().has_perm(user_obj, perm, obj)
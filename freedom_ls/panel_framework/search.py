@@ -0,0 +1,59 @@
+"""Search strategies used by ``DataTable.get_rows``.
+
+A strategy turns the ``?search=`` query string and a table's ``search_fields``
+into a queryset filter. The strategy decides which SQL shape is emitted, and
+therefore which index the planner can use:
+
+- ``ContainsSearch``: ``UPPER(col::text) LIKE UPPER('%x%')`` — substring match.
+- ``PrefixSearch``: ``UPPER(col::text) LIKE UPPER('x%')`` — prefix match.
+- ``TrigramSearch``: substring match, for columns with a trigram index.
+
+All three are served by a ``pg_trgm`` GIN index over ``UPPER(col::text)``
+(see ``freedom_ls.base.indexes.trigram_index``). Without such an index every
+strategy degrades to a sequential scan.
+"""
+
+from __future__ import annotations
+
+from django.db.models import Q, QuerySet
+
+
+class SearchStrategy:
+    """Build the filter applied for a DataTable search query."""
+
+    def build_filter(self, search_fields: list[str], search_query: str) -> Q:
+        raise NotImplementedError
+
+    def apply(
+        self, queryset: QuerySet, search_fields: list[str], search_query: str
+    ) -> QuerySet:
+        if not search_query or not search_fields:
+            return queryset
+        return queryset.filter(self.build_filter(search_fields, search_query))
+
+
+class ContainsSearch(SearchStrategy):
+    """Case-insensitive substring match across all search fields."""
+
+    lookup = "icontains"
+
+    def build_filter(self, search_fields: list[str], search_query: str) -> Q:
+        search_filter = Q()
+        for field in search_fields:
+            search_filter |= Q(**{f"{field}__{self.lookup}": search_query})
+        return search_filter
+
+
+class PrefixSearch(ContainsSearch):
+    """Case-insensitive prefix match across all search fields."""
+
+    lookup = "istartswith"
+
+
+class TrigramSearch(ContainsSearch):
+    """Case-insensitive substring match for fields with a ``pg_trgm`` index.
+
+    pg_trgm only pulls trigrams out of a LIKE pattern whose literal part is
+    at least three characters long. Shorter queries still match anywhere in
+    the value, but the planner answers them with a full index scan.
+    """
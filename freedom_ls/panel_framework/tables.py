@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-from django.core.paginator import Page, Paginator
-from django.db.models import Q, QuerySet
+from django.core.paginator import Page
+from django.db.models import Model, QuerySet
 from django.http import HttpRequest
 from django.template.loader import render_to_string
 
+from freedom_ls.panel_framework.caching import (
+    cached_fragment,
+    fragment_cache_key,
+    watch_models,
+)
+from freedom_ls.panel_framework.pagination import (
+    KeysetPage,
+    PageNumberPagination,
+    Pagination,
+)
+from freedom_ls.panel_framework.permissions import prefetch_object_permissions
+from freedom_ls.panel_framework.search import ContainsSearch, SearchStrategy
+
 DEFAULT_TABLE_ID = "data-table-container"
 
 
@@ -13,6 +26,20 @@ class DataTable:
 
     page_size = 5
     search_fields: list[str] = []
+    search_strategy: SearchStrategy = ContainsSearch()
+    pagination: Pagination = PageNumberPagination()
+    # Seconds to cache the rendered table for; None disables caching.
+    cache_timeout: int | None = None
+    # Models whose changes invalidate the table; include the queryset's own.
+    cache_depends_on: tuple[type[Model], ...] = ()
+    # Load the user's object permissions for every row of the page in one
+    # batch, for cell templates that use the has_object_perm tag.
+    prefetch_row_permissions: bool = False
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.cache_timeout is not None:
+            watch_models(*cls.cache_depends_on)
 
     @staticmethod
     def get_queryset(request: HttpRequest) -> QuerySet:
@@ -36,17 +63,13 @@ class DataTable:
     @classmethod
     def get_rows(
         cls, request: HttpRequest, columns: list[dict], filters: dict | None = None
-    ) -> Page:
+    ) -> Page | KeysetPage:
         queryset = cls.get_queryset(request)
         if filters:
             queryset = queryset.filter(**filters)
 
         search_query = request.GET.get("search", "").strip()
-        if search_query and cls.search_fields:
-            search_filter = Q()
-            for field in cls.search_fields:
-                search_filter |= Q(**{f"{field}__icontains": search_query})
-            queryset = queryset.filter(search_filter)
+        queryset = cls.search_strategy.apply(queryset, cls.search_fields, search_query)
 
         sort_by = request.GET.get("sort", "")
         sort_order = request.GET.get("order", "asc")
@@ -55,11 +78,28 @@ class DataTable:
             order_expr = f"-{sort_by}" if sort_order == "desc" else sort_by
             queryset = queryset.order_by(order_expr)
 
-        page_number = request.GET.get("page", 1)
-        paginator = Paginator(queryset, cls.page_size)
-        page_obj = paginator.get_page(page_number)
+        return cls.pagination.paginate(queryset, request, cls.page_size)
 
-        return page_obj
+    @classmethod
+    def get_cache_key(
+        cls,
+        request: HttpRequest,
+        filters: dict | None = None,
+        base_url: str = "",
+        table_id: str = DEFAULT_TABLE_ID,
+    ) -> str:
+        model = cls.get_queryset(request).model
+        # Model instances repr by __str__, which need not be unique.
+        filter_items = sorted(
+            (name, value.pk if isinstance(value, Model) else value)
+            for name, value in (filters or {}).items()
+        )
+        return fragment_cache_key(
+            f"{cls.__module__}.{cls.__qualname__}",
+            request,
+            depends_on=(model, *cls.cache_depends_on),
+            extra=(filter_items, base_url, table_id),
+        )
 
     @classmethod
     def render(
@@ -68,12 +108,33 @@ class DataTable:
         filters: dict | None = None,
         base_url: str = "",
         table_id: str = DEFAULT_TABLE_ID,
+    ) -> str:
+        if cls.cache_timeout is None:
+            return cls._render_table(request, filters, base_url, table_id)
+        key = cls.get_cache_key(
+            request, filters=filters, base_url=base_url, table_id=table_id
+        )
+        return cached_fragment(
+            key,
+            cls.cache_timeout,
+            lambda: cls._render_table(request, filters, base_url, table_id),
+        )
+
+    @classmethod
+    def _render_table(
+        cls,
+        request: HttpRequest,
+        filters: dict | None,
+        base_url: str,
+        table_id: str,
     ) -> str:
         columns = cls._prepare_columns()
         sort_by = request.GET.get("sort", "")
         sort_order = request.GET.get("order", "asc")
         search_query = request.GET.get("search", "").strip()
         page_obj = cls.get_rows(request, columns, filters=filters)
+        if cls.prefetch_row_permissions:
+            prefetch_object_permissions(request, page_obj)
         context = {
             "columns": columns,
             "rows": page_obj,
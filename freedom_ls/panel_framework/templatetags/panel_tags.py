@@ -1,8 +1,11 @@
 import re
 
 from django import template
+from django.db.models import Model
 from django.urls import reverse
 
+from freedom_ls.panel_framework import permissions
+
 register = template.Library()
 
 
@@ -26,3 +29,14 @@ def resolve_url_path_template(obj: object, url_name: str, path_template: str) ->
 
     path_string = re.sub(r"\{(\w+(?:\.\w+)*)\}", replace_attr, path_template)
     return reverse(url_name, kwargs={"path_string": path_string})
+
+
+@register.simple_tag(takes_context=True)
+def has_object_perm(context: template.Context, perm: str, obj: Model) -> bool:
+    """Check an object permission through the request's cached permission checker.
+
+    Usage: {% has_object_perm "app_label.change_model" row as can_edit %}
+    Tables with ``prefetch_row_permissions`` load every row's permissions up
+    front, so this does not query per row.
+    """
+    return permissions.has_object_perm(context["request"], perm, obj)
@@ -0,0 +1,195 @@
+"""Tests for Panel / DataTable fragment caching."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+from guardian.shortcuts import assign_perm
+
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from freedom_ls.panel_framework import caching
+from freedom_ls.panel_framework.caching import invalidate_fragments
+from freedom_ls.panel_framework.panels import Panel
+from freedom_ls.role_based_permissions.factories import SystemRoleAssignmentFactory
+
+from .conftest import (
+    StubChild,
+    StubGrandchild,
+    StubModel,
+    _make_stub,
+    _make_stub_child,
+    make_staff_user,
+)
+from .stub_panels import StubDataTable
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Generator[None]:
+    """Drop fragments and generations cached by other tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class CountingPanel(Panel):
+    title = "Counting"
+    cache_timeout = 60
+    cache_depends_on = (StubChild,)
+
+    def __init__(self, instance):
+        super().__init__(instance)
+        self.calls = 0
+
+    def get_content(self, request, base_url="", panel_name=""):
+        self.calls += 1
+        return f"<p>{self.instance.name}</p>"
+
+
+class CachedStubDataTable(StubDataTable):
+    cache_timeout = 60
+
+
+def _request(user, path: str = "/"):
+    request = RequestFactory().get(path)
+    request.user = user
+    return request
+
+
+@pytest.mark.django_db
+def test_repeat_render_is_served_from_cache(mock_site_context) -> None:
+    panel = CountingPanel(_make_stub(name="first"))
+    user = make_staff_user()
+
+    html = panel.render(_request(user), base_url="/x", panel_name="p")
+    assert panel.render(_request(user), base_url="/x", panel_name="p") == html
+    assert panel.calls == 1
+
+
+@pytest.mark.django_db
+def test_key_varies_by_query_string_and_user(mock_site_context) -> None:
+    panel = CountingPanel(_make_stub())
+    user = make_staff_user()
+
+    panel.render(_request(user))
+    panel.render(_request(user, "/?page=2"))
+    panel.render(_request(make_staff_user()))
+
+    assert panel.calls == 3
+
+
+@pytest.mark.django_db
+def test_saving_instance_invalidates_panel(
+    mock_site_context, django_capture_on_commit_callbacks
+) -> None:
+    stub = _make_stub(name="before")
+    user = make_staff_user()
+    CountingPanel(stub).render(_request(user))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        stub.name = "after"
+        stub.save()
+    panel = CountingPanel(stub)
+
+    assert "after" in panel.render(_request(user))
+    assert panel.calls == 1
+
+
+@pytest.mark.django_db
+def test_dependency_and_permission_changes_invalidate_panel(
+    mock_site_context, django_capture_on_commit_callbacks
+) -> None:
+    stub = _make_stub()
+    user = make_staff_user()
+    panel = CountingPanel(stub)
+    panel.render(_request(user))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_fragments(StubChild)
+    panel.render(_request(user))
+    with django_capture_on_commit_callbacks(execute=True):
+        assign_perm("freedom_ls_panel_framework.change_stubmodel", user, stub)
+    panel.render(_request(user))
+    with django_capture_on_commit_callbacks(execute=True):
+        SystemRoleAssignmentFactory(user=user)
+    panel.render(_request(user))
+
+    assert panel.calls == 4
+
+
+@pytest.mark.django_db
+def test_generations_are_bumped_on_commit(
+    mock_site_context, django_capture_on_commit_callbacks
+) -> None:
+    panel = CountingPanel(_make_stub())
+    user = make_staff_user()
+    panel.render(_request(user))
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        invalidate_fragments(StubChild)
+        # A render before the commit must not cache under the new generation.
+        panel.render(_request(user))
+    assert panel.calls == 1
+
+    for callback in callbacks:
+        callback()
+    panel.render(_request(user))
+    assert panel.calls == 2
+
+
+@pytest.mark.django_db
+def test_deactivating_the_user_changes_the_key(mock_site_context) -> None:
+    panel = CountingPanel(_make_stub())
+    user = make_staff_user()
+    panel.render(_request(user))
+
+    user.is_active = False
+    panel.render(_request(user))
+
+    assert panel.calls == 2
+
+
+@pytest.mark.django_db
+def test_cached_data_table_skips_queries_until_rows_change(
+    mock_site_context, django_assert_num_queries, django_capture_on_commit_callbacks
+) -> None:
+    _make_stub(name="alpha")
+    user = make_staff_user()
+    CachedStubDataTable.render(_request(user))
+
+    with django_assert_num_queries(0):
+        CachedStubDataTable.render(_request(user))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _make_stub(name="beta")
+    assert "beta" in CachedStubDataTable.render(_request(user))
+    assert StubModel.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_saving_declared_dependency_invalidates_panel(
+    mock_site_context, django_capture_on_commit_callbacks
+) -> None:
+    stub = _make_stub()
+    user = make_staff_user()
+    panel = CountingPanel(stub)
+    panel.render(_request(user))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _make_stub_child(stub)
+    panel.render(_request(user))
+
+    assert panel.calls == 2
+
+
+@pytest.mark.django_db
+def test_saving_unwatched_model_does_not_bump_generations(mock_site_context) -> None:
+    child = _make_stub_child(_make_stub())
+
+    with mock.patch.object(caching, "invalidate_fragments") as invalidate:
+        StubGrandchild.objects.create(parent=child)
+
+    invalidate.assert_not_called()
@@ -0,0 +1,247 @@
+"""Tests for KeysetPagination and the <c-keyset-pagination /> component."""
+
+from __future__ import annotations
+
+import pytest
+from django_cotton.compiler_regex import CottonCompiler
+
+from django.db.models.functions import Lower
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from freedom_ls.content_engine.factories import CourseFactory
+from freedom_ls.content_engine.models import Course
+from freedom_ls.panel_framework.pagination import (
+    KeysetPage,
+    KeysetPagination,
+    decode_cursor,
+    encode_cursor,
+)
+
+from .conftest import StubModel, _make_stub, make_staff_user
+from .stub_panels import StubDataTable
+
+_cotton_compiler = CottonCompiler()
+
+
+def _walk_forward(pagination: KeysetPagination, queryset, page_size: int) -> list:
+    """Follow next cursors from the first page, returning every page."""
+    pages = []
+    params: dict[str, str] = {}
+    while True:
+        page = pagination.paginate(
+            queryset, RequestFactory().get("/", params), page_size
+        )
+        assert isinstance(page, KeysetPage)
+        pages.append(page)
+        if not page.has_next:
+            return pages
+        params = {"after": page.next_cursor}
+
+
+@pytest.mark.django_db
+def test_forward_walk_visits_every_row_once_in_order() -> None:
+    for i in range(12):
+        _make_stub(name=f"row-{i:02d}")
+
+    pages = _walk_forward(
+        KeysetPagination(count=None), StubModel.objects.order_by("name"), 5
+    )
+
+    names = [row.name for page in pages for row in page]
+    assert names == [f"row-{i:02d}" for i in range(12)]
+    assert [len(page) for page in pages] == [5, 5, 2]
+    assert not pages[0].has_previous
+    assert pages[1].has_previous
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("param", ["after", "before"])
+def test_forged_cursor_serves_the_first_page(param: str) -> None:
+    for i in range(3):
+        _make_stub(name=f"row-{i}")
+    forged = encode_cursor(["row-1", "not-a-number"])
+
+    page = KeysetPagination(count=None).paginate(
+        StubModel.objects.order_by("name"),
+        RequestFactory().get("/", {param: forged}),
+        2,
+    )
+
+    assert [row.name for row in page] == ["row-0", "row-1"]
+    assert isinstance(page, KeysetPage)
+    assert not page.has_previous
+
+
+@pytest.mark.django_db
+def test_forged_uuid_cursor_serves_the_first_page(mock_site_context) -> None:
+    course = CourseFactory(title="a")
+    forged = encode_cursor(["a", "not-a-uuid"])
+
+    page = KeysetPagination(count=None).paginate(
+        Course.objects.order_by("title"),
+        RequestFactory().get("/", {"after": forged}),
+        2,
+    )
+
+    assert list(page) == [course]
+
+
+@pytest.mark.django_db
+def test_descending_sort_with_duplicate_values_uses_pk_tie_breaker() -> None:
+    for i in range(7):
+        _make_stub(name=f"dup-{i % 2}-{i}")
+
+    queryset = StubModel.objects.order_by("-name")
+    pages = _walk_forward(KeysetPagination(count=None), queryset, 3)
+
+    names = [row.name for page in pages for row in page]
+    assert names == list(queryset.values_list("name", flat=True))
+
+
+@pytest.mark.django_db
+def test_before_cursor_returns_previous_page() -> None:
+    for i in range(10):
+        _make_stub(name=f"row-{i:02d}")
+    pagination = KeysetPagination(count=None)
+    queryset = StubModel.objects.order_by("name")
+    second = _walk_forward(pagination, queryset, 4)[1]
+
+    request = RequestFactory().get("/", {"before": second.previous_cursor})
+    previous = pagination.paginate(queryset, request, 4)
+
+    assert [row.name for row in previous] == [f"row-{i:02d}" for i in range(4)]
+    assert previous.has_next
+    assert not previous.has_previous
+
+
+@pytest.mark.django_db
+def test_capped_count_stops_at_cap() -> None:
+    for _ in range(6):
+        _make_stub()
+
+    page = KeysetPagination(count="capped", count_cap=4).paginate(
+        StubModel.objects.order_by("name"), RequestFactory().get("/"), 2
+    )
+
+    assert page.count == 4
+    assert page.count_is_capped
+
+
+@pytest.mark.django_db
+def test_capped_count_is_exact_below_cap() -> None:
+    for _ in range(3):
+        _make_stub()
+
+    page = KeysetPagination(count="capped", count_cap=4).paginate(
+        StubModel.objects.order_by("name"), RequestFactory().get("/"), 2
+    )
+
+    assert page.count == 3
+    assert not page.count_is_capped
+
+
+@pytest.mark.django_db
+def test_malformed_cursor_falls_back_to_first_page() -> None:
+    _make_stub(name="first")
+    _make_stub(name="second")
+
+    request = RequestFactory().get("/", {"after": "not-a-cursor!"})
+    page = KeysetPagination(count=None).paginate(
+        StubModel.objects.order_by("name"), request, 5
+    )
+
+    assert [row.name for row in page] == ["first", "second"]
+
+
+@pytest.mark.django_db
+def test_expression_ordering_falls_back_to_page_numbers() -> None:
+    for i in range(7):
+        _make_stub(name=f"row-{i}")
+    queryset = StubModel.objects.order_by(Lower("name").desc())
+
+    page = KeysetPagination(count=None).paginate(
+        queryset, RequestFactory().get("/", {"page": 2}), 5
+    )
+
+    assert not isinstance(page, KeysetPage)
+    assert page.number == 2
+    assert [row.name for row in page] == ["row-1", "row-0"]
+
+
+@pytest.mark.django_db
+def test_data_table_renders_keyset_links(mock_site_context) -> None:
+    for i in range(4):
+        _make_stub(name=f"row-{i}")
+
+    class KeysetStubTable(StubDataTable):
+        page_size = 2
+        pagination = KeysetPagination(count="exact")
+
+    request = RequestFactory().get("/")
+    request.user = make_staff_user()
+    html = KeysetStubTable.render(request, base_url="/stubs/")
+
+    assert "/stubs/?after=" in html
+    assert "?page=" not in html
+    assert "4 results" in html
+
+
+def test_cursor_round_trip() -> None:
+    assert decode_cursor(encode_cursor(["Ada", 7, None])) == ["Ada", 7, None]
+
+
+# -- <c-keyset-pagination /> -------------------------------------------------
+
+
+def _render(template_string: str, **context_kwargs: object) -> str:
+    processed = _cotton_compiler.process(template_string)
+    template = Template(processed)
+    return template.render(Context(context_kwargs))
+
+
+_BASE = (
+    '<c-keyset-pagination :page_obj="page_obj" base_url="/items/" '
+    'table_id="my-table" {extras} />'
+)
+
+
+def _page(**kwargs: object) -> KeysetPage:
+    defaults: dict = {
+        "object_list": [1, 2],
+        "has_next": True,
+        "has_previous": True,
+        "next_cursor": "NEXT",
+        "previous_cursor": "PREV",
+    }
+    defaults.update(kwargs)
+    return KeysetPage(**defaults)
+
+
+class TestKeysetPaginationComponent:
+    def test_renders_nothing_when_there_are_no_other_pages(self) -> None:
+        page = _page(has_next=False, has_previous=False)
+        result = _render(_BASE.format(extras=""), page_obj=page)
+        assert "Next" not in result
+        assert "Previous" not in result
+
+    def test_renders_cursor_links(self) -> None:
+        result = _render(_BASE.format(extras=""), page_obj=_page())
+        assert "/items/?after=NEXT" in result
+        assert "/items/?before=PREV" in result
+        assert 'hx-target="#my-table"' in result
+
+    def test_preserves_sort_search_params_in_links(self) -> None:
+        extras = 'sort_by="name" sort_order="desc" search_query="alice"'
+        result = _render(_BASE.format(extras=extras), page_obj=_page())
+        assert "after=NEXT&amp;sort=name&amp;order=desc&amp;search=alice" in result
+
+    def test_capped_count_is_shown_with_plus(self) -> None:
+        page = _page(count=1000, count_is_capped=True)
+        result = _render(_BASE.format(extras=""), page_obj=page)
+        assert "1000+ results" in result
+
+    def test_estimated_count_is_shown_as_approximate(self) -> None:
+        page = _page(count=4200, count_is_estimate=True)
+        result = _render(_BASE.format(extras=""), page_obj=page)
+        assert "About 4200 results" in result
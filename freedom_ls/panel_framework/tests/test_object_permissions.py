@@ -0,0 +1,129 @@
+"""Tests for the request-scoped object permission cache used by panel actions."""
+
+from __future__ import annotations
+
+import pytest
+from guardian.shortcuts import assign_perm
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import RequestFactory
+
+from freedom_ls.panel_framework.actions import DeleteAction, EditAction
+from freedom_ls.panel_framework.permissions import (
+    get_permission_checker,
+    has_object_perm,
+    prefetch_object_permissions,
+)
+
+from .conftest import StubModel, _make_stub, make_staff_user
+from .stub_panels import StubDataTable, StubInstanceView, _build_stub_create_form
+
+
+def _request(user):
+    request = RequestFactory().get("/")
+    request.user = user
+    return request
+
+
+@pytest.mark.django_db
+def test_actions_share_one_prefetch(mock_site_context, django_assert_num_queries):
+    stub = _make_stub()
+    user = make_staff_user()
+    assign_perm("freedom_ls_panel_framework.change_stubmodel", user, stub)
+    request = _request(user)
+    ContentType.objects.get_for_model(StubModel)
+
+    prefetch_object_permissions(request, [stub])
+    with django_assert_num_queries(0):
+        can_edit = EditAction(
+            form_class=_build_stub_create_form, form_title="Edit", instance=stub
+        ).has_permission(request, stub)
+        can_delete = DeleteAction().has_permission(request, stub)
+
+    assert can_edit
+    assert not can_delete
+
+
+@pytest.mark.django_db
+def test_prefetch_covers_a_page_of_rows(mock_site_context, django_assert_num_queries):
+    rows = [_make_stub() for _ in range(6)]
+    user = make_staff_user()
+    for row in rows[::2]:
+        assign_perm("freedom_ls_panel_framework.change_stubmodel", user, row)
+    request = _request(user)
+    ContentType.objects.get_for_model(StubModel)
+
+    # One query for the user's permissions, one for their groups'.
+    with django_assert_num_queries(2):
+        prefetch_object_permissions(request, rows)
+    with django_assert_num_queries(0):
+        allowed = [
+            has_object_perm(request, "freedom_ls_panel_framework.change_stubmodel", row)
+            for row in rows
+        ]
+
+    assert allowed == [True, False, True, False, True, False]
+
+
+@pytest.mark.django_db
+def test_prefetch_is_not_repeated_for_cached_objects(
+    mock_site_context, django_assert_num_queries
+):
+    stub = _make_stub()
+    request = _request(make_staff_user())
+    prefetch_object_permissions(request, [stub])
+
+    with django_assert_num_queries(0):
+        prefetch_object_permissions(request, [stub])
+
+
+class PermissionTable(StubDataTable):
+    prefetch_row_permissions = True
+
+
+@pytest.mark.django_db
+def test_table_prefetches_row_permissions(mock_site_context):
+    stub = _make_stub()
+    user = make_staff_user()
+    assign_perm("freedom_ls_panel_framework.change_stubmodel", user, stub)
+    request = _request(user)
+
+    PermissionTable.render(request)
+
+    checker = get_permission_checker(request)
+    assert checker.get_perms(stub) == ["change_stubmodel"]
+
+
+class AllowDeleteBackend:
+    """Stands in for another object permission backend, e.g. role based."""
+
+    def has_perm(self, user_obj, perm, obj=None):
+        return perm == "freedom_ls_panel_framework.delete_stubmodel"
+
+
+@pytest.mark.django_db
+def test_prefetched_objects_still_consult_other_backends(mock_site_context, settings):
+    settings.AUTHENTICATION_BACKENDS = [
+        "freedom_ls.panel_framework.permissions.PrefetchedObjectPermissionBackend",
+        f"{__name__}.AllowDeleteBackend",
+    ]
+    stub = _make_stub()
+    request = _request(make_staff_user())
+
+    prefetch_object_permissions(request, [stub])
+
+    assert DeleteAction().has_permission(request, stub)
+    assert not has_object_perm(
+        request, "freedom_ls_panel_framework.change_stubmodel", stub
+    )
+
+
+@pytest.mark.django_db
+def test_instance_view_without_actions_skips_prefetch(
+    mock_site_context, django_assert_num_queries
+):
+    view = StubInstanceView(_make_stub())
+    request = _request(make_staff_user())
+
+    with django_assert_num_queries(0):
+        assert view._render_instance_actions(request, "/") == ""
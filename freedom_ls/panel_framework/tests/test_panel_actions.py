@@ -194,6 +194,20 @@ def test_create_action_permission_denied_returns_403(mock_site_context):
     assert not StubModel.objects.filter(name="Forbidden").exists()
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("method", ["get", "head"])
+def test_handle_action_renders_the_form_for_get_and_head(mock_site_context, method):
+    """HEAD is answered like GET, as it was before actions handled GET only."""
+    user = make_staff_user()
+    assign_perm("freedom_ls_panel_framework.add_stubmodel", user)
+    request = getattr(RequestFactory(), method)("/")
+    request.user = user
+
+    resolved = _ResolvedAction(StubCreateAction(), instance=None)
+    response = _handle_action(request, resolved, base_url="/items")
+    assert response.status_code == 200
+
+
 # -- EditAction tests ----------------------------------------------------
 
 
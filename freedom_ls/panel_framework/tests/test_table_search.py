@@ -0,0 +1,85 @@
+"""Tests for the pluggable DataTable search strategies."""
+
+from __future__ import annotations
+
+import pytest
+
+from django.test import RequestFactory
+
+from freedom_ls.panel_framework.search import (
+    ContainsSearch,
+    PrefixSearch,
+    TrigramSearch,
+)
+from freedom_ls.panel_framework.tables import DataTable
+
+from .conftest import StubModel, _make_stub
+from .stub_panels import StubDataTable
+
+
+def _names(queryset) -> set[str]:
+    return set(queryset.values_list("name", flat=True))
+
+
+@pytest.mark.django_db
+def test_contains_search_matches_substring_case_insensitively() -> None:
+    _make_stub(name="Alpha Cohort")
+    _make_stub(name="Beta Cohort")
+    _make_stub(name="Gamma")
+
+    result = ContainsSearch().apply(StubModel.objects.all(), ["name"], "COHORT")
+
+    assert _names(result) == {"Alpha Cohort", "Beta Cohort"}
+
+
+@pytest.mark.django_db
+def test_prefix_search_only_matches_start_of_value() -> None:
+    _make_stub(name="Alpha Cohort")
+    _make_stub(name="Cohort Alpha")
+
+    result = PrefixSearch().apply(StubModel.objects.all(), ["name"], "cohort")
+
+    assert _names(result) == {"Cohort Alpha"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", ["al", "ppa"])
+def test_trigram_search_matches_substrings_of_any_length(query: str) -> None:
+    _make_stub(name="Sally")
+    _make_stub(name="Kappa")
+    _make_stub(name="Bob")
+
+    result = TrigramSearch().apply(StubModel.objects.all(), ["name"], query)
+
+    assert _names(result) == {"Sally" if query == "al" else "Kappa"}
+
+
+@pytest.mark.django_db
+def test_empty_query_returns_queryset_unfiltered() -> None:
+    _make_stub(name="Alpha")
+    _make_stub(name="Beta")
+
+    result = TrigramSearch().apply(StubModel.objects.all(), ["name"], "")
+
+    assert _names(result) == {"Alpha", "Beta"}
+
+
+@pytest.mark.django_db
+def test_get_rows_uses_table_search_strategy() -> None:
+    _make_stub(name="Alpha Cohort")
+    _make_stub(name="Cohort Alpha")
+
+    class PrefixStubTable(StubDataTable):
+        search_fields = ["name"]
+        search_strategy = PrefixSearch()
+
+    request = RequestFactory().get("/", {"search": "cohort"})
+    columns = PrefixStubTable._prepare_columns()
+
+    page = PrefixStubTable.get_rows(request, columns)
+
+    assert [row.name for row in page.object_list] == ["Cohort Alpha"]
+
+
+def test_default_search_strategy_is_substring_match() -> None:
+    assert type(DataTable.search_strategy) is ContainsSearch
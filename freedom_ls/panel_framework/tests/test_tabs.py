@@ -99,3 +99,51 @@ def test_tab_buttons_have_data_tab_name(mock_site_context):
     html = view.render(_make_request(), base_url="/test")
     assert 'data-tab-name="first_tab"' in html
     assert 'data-tab-name="second_tab"' in html
+
+
+class LazyPanel(Panel):
+    title = "Lazy Panel"
+    lazy = True
+    lazy_trigger = "revealed"
+
+    def get_content(self, request, base_url="", panel_name=""):
+        return "<p>lazy-content</p>"
+
+
+class LazyTabbedInstanceView(InstanceView):
+    tabs = {
+        "first_tab": Tab(
+            label="First Tab", panels={"panel_a": StubPanelA, "slow": LazyPanel}
+        ),
+    }
+
+
+class LazyFlatInstanceView(InstanceView):
+    panels = {"panel_a": StubPanelA, "slow": LazyPanel}
+
+
+@pytest.mark.django_db
+def test_lazy_panel_in_tab_renders_placeholder(mock_site_context):
+    """Lazy panels render a placeholder that fetches the panel URL via HTMX."""
+    item = _make_stub(name="tabs-lazy-panel")
+    view = LazyTabbedInstanceView(item)
+    html = view.render(_make_request(), base_url="/test")
+    assert "panel-a-content" in html
+    assert "lazy-content" not in html
+    assert 'hx-get="/test/__tabs/first_tab/__panels/slow"' in html
+    assert 'hx-trigger="revealed once"' in html
+    assert "Lazy Panel" in html
+
+
+@pytest.mark.django_db
+def test_lazy_panel_in_flat_view_renders_placeholder(mock_site_context):
+    """Flat instance views defer lazy panels too; rendering the panel gives content."""
+    item = _make_stub(name="flat-lazy-panel")
+    html = LazyFlatInstanceView(item).render(_make_request(), base_url="/test")
+    assert 'hx-get="/test/__panels/slow"' in html
+    assert "lazy-content" not in html
+
+    panel_html = LazyPanel(item).render(
+        _make_request(), base_url="/test/__panels/slow", panel_name="slow"
+    )
+    assert "lazy-content" in panel_html
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
 from django.urls import re_path
 
 from freedom_ls.panel_framework.views import panel_framework_view
@@ -16,7 +17,7 @@ def _stub_view(request: HttpRequest, path_string: str = "") -> HttpResponse:
     return HttpResponse("ok")
 
 
-def _framework_view(request: HttpRequest, path_string: str = "") -> HttpResponse:
+def _framework_view(request: HttpRequest, path_string: str = "") -> HttpResponseBase:
     return panel_framework_view(
         config={"stubs": StubListConfig},
         request=request,
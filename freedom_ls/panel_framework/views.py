@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from django.db.models import Model
 from django.http import Http404, HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
 from django.shortcuts import get_object_or_404, render
 from django.template.loader import render_to_string
 from django.urls import reverse
@@ -9,6 +10,7 @@ from django.utils.html import escape
 
 from freedom_ls.panel_framework.actions import CreateInstanceAction, PanelAction
 from freedom_ls.panel_framework.panels import Panel
+from freedom_ls.panel_framework.permissions import prefetch_object_permissions
 from freedom_ls.panel_framework.tables import DEFAULT_TABLE_ID, DataTable
 from freedom_ls.panel_framework.tabs import Tab
 
@@ -26,6 +28,17 @@ class PanelGetter:
         return self._panel_classes[name](self._instance)
 
 
+def _render_panel_or_placeholder(
+    panel: Panel, request: HttpRequest, panel_url: str, panel_name: str
+) -> str:
+    """Render a panel inline, or its placeholder if it is lazy-loaded."""
+    if panel.lazy:
+        return panel.render_placeholder(
+            request, base_url=panel_url, panel_name=panel_name
+        )
+    return panel.render(request, base_url=panel_url, panel_name=panel_name)
+
+
 class InstanceView:
     """Used for displaying specific instances. For example one User, Cohort, etc."""
 
@@ -69,9 +82,13 @@ class InstanceView:
 
     def _render_instance_actions(self, request: HttpRequest, base_url: str) -> str:
         """Render instance-level actions (delete, etc.)."""
+        actions = self.get_actions()
+        if not actions:
+            return ""
+        prefetch_object_permissions(request, [self.instance])
         instance_actions = [
             action
-            for action in self.get_actions()
+            for action in actions
             if action.has_permission(request, self.instance)
         ]
         if not instance_actions:
@@ -92,7 +109,7 @@ class InstanceView:
         for name in self.panels:
             panel_url = f"{base_url.rstrip('/')}/__panels/{name}"
             rendered_panels.append(
-                getter[name].render(request, base_url=panel_url, panel_name=name)
+                _render_panel_or_placeholder(getter[name], request, panel_url, name)
             )
 
         instance_actions_html = self._render_instance_actions(request, base_url)
@@ -150,7 +167,7 @@ class InstanceView:
             panel_url = f"{tab_url}/__panels/{name}"
             panel = panel_class(instance=self.instance)
             rendered_panels.append(
-                panel.render(request, base_url=panel_url, panel_name=name)
+                _render_panel_or_placeholder(panel, request, panel_url, name)
             )
         return render_to_string(
             "panel_framework/partials/tab_panels.html",
@@ -326,7 +343,7 @@ def _resolve_path(
 
 def _handle_action(
     request: HttpRequest, resolved: _ResolvedAction, base_url: str = ""
-) -> HttpResponse:
+) -> HttpResponseBase:
     """Handle a resolved action: check permission, then dispatch."""
     action = resolved.action
     instance = resolved.instance
@@ -339,10 +356,8 @@ def _handle_action(
     if request.method == "DELETE":
         return action.handle_submit(request, instance, base_url=base_url)
 
-    # GET: render the action form
-    if hasattr(action, "render"):
-        html = action.render(request, instance, base_url)
-        return HttpResponse(html)
+    if request.method in ("GET", "HEAD"):
+        return action.handle_get(request, instance, base_url=base_url)
     return HttpResponse(status=405)
 
 
@@ -423,11 +438,11 @@ def _dispatch_resolved(
     base_url: str,
     is_htmx: bool,
     hx_target: str = "",
-) -> HttpResponse | tuple[str, str]:
+) -> HttpResponseBase | tuple[str, str]:
     """Dispatch based on the resolved path object.
 
     Returns either:
-    - An HttpResponse (for actions, HTMX fragments, panels)
+    - An HttpResponse (for actions, HTMX fragments, panels; actions may stream)
     - A (rendered_content, heading) tuple for full-page rendering
     """
     if isinstance(current, _ResolvedAction):
@@ -545,7 +560,7 @@ def panel_framework_view(
     path_string: str,
     template_name: str,
     url_name: str,
-) -> HttpResponse:
+) -> HttpResponseBase:
     """Generic dispatch view for panel-framework-based interfaces.
 
     Parameters:
@@ -571,7 +586,7 @@ def panel_framework_view(
         result = _dispatch_resolved(
             request, current, base_url, is_htmx, hx_target=hx_target
         )
-        if isinstance(result, HttpResponse):
+        if isinstance(result, HttpResponseBase):
             return result
         rendered_content, heading = result
 
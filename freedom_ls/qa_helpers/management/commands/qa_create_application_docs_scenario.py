@@ -18,7 +18,7 @@ scenario for documenting the new course-applications feature:
      dashboard "in progress" section looks populated).
 
 All objects are created with site-aware factories and the explicit `site=`
-override (the factories' thread-local site default is None outside a request).
+override (the factories' context site default is None outside a request).
 """
 
 from datetime import timedelta
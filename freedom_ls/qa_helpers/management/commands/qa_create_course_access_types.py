@@ -16,7 +16,7 @@ Creates (idempotently) on a single site (default: DemoDev):
    the first-time "Apply now" flow can be exercised.
 
 All objects are created with site-aware factories and the explicit `site=` override
-(the factories' thread-local site default is None outside a request).
+(the factories' context site default is None outside a request).
 """
 
 from typing import cast
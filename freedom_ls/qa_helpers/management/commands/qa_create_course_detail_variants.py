@@ -27,7 +27,7 @@ and the Django-side clean): a PUBLISHED course may not have
 therefore ``coming_soon`` (not published).
 
 All objects are created with the site-aware factories and an explicit ``site=``
-override (the factories' thread-local site default is None outside a request).
+override (the factories' context site default is None outside a request).
 """
 
 from typing import cast
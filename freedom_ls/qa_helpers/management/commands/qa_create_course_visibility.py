@@ -22,7 +22,7 @@ RELATIONSHIPS:
   - No CourseInterest rows are pre-created (the QA tester makes those via the UI).
 
 All objects are created via site-aware factories with an explicit `site=`
-override (the factories' thread-local site default is None outside a request).
+override (the factories' context site default is None outside a request).
 """
 
 from typing import cast
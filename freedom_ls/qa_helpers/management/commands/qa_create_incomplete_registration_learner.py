@@ -19,7 +19,7 @@ Sets up (idempotently) on a single site (default: DemoDev):
    - Login convention in this project is password == email.
 
 All objects are created with site-aware factories and the explicit ``site=``
-override (the factories' thread-local site default is None outside a request).
+override (the factories' context site default is None outside a request).
 """
 
 from typing import cast
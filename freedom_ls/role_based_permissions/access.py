@@ -0,0 +1,169 @@
+"""Cached "which objects can this user access" lookups.
+
+``guardian.shortcuts.get_objects_for_user`` resolves the user's global
+permissions and builds a subquery over the object permission tables on every
+call, and list views call it on every request. Here the ids of the objects a
+user holds a permission on are computed once and cached at two levels:
+
+- on the user instance, for the rest of the request (``request.user`` is loaded
+  per request, like Django's own ``_perm_cache``);
+- in the Django cache, across requests, for
+  ``FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT`` seconds. This layer is off by
+  default (timeout 0): invalidation bumps versions in the cache, so it is only
+  safe with a cache shared by every process, as ``config/settings_prod.py``
+  configures. With a per-process cache, a revocation handled by one worker
+  would go unseen by the others.
+
+Cross-request entries are keyed by a per-user version, bumped by
+``invalidate_accessible_objects`` once the current transaction commits, so
+a concurrent request cannot re-cache the pre-commit ids under the new
+version. ``sync_user_object_permissions`` (and so
+``assign_object_role``/``remove_object_role`` and the site role helpers) bumps
+it when it changes anything, and the receivers in ``signals`` bump it for
+direct guardian writes and group membership changes.
+
+Users holding the permission on more than ``MAX_ACCESSIBLE_IDS`` objects get
+guardian's subquery instead, rather than an unbounded literal ``pk IN`` list.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, cast
+
+from guardian.shortcuts import get_objects_for_user
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model, QuerySet
+
+from freedom_ls.role_based_permissions.config import config
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AnonymousUser
+
+    from freedom_ls.accounts.models import User
+
+CACHE_PREFIX = "role_based_permissions:access"
+_USER_CACHE_ATTR = "_accessible_object_ids_cache"
+_MISSING = object()
+
+# Above this many accessible objects, querysets filter by guardian's subquery.
+MAX_ACCESSIBLE_IDS = 1000
+
+
+def _version_key(user_pk: object | None) -> str:
+    """Version key for one user, or the global version when ``user_pk`` is None."""
+    return f"{CACHE_PREFIX}:version:{'all' if user_pk is None else user_pk}"
+
+
+def _bump_versions(keys: list[str]) -> None:
+    for key in keys:
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr(); any fresh version will do.
+            cache.set(key, 1, timeout=None)
+
+
+def invalidate_accessible_objects(
+    user: Model | None = None, user_pks: Iterable[object] | None = None
+) -> None:
+    """Drop cached accessible object ids for ``user`` or the users in ``user_pks``.
+
+    Drops everyone's when neither is given. Cross-request entries are dropped
+    when the current transaction commits.
+    """
+    if user is not None:
+        user.__dict__.pop(_USER_CACHE_ATTR, None)
+        keys = [_version_key(user.pk)]
+    elif user_pks is not None:
+        keys = [_version_key(pk) for pk in user_pks]
+    else:
+        keys = [_version_key(None)]
+    if keys:
+        transaction.on_commit(lambda: _bump_versions(keys))
+
+
+def _guardian_objects(
+    user: User | AnonymousUser, perm: str, queryset: QuerySet
+) -> QuerySet:
+    return get_objects_for_user(
+        user,
+        perm,
+        klass=queryset,
+        accept_global_perms=False,
+        with_superuser=False,
+    )
+
+
+def _ids_key(user: User | AnonymousUser, perm: str, klass: type[Model]) -> str:
+    version_keys = [_version_key(None), _version_key(user.pk)]
+    versions = cache.get_many(version_keys)
+    return ":".join(
+        [
+            CACHE_PREFIX,
+            "ids",
+            str(user.pk),
+            klass._meta.label_lower,
+            perm,
+            *(str(versions.get(version_key, 0)) for version_key in version_keys),
+        ]
+    )
+
+
+def get_accessible_object_ids(
+    user: User | AnonymousUser, perm: str, klass: type[Model]
+) -> frozenset[object] | None:
+    """Return pks of ``klass`` objects ``user`` holds ``perm`` on via guardian.
+
+    Only object permissions (the user's and their groups') are considered;
+    superusers and global permissions are handled by
+    ``get_objects_for_user_cached``. ``perm`` is "app_label.codename".
+    Returns None when there are more than ``MAX_ACCESSIBLE_IDS``.
+    """
+    request_cache: dict[tuple[str, str], frozenset[object] | None] = (
+        user.__dict__.setdefault(_USER_CACHE_ATTR, {})
+    )
+    memo_key = (klass._meta.label_lower, perm)
+    if memo_key in request_cache:
+        return request_cache[memo_key]
+
+    timeout = config.FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT
+    key = _ids_key(user, perm, klass) if timeout > 0 else None
+    ids = _MISSING if key is None else cache.get(key, _MISSING)
+    if ids is _MISSING:
+        # The base manager spans every site, so one entry serves them all.
+        pks = list(
+            _guardian_objects(user, perm, klass._base_manager.all()).values_list(
+                "pk", flat=True
+            )[: MAX_ACCESSIBLE_IDS + 1]
+        )
+        ids = frozenset(pks) if len(pks) <= MAX_ACCESSIBLE_IDS else None
+        if key is not None:
+            cache.set(key, ids, timeout)
+    request_cache[memo_key] = cast("frozenset[object] | None", ids)
+    return request_cache[memo_key]
+
+
+def get_objects_for_user_cached(
+    user: User | AnonymousUser, perm: str, klass: type[Model]
+) -> QuerySet:
+    """Cached equivalent of ``get_objects_for_user(user, perm, klass=klass)``.
+
+    Superusers and users with the global permission see every object of
+    ``klass``'s default manager; everyone else sees the objects they hold the
+    permission on. ``perm`` may omit the app label.
+    """
+    queryset = klass._default_manager.all()
+    if not user.is_active:
+        return queryset.none()
+    if "." not in perm:
+        perm = f"{klass._meta.app_label}.{perm}"
+    if user.is_superuser or user.has_perm(perm):
+        return queryset
+    ids = get_accessible_object_ids(user, perm, klass)
+    if ids is None:
+        return _guardian_objects(user, perm, queryset)
+    return queryset.filter(pk__in=ids)
@@ -5,3 +5,7 @@ class RoleBasedPermissionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "freedom_ls.role_based_permissions"
     label = "freedom_ls_role_based_permissions"
+
+    def ready(self) -> None:
+        # Register the accessible-object cache and permission table receivers.
+        from freedom_ls.role_based_permissions import signals  # noqa: F401
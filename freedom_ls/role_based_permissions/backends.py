@@ -0,0 +1,171 @@
+"""Authentication backend answering permission checks from role assignments.
+
+The default setup syncs role assignments into guardian ``UserObjectPermission``
+rows, and ``guardian.backends.ObjectPermissionBackend`` answers checks by
+joining through them. ``RoleBasedPermissionBackend`` instead reads the user's
+``ObjectRoleAssignment``/``SiteRoleAssignment``/``SystemRoleAssignment`` rows
+and expands them with the compiled permission tables, so a check is one query
+on the assignment table and needs no guardian rows.
+
+Enable it in place of guardian's backend::
+
+    AUTHENTICATION_BACKENDS = [
+        "django.contrib.auth.backends.ModelBackend",
+        "freedom_ls.role_based_permissions.backends.RoleBasedPermissionBackend",
+    ]
+
+Like ``ModelBackend``'s ``_perm_cache``, results are cached on the user
+instance, which is loaded per request. Role changes are seen by the next
+request, or after the user is reloaded.
+
+System roles are global: their permissions apply without an object and on
+every object, and are read from the role config of the site being served
+(``get_context_site()``), or the base config outside a site. Object and site
+roles use their assignment's site's config and follow the same content type
+filtering as the guardian sync.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from django.contrib.auth.backends import BaseBackend
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.db.models import Model, QuerySet
+
+from freedom_ls.role_based_permissions.compiled import get_site_permission_tables
+from freedom_ls.role_based_permissions.models import (
+    ObjectRoleAssignment,
+    SiteRoleAssignment,
+    SystemRoleAssignment,
+)
+from freedom_ls.site_aware_models.models import get_context_site
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+    from django.contrib.auth.models import AnonymousUser
+
+    from freedom_ls.accounts.models import User
+
+_CACHE_ATTR = "_role_perm_cache"
+_SYSTEM_KEY = "system"
+
+
+def _user_cache(user_obj: User) -> dict:
+    cache: dict = user_obj.__dict__.setdefault(_CACHE_ATTR, {})
+    return cache
+
+
+def _system_permissions(user_obj: User) -> frozenset[str]:
+    """Permissions granted globally by the user's active system roles."""
+    cache = _user_cache(user_obj)
+    if _SYSTEM_KEY not in cache:
+        site = get_context_site()
+        role_config = get_site_permission_tables(
+            site.pk if site is not None else None
+        ).role_config
+        permissions: set[str] = set()
+        for role_name in SystemRoleAssignment.objects.filter(
+            user=user_obj, is_active=True
+        ).values_list("role", flat=True):
+            if role_name in role_config:
+                permissions |= role_config[role_name].permissions
+        cache[_SYSTEM_KEY] = frozenset(permissions)
+    system_permissions: frozenset[str] = cache[_SYSTEM_KEY]
+    return system_permissions
+
+
+def _object_permissions(user_obj: User, obj: Model) -> frozenset[str]:
+    """Permissions the user's object or site roles grant on ``obj``."""
+    ct = ContentType.objects.get_for_model(obj)
+    key = (ct.pk, str(obj.pk))
+    cache = _user_cache(user_obj)
+    if key not in cache:
+        if isinstance(obj, Site):
+            assignments = SiteRoleAssignment.objects.filter(
+                user=user_obj, site=obj, is_active=True
+            )
+        else:
+            assignments = ObjectRoleAssignment.objects.filter(
+                user=user_obj, content_type=ct, object_id=key[1], is_active=True
+            )
+        permissions: set[str] = set()
+        for role, site_id in assignments.values_list("role", "site_id"):
+            permissions |= get_site_permission_tables(site_id).permissions_for(
+                {role}, ct.pk
+            )
+        cache[key] = frozenset(permissions)
+    object_permissions: frozenset[str] = cache[key]
+    return object_permissions
+
+
+class RoleBasedPermissionBackend(BaseBackend):
+    """Answer ``has_perm`` from role assignments and the compiled role config.
+
+    Does not authenticate; it only contributes permissions.
+    """
+
+    def get_all_permissions(
+        self,
+        user_obj: AbstractBaseUser | AnonymousUser,
+        obj: Model | None = None,
+    ) -> set[str]:
+        if not user_obj.is_active or user_obj.is_anonymous:
+            return set()
+        user = cast("User", user_obj)
+        permissions = set(_system_permissions(user))
+        if obj is not None:
+            permissions |= _object_permissions(user, obj)
+        return permissions
+
+    def has_perm(
+        self,
+        user_obj: AbstractBaseUser | AnonymousUser,
+        perm: str,
+        obj: Model | None = None,
+    ) -> bool:
+        return perm in self.get_all_permissions(user_obj, obj)
+
+
+def get_objects_for_user(
+    user: User | AnonymousUser, perm: str, klass: type[Model]
+) -> QuerySet:
+    """Role-based equivalent of guardian's ``get_objects_for_user``.
+
+    Returns the objects of ``klass``'s default manager ``user`` holds
+    ``perm`` on through a role. Superusers and users whose system roles grant
+    ``perm`` get every object. ``perm`` may omit the app label.
+    """
+    queryset = klass._default_manager.all()
+    if not user.is_active or user.is_anonymous:
+        return queryset.none()
+    if "." not in perm:
+        perm = f"{klass._meta.app_label}.{perm}"
+    user = cast("User", user)
+    if user.is_superuser or perm in _system_permissions(user):
+        return queryset
+
+    ct = ContentType.objects.get_for_model(klass)
+    if klass is Site:
+        site_ids = [
+            site_id
+            for site_id, role in SiteRoleAssignment.objects.filter(
+                user=user, is_active=True
+            ).values_list("site_id", "role")
+            if perm
+            in get_site_permission_tables(site_id).permissions_for({role}, ct.pk)
+        ]
+        return queryset.filter(pk__in=site_ids)
+
+    # Roles are filtered in Python since each assignment's site may use a
+    # different role config. Materialized rather than a subquery: object_id is
+    # a string, and casting it to the pk type in SQL is backend-specific.
+    object_ids = [
+        object_id
+        for object_id, role, site_id in ObjectRoleAssignment.objects.filter(
+            user=user, content_type=ct, is_active=True
+        ).values_list("object_id", "role", "site_id")
+        if perm in get_site_permission_tables(site_id).permissions_for({role}, ct.pk)
+    ]
+    return queryset.filter(pk__in=object_ids)
@@ -0,0 +1,141 @@
+"""Role configs compiled into frozen role -> content type -> permission tables.
+
+Syncing guardian permissions needs, for each role, the permissions that apply
+to an object's content type and their ``auth_permission`` ids. Rather than
+filtering the role's permission strings against the Permission table on every
+sync, each role module is compiled once per process into lookup tables, with
+one query for the Permission rows of the app labels it references.
+
+Tables are keyed by role module path, so sites sharing a module share tables.
+They are built on first use rather than in ``AppConfig.ready`` (which must not
+query the database) and dropped after ``migrate`` and by ``clear_caches``.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from django.contrib.auth.models import Permission
+from django.contrib.sites.models import Site
+
+from freedom_ls.role_based_permissions.loader import (
+    _BASE_MODULE,
+    get_role_config,
+    get_role_module_path,
+    load_base_config,
+)
+from freedom_ls.role_based_permissions.types import SiteRolesConfig
+from freedom_ls.site_aware_models.registry import get_site_by_id
+
+
+@dataclass(frozen=True)
+class PermissionTables:
+    """Lookup tables compiled from one role config.
+
+    Attributes:
+        role_config: The config the tables were compiled from.
+        role_permissions: role name -> content type id -> permission strings
+            ("app_label.codename") of that role which exist for the content type.
+        permission_ids: (content type id, permission string) -> Permission pk.
+        missing: Permission strings referenced by the config with no
+            Permission row.
+    """
+
+    role_config: SiteRolesConfig
+    role_permissions: Mapping[str, Mapping[int, frozenset[str]]]
+    permission_ids: Mapping[tuple[int, str], int]
+    missing: frozenset[str]
+
+    def permissions_for(self, roles: Iterable[str], content_type_id: int) -> set[str]:
+        """Return the permission strings ``roles`` grant on a content type.
+
+        Roles not in the config are ignored.
+        """
+        permissions: set[str] = set()
+        for role_name in roles:
+            by_content_type = self.role_permissions.get(role_name)
+            if by_content_type is not None:
+                permissions |= by_content_type.get(content_type_id, frozenset())
+        return permissions
+
+
+def compile_permission_tables(role_config: SiteRolesConfig) -> PermissionTables:
+    """Compile ``role_config`` into PermissionTables with a single query."""
+    all_permissions = role_config.all_permission_strings()
+    app_labels = {perm.split(".", 1)[0] for perm in all_permissions}
+
+    # A codename is only unique per content type, so one permission string
+    # may exist on several content types of the same app.
+    content_types_by_perm: dict[str, list[int]] = defaultdict(list)
+    permission_ids: dict[tuple[int, str], int] = {}
+    for perm_id, ct_id, app_label, codename in Permission.objects.filter(
+        content_type__app_label__in=app_labels
+    ).values_list("pk", "content_type_id", "content_type__app_label", "codename"):
+        perm = f"{app_label}.{codename}"
+        if perm in all_permissions:
+            content_types_by_perm[perm].append(ct_id)
+            permission_ids[(ct_id, perm)] = perm_id
+
+    role_permissions: dict[str, Mapping[int, frozenset[str]]] = {}
+    for role_name, role in role_config.items():
+        by_content_type: dict[int, set[str]] = defaultdict(set)
+        for perm in role.permissions:
+            for ct_id in content_types_by_perm.get(perm, ()):
+                by_content_type[ct_id].add(perm)
+        role_permissions[role_name] = MappingProxyType(
+            {ct_id: frozenset(perms) for ct_id, perms in by_content_type.items()}
+        )
+
+    return PermissionTables(
+        role_config=role_config,
+        role_permissions=MappingProxyType(role_permissions),
+        permission_ids=MappingProxyType(permission_ids),
+        missing=frozenset(all_permissions - content_types_by_perm.keys()),
+    )
+
+
+_tables_by_module: dict[str, PermissionTables] = {}
+
+
+def get_permission_tables(site_name: str | None = None) -> PermissionTables:
+    """Return the compiled PermissionTables for a site's role config.
+
+    Args:
+        site_name: Site name to load config for. If not provided, uses the current site.
+    """
+    if site_name is None:
+        site_name = Site.objects.get_current().name
+    module_path = get_role_module_path(site_name)
+    tables = _tables_by_module.get(module_path)
+    if tables is None:
+        tables = compile_permission_tables(get_role_config(site_name))
+        _tables_by_module[module_path] = tables
+    return tables
+
+
+def get_site_permission_tables(site_id: int | None) -> PermissionTables:
+    """Return the compiled PermissionTables for the site with ``site_id``.
+
+    Unlike ``get_permission_tables`` this never falls back to
+    ``Site.objects.get_current()``, which needs ``SITE_ID``: without a site,
+    or for an unknown one, the base role config's tables are returned.
+    """
+    site = get_site_by_id(site_id) if site_id is not None else None
+    if site is not None:
+        return get_permission_tables(site.name)
+    tables = _tables_by_module.get(_BASE_MODULE)
+    if tables is None:
+        tables = compile_permission_tables(load_base_config())
+        _tables_by_module[_BASE_MODULE] = tables
+    return tables
+
+
+def clear_permission_tables(**kwargs: object) -> None:
+    """Drop compiled tables, e.g. after Permission rows were added.
+
+    Accepts signal kwargs so it can be connected to ``post_migrate``.
+    """
+    _tables_by_module.clear()
@@ -5,9 +5,13 @@ from freedom_ls.base.app_settings import AppSettings, Setting
 
 class RoleBasedPermissionsConfig(AppSettings):
     FREEDOMLS_PERMISSIONS_MODULES: dict[str, str]
+    FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT: int
 
     declared_settings = {
         "FREEDOMLS_PERMISSIONS_MODULES": Setting(default={}),
+        # Seconds to cache the ids of objects a user holds a permission on
+        # across requests; 0 disables it. Needs a cache shared by all processes.
+        "FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT": Setting(default=0),
     }
 
 
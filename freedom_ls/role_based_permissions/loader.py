@@ -30,10 +30,10 @@ def load_base_config() -> SiteRolesConfig:
 
 def clear_caches() -> None:
     """Clear all role permission caches. Intended for use in tests."""
-    from freedom_ls.role_based_permissions.utils import clear_permission_cache
+    from freedom_ls.role_based_permissions.compiled import clear_permission_tables
 
     _get_role_config_cached.cache_clear()
-    clear_permission_cache()
+    clear_permission_tables()
 
 
 def get_role_config(site_name: str | None = None) -> SiteRolesConfig:
@@ -49,9 +49,13 @@ def get_role_config(site_name: str | None = None) -> SiteRolesConfig:
     return _get_role_config_cached(site_name)
 
 
+def get_role_module_path(site_name: str) -> str:
+    """Return the module path holding the role config for the given site name."""
+    modules: dict[str, str] = config.FREEDOMLS_PERMISSIONS_MODULES
+    return modules.get(site_name, _BASE_MODULE)
+
+
 @cache
 def _get_role_config_cached(site_name: str) -> SiteRolesConfig:
     """Cached inner function — site_name is always a concrete string."""
-    modules: dict[str, str] = config.FREEDOMLS_PERMISSIONS_MODULES
-    module_path = modules.get(site_name, _BASE_MODULE)
-    return _load_module_config(module_path)
+    return _load_module_config(get_role_module_path(site_name))
@@ -0,0 +1,164 @@
+"""Compare guardian permission checks with RoleBasedPermissionBackend.
+
+Runs the same checks through both paths against the existing role assignments
+and reports time and queries per check. It only reads data. Guardian rows must
+be in sync (run ``sync_role_permissions`` first) for the results to agree.
+
+Usage:
+    manage.py benchmark_role_permissions --users 50 --iterations 5
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import djclick as click
+from guardian.backends import ObjectPermissionBackend
+from guardian.shortcuts import get_objects_for_user as guardian_get_objects_for_user
+
+from django.db import connection
+from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
+
+from freedom_ls.accounts.models import User
+from freedom_ls.role_based_permissions.backends import (
+    RoleBasedPermissionBackend,
+)
+from freedom_ls.role_based_permissions.backends import (
+    get_objects_for_user as role_get_objects_for_user,
+)
+from freedom_ls.role_based_permissions.compiled import get_site_permission_tables
+from freedom_ls.role_based_permissions.models import ObjectRoleAssignment
+
+
+@dataclass(frozen=True)
+class _Check:
+    user_id: int
+    obj: Model
+    perm: str
+
+
+@click.command()
+@click.option(
+    "--users",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Users with object role assignments to check.",
+)
+@click.option(
+    "--iterations",
+    default=5,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Times each set of checks is repeated.",
+)
+def command(users: int, iterations: int) -> None:
+    """Benchmark guardian and role-based permission checks."""
+    checks = _collect_checks(users)
+    if not checks:
+        click.echo("No active object role assignments to benchmark.")
+        return
+    click.echo(
+        f"{len(checks)} check(s) for {len({c.user_id for c in checks})} user(s), "
+        f"{iterations} iteration(s)."
+    )
+
+    guardian_backend = ObjectPermissionBackend()
+    role_backend = RoleBasedPermissionBackend()
+    mismatches = 0
+    for check in checks:
+        user = User.objects.get(pk=check.user_id)
+        if guardian_backend.has_perm(
+            user, check.perm, check.obj
+        ) != role_backend.has_perm(user, check.perm, check.obj):
+            mismatches += 1
+    if mismatches:
+        click.echo(
+            f"Warning: {mismatches} check(s) disagree; guardian rows may be out "
+            f"of sync.",
+            err=True,
+        )
+
+    def guardian_has_perm(user: User, check: _Check) -> object:
+        return guardian_backend.has_perm(user, check.perm, check.obj)
+
+    def role_has_perm(user: User, check: _Check) -> object:
+        return role_backend.has_perm(user, check.perm, check.obj)
+
+    def guardian_objects(user: User, check: _Check) -> object:
+        return list(
+            guardian_get_objects_for_user(
+                user, check.perm, klass=type(check.obj), accept_global_perms=False
+            ).values_list("pk", flat=True)
+        )
+
+    def role_objects(user: User, check: _Check) -> object:
+        return list(
+            role_get_objects_for_user(user, check.perm, type(check.obj)).values_list(
+                "pk", flat=True
+            )
+        )
+
+    for label, func in [
+        ("has_perm, guardian", guardian_has_perm),
+        ("has_perm, roles", role_has_perm),
+        ("get_objects_for_user, guardian", guardian_objects),
+        ("get_objects_for_user, roles", role_objects),
+    ]:
+        seconds, queries = _measure(func, checks, iterations)
+        runs = len(checks) * iterations
+        click.echo(
+            f"  {label:<32} {seconds / runs * 1_000_000:9.1f} us/check  "
+            f"{queries / runs:5.2f} queries/check"
+        )
+
+
+def _collect_checks(users: int) -> list[_Check]:
+    """One check per permission each sampled user's object roles grant."""
+    assignments = ObjectRoleAssignment.objects.filter(is_active=True).select_related(
+        "content_type"
+    )
+    user_ids = list(
+        assignments.order_by("user_id")
+        .values_list("user_id", flat=True)
+        .distinct()[:users]
+    )
+    checks: list[_Check] = []
+    for assignment in assignments.filter(user_id__in=user_ids).order_by("pk"):
+        model_class = assignment.content_type.model_class()
+        if model_class is None:
+            continue
+        obj = model_class._base_manager.filter(pk=assignment.object_id).first()
+        if obj is None:
+            continue
+        for perm in sorted(
+            get_site_permission_tables(assignment.site_id).permissions_for(
+                {assignment.role}, assignment.content_type_id
+            )
+        ):
+            checks.append(_Check(assignment.user_id, obj, perm))
+    return checks
+
+
+def _measure(
+    func: Callable[[User, _Check], object], checks: list[_Check], iterations: int
+) -> tuple[float, int]:
+    """Run ``func`` over all checks, with users reloaded per iteration.
+
+    Reloading the users discards per-request caches, so each iteration costs
+    what one request doing these checks would. Returns seconds and queries,
+    excluding the user reloads.
+    """
+    seconds = 0.0
+    queries = 0
+    user_ids = {check.user_id for check in checks}
+    for _ in range(iterations):
+        loaded = User.objects.in_bulk(user_ids)
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            for check in checks:
+                func(loaded[check.user_id], check)
+            seconds += time.perf_counter() - started
+        queries += len(captured)
+    return seconds, queries
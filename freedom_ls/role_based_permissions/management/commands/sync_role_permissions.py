@@ -1,4 +1,22 @@
-"""Management command to sync guardian permissions with role assignments."""
+"""Management command to sync guardian permissions with role assignments.
+
+Object role assignments are partitioned per site into their (user, content
+type, object id) pairs, which are synced in sorted chunks. Every assignment of
+a pair lands in the same chunk, so no two chunks write the same guardian rows.
+Each chunk computes its diffs with bulk_sync_user_object_permissions. With
+``--workers`` greater than 1 the chunks are spread over a process pool. With
+``--checkpoint`` the last pair completed for each site is recorded after every
+chunk, so an interrupted run picks up where it stopped.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TypedDict
 
 import djclick as click
 from guardian.models import GroupObjectPermission, UserObjectPermission
@@ -6,7 +24,14 @@ from guardian.models import GroupObjectPermission, UserObjectPermission
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
+from django.db import connections
+from django.db.models import Model
 
+from freedom_ls.accounts.models import User
+from freedom_ls.role_based_permissions.compiled import (
+    clear_permission_tables,
+    compile_permission_tables,
+)
 from freedom_ls.role_based_permissions.config import config
 from freedom_ls.role_based_permissions.loader import get_role_config, load_base_config
 from freedom_ls.role_based_permissions.models import (
@@ -15,7 +40,8 @@ from freedom_ls.role_based_permissions.models import (
     SystemRoleAssignment,
 )
 from freedom_ls.role_based_permissions.types import SiteRolesConfig
-from freedom_ls.role_based_permissions.utils import sync_user_object_permissions
+from freedom_ls.role_based_permissions.utils import bulk_sync_user_object_permissions
+from freedom_ls.site_aware_models.registry import get_site_by_id
 
 
 @click.command()
@@ -30,7 +56,35 @@ from freedom_ls.role_based_permissions.utils import sync_user_object_permissions
     default=None,
     help="Site name to load config for. Falls back to base config if not specified.",
 )
-def command(dry_run: bool, report_orphans: bool, site: str | None) -> None:
+@click.option(
+    "--chunk-size",
+    default=500,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="(user, object) pairs synced per chunk.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Processes to sync chunks in. 1 syncs in this process.",
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="File recording progress per site. An existing file resumes the run; "
+    "it is removed once the run completes.",
+)
+def command(
+    dry_run: bool,
+    report_orphans: bool,
+    site: str | None,
+    chunk_size: int,
+    workers: int,
+    checkpoint: Path | None,
+) -> None:
     """Sync guardian permissions with role assignments and detect drift."""
     role_config = get_role_config(site) if site else load_base_config()
 
@@ -39,7 +93,7 @@ def command(dry_run: bool, report_orphans: bool, site: str | None) -> None:
 
     # Phase 2: Sync ObjectRoleAssignments
     drifted = 0
-    drifted += _sync_object_assignments(dry_run)
+    drifted += _sync_object_assignments(dry_run, chunk_size, workers, checkpoint)
 
     # Phase 3: Sync SiteRoleAssignments
     drifted += _sync_site_assignments(dry_run)
@@ -55,19 +109,16 @@ def command(dry_run: bool, report_orphans: bool, site: str | None) -> None:
     prefix = "[DRY RUN] " if dry_run else ""
     click.echo(f"{prefix}{drifted} drifted assignment(s) found.")
 
+    if checkpoint is not None and not dry_run:
+        checkpoint.unlink(missing_ok=True)
+
 
 def _ensure_permissions_exist(role_config: SiteRolesConfig) -> None:
     """Ensure all permissions in config exist in auth_permission table."""
-    for perm_string in role_config.all_permission_strings():
+    created = False
+    for perm_string in sorted(compile_permission_tables(role_config).missing):
         app_label, codename = perm_string.split(".", 1)
 
-        exists = Permission.objects.filter(
-            content_type__app_label=app_label,
-            codename=codename,
-        ).exists()
-        if exists:
-            continue
-
         # Try to find a matching ContentType. First attempt: derive model name
         # from Django's default pattern (action_modelname, e.g. "view_cohort" -> "cohort").
         # Note: this heuristic fails for multi-word model names (e.g. "view_cohort_membership"
@@ -92,73 +143,215 @@ def _ensure_permissions_exist(role_config: SiteRolesConfig) -> None:
             codename=codename,
             name=f"Can {codename.replace('_', ' ')}",
         )
+        created = True
 
+    if created:
+        clear_permission_tables()
 
-def _sync_object_assignments(dry_run: bool) -> int:
-    """Sync guardian perms for all active ObjectRoleAssignments. Returns drift count."""
-    drifted = 0
-    pairs_seen: set[tuple[int, int, str]] = set()
 
-    for assignment in (
-        ObjectRoleAssignment.objects.filter(is_active=True)
-        .select_related("user", "content_type", "site")
-        .iterator()
-    ):
-        pair_key = (
-            assignment.user_id,
-            assignment.content_type_id,
-            assignment.object_id,
-        )
-        if pair_key in pairs_seen:
-            continue
-        pairs_seen.add(pair_key)
+# A (user id, content type id, object id) pair; lists, not tuples, so that
+# they round-trip through the JSON checkpoint unchanged.
+_Pair = list[int | str]
+
 
-        model_class = assignment.content_type.model_class()
+class _ChunkResult(TypedDict):
+    site_id: int
+    last_pair: _Pair
+    processed: int
+    drifted: int
+    warnings: list[str]
+
+
+def _sync_object_chunk(site_id: int, pairs: list[_Pair], dry_run: bool) -> _ChunkResult:
+    """Sync guardian perms for one chunk of (user, object) pairs on one site.
+
+    Runs in a worker process when --workers is above 1, so it only takes and
+    returns plain data.
+    """
+    users = User.objects.in_bulk({user_id for user_id, _, _ in pairs})
+
+    # Load target objects with one query per content type.
+    # Use _base_manager to avoid site-filtering from SiteAwareModel's default manager
+    ids_by_ct: dict[int, set[str]] = {}
+    for _, ct_id, object_id in pairs:
+        ids_by_ct.setdefault(int(ct_id), set()).add(str(object_id))
+    targets: dict[tuple[int, str], Model] = {}
+    for ct_id, object_ids in ids_by_ct.items():
+        model_class = ContentType.objects.get_for_id(ct_id).model_class()
         if model_class is None:
             continue
-        try:
-            # Use _base_manager to avoid site-filtering from SiteAwareModel's default manager
-            obj = model_class._base_manager.get(pk=assignment.object_id)
-        except model_class.DoesNotExist:
-            click.echo(
-                f"Warning: Target object "
-                f"{assignment.content_type}:{assignment.object_id} "
-                f"not found, skipping.",
-                err=True,
+        for target in model_class._base_manager.filter(pk__in=object_ids):
+            targets[(ct_id, str(target.pk))] = target
+
+    warnings: list[str] = []
+    to_sync: list[tuple[User, Model]] = []
+    for user_id, ct_id, object_id in pairs:
+        ct = ContentType.objects.get_for_id(int(ct_id))
+        if ct.model_class() is None:
+            continue
+        obj = targets.get((ct.pk, str(object_id)))
+        if obj is None:
+            warnings.append(
+                f"Warning: Target object {ct}:{object_id} not found, skipping."
             )
             continue
+        to_sync.append((users[int(user_id)], obj))
 
-        result = sync_user_object_permissions(
-            assignment.user, obj, dry_run=dry_run, site_name=assignment.site.name
+    drifted = 0
+    site = get_site_by_id(site_id)
+    if to_sync and site is not None:
+        results = bulk_sync_user_object_permissions(
+            to_sync, dry_run=dry_run, site_name=site.name
         )
-        if result["added"] or result["removed"]:
-            drifted += 1
+        drifted = sum(1 for result in results if result["added"] or result["removed"])
+
+    return {
+        "site_id": site_id,
+        "last_pair": pairs[-1],
+        "processed": len(pairs),
+        "drifted": drifted,
+        "warnings": warnings,
+    }
+
+
+def _load_checkpoint(path: Path | None) -> dict[str, _Pair]:
+    """Return the last completed pair per site id, if resuming."""
+    if path is None or not path.exists():
+        return {}
+    loaded: dict[str, _Pair] = json.loads(path.read_text())
+    return loaded
+
+
+def _save_checkpoint(path: Path, done: dict[str, _Pair]) -> None:
+    """Write the checkpoint atomically so an interrupted write cannot corrupt it."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(done, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
 
+
+def _pair_sort_key(pair: Sequence[int | str]) -> tuple[int, int, str]:
+    user_id, ct_id, object_id = pair
+    return int(user_id), int(ct_id), str(object_id)
+
+
+def _sync_object_assignments(
+    dry_run: bool, chunk_size: int, workers: int, checkpoint: Path | None
+) -> int:
+    """Sync guardian perms for all active ObjectRoleAssignments. Returns drift count."""
+    done = _load_checkpoint(checkpoint)
+    active = ObjectRoleAssignment.objects.filter(is_active=True)
+
+    # Per-site partitions, each an ordered list of chunks of pairs. Pairs are
+    # sorted here rather than by the database, so the order a checkpoint
+    # refers to does not depend on the database collation.
+    chunks: dict[int, list[list[_Pair]]] = {}
+    for site_id in (
+        active.order_by("site_id").values_list("site_id", flat=True).distinct()
+    ):
+        site_pairs = sorted(
+            set(
+                active.filter(site_id=site_id).values_list(
+                    "user_id", "content_type_id", "object_id"
+                )
+            ),
+            key=_pair_sort_key,
+        )
+        if str(site_id) in done:
+            last_done = _pair_sort_key(done[str(site_id)])
+            site_pairs = [
+                pair for pair in site_pairs if _pair_sort_key(pair) > last_done
+            ]
+        pairs: list[_Pair] = [list(pair) for pair in site_pairs]
+        chunks[site_id] = [
+            pairs[start : start + chunk_size]
+            for start in range(0, len(pairs), chunk_size)
+        ]
+
+    totals = {
+        site_id: sum(map(len, site_chunks)) for site_id, site_chunks in chunks.items()
+    }
+    total = sum(totals.values())
+    if done:
+        click.echo(f"Resuming from checkpoint: {total} pair(s) left.")
+
+    processed_by_site = dict.fromkeys(chunks, 0)
+    completed: dict[int, list[_Pair]] = {site_id: [] for site_id in chunks}
+    drifted = 0
+    started = time.monotonic()
+    for result in _run_chunks(chunks, dry_run, workers):
+        site_id = result["site_id"]
+        for warning in result["warnings"]:
+            click.echo(warning, err=True)
+        drifted += result["drifted"]
+        processed_by_site[site_id] += result["processed"]
+
+        # Chunks may finish out of order; only checkpoint a site's prefix of
+        # completed chunks, so resuming never skips an unfinished one.
+        completed[site_id].append(result["last_pair"])
+        site_chunks = chunks[site_id]
+        while site_chunks and site_chunks[0][-1] in completed[site_id]:
+            done[str(site_id)] = site_chunks.pop(0)[-1]
+        if checkpoint is not None and not dry_run:
+            _save_checkpoint(checkpoint, done)
+
+        elapsed = time.monotonic() - started
+        processed = sum(processed_by_site.values())
+        site_obj = get_site_by_id(site_id)
+        click.echo(
+            f"  {site_obj.name if site_obj else site_id}: "
+            f"{processed_by_site[site_id]}/{totals[site_id]} pair(s); "
+            f"total {processed}/{total} "
+            f"({processed / elapsed if elapsed else 0:.0f}/s)"
+        )
+
+    elapsed = time.monotonic() - started
+    click.echo(
+        f"Synced {total} (user, object) pair(s) across {len(chunks)} site(s) "
+        f"in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.0f}/s)."
+    )
     return drifted
 
 
+def _run_chunks(
+    chunks: dict[int, list[list[_Pair]]], dry_run: bool, workers: int
+) -> Iterator[_ChunkResult]:
+    """Sync every chunk, in this process or a pool, yielding results as they finish."""
+    tasks = [
+        (site_id, chunk)
+        for site_id, site_chunks in chunks.items()
+        for chunk in site_chunks
+    ]
+    if workers == 1 or len(tasks) <= 1:
+        for site_id, chunk in tasks:
+            yield _sync_object_chunk(site_id, chunk, dry_run)
+        return
+
+    # Forked workers must open their own database connections.
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as pool:
+        futures = [
+            pool.submit(_sync_object_chunk, site_id, chunk, dry_run)
+            for site_id, chunk in tasks
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
 def _sync_site_assignments(dry_run: bool) -> int:
     """Sync guardian perms for all active SiteRoleAssignments. Returns drift count."""
-    drifted = 0
-    pairs_seen: set[tuple[int, int]] = set()
-
+    pairs: dict[tuple[int, int], tuple[User, Site]] = {}
     for assignment in (
         SiteRoleAssignment.objects.filter(is_active=True)
         .select_related("user", "site")
         .iterator()
     ):
         pair_key = (assignment.user_id, assignment.site_id)
-        if pair_key in pairs_seen:
-            continue
-        pairs_seen.add(pair_key)
+        pairs.setdefault(pair_key, (assignment.user, assignment.site))
 
-        result = sync_user_object_permissions(
-            assignment.user, assignment.site, dry_run=dry_run
-        )
-        if result["added"] or result["removed"]:
-            drifted += 1
-
-    return drifted
+    results = bulk_sync_user_object_permissions(pairs.values(), dry_run=dry_run)
+    return sum(1 for result in results if result["added"] or result["removed"])
 
 
 def _validate_system_assignments() -> None:
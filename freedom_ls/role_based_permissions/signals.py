@@ -0,0 +1,59 @@
+"""Invalidate cached accessible object ids on direct guardian writes.
+
+``sync_user_object_permissions`` invalidates explicitly; these receivers cover
+permissions assigned with guardian's own helpers and group membership changes.
+Compiled permission tables are dropped after ``migrate``, which may add
+Permission rows.
+"""
+
+from __future__ import annotations
+
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from freedom_ls.role_based_permissions.access import invalidate_accessible_objects
+from freedom_ls.role_based_permissions.compiled import clear_permission_tables
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=UserObjectPermission)
+@receiver(post_delete, sender=UserObjectPermission)
+def user_object_permission_changed(
+    sender: type[UserObjectPermission], instance: UserObjectPermission, **kwargs
+) -> None:
+    invalidate_accessible_objects(instance.user)
+
+
+@receiver(post_save, sender=GroupObjectPermission)
+@receiver(post_delete, sender=GroupObjectPermission)
+def group_object_permission_changed(
+    sender: type[GroupObjectPermission], instance: GroupObjectPermission, **kwargs
+) -> None:
+    invalidate_accessible_objects(
+        user_pks=User.objects.filter(groups=instance.group_id).values_list(
+            "pk", flat=True
+        )
+    )
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def user_groups_changed(sender: type, instance: object, action: str, **kwargs) -> None:
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, User):
+        invalidate_accessible_objects(instance)
+    elif kwargs["pk_set"] is not None:
+        # group.user_set changes: the affected users are in pk_set.
+        invalidate_accessible_objects(user_pks=kwargs["pk_set"])
+    else:
+        # group.user_set.clear() does not say whose membership went.
+        invalidate_accessible_objects()
+
+
+post_migrate.connect(
+    clear_permission_tables, dispatch_uid="role_based_permissions_clear_tables"
+)
@@ -0,0 +1,204 @@
+"""Tests for the cached accessible-object lookups."""
+
+from collections.abc import Generator
+from typing import cast
+
+import pytest
+from guardian.shortcuts import assign_perm, remove_perm
+from pytest_mock import MockerFixture
+
+from django.contrib.auth.models import Group
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+
+from freedom_ls.accounts.factories import UserFactory
+from freedom_ls.accounts.models import User
+from freedom_ls.role_based_permissions import access
+from freedom_ls.role_based_permissions.access import (
+    get_accessible_object_ids,
+    get_objects_for_user_cached,
+)
+from freedom_ls.role_based_permissions.loader import clear_caches
+from freedom_ls.role_based_permissions.utils import (
+    assign_object_role,
+    remove_object_role,
+)
+from freedom_ls.student_management.factories import CohortFactory
+from freedom_ls.student_management.models import Cohort
+
+VIEW_COHORT = "freedom_ls_student_management.view_cohort"
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Generator[None]:
+    """Clear the role config and the Django cache holding accessible ids."""
+    clear_caches()
+    cache.clear()
+    yield
+    clear_caches()
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _cache_across_requests(settings) -> None:
+    """Enable the cross-request layer, which is off by default."""
+    settings.FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT = 300
+
+
+@pytest.fixture(autouse=True)
+def _mock_get_current_site(mock_site_context: Site, mocker: MockerFixture) -> None:
+    mocker.patch(
+        "django.contrib.sites.models.SiteManager.get_current",
+        return_value=mock_site_context,
+    )
+
+
+def _fresh(user: User) -> User:
+    """Reload the user, as a new request would."""
+    return cast(User, User.objects.get(pk=user.pk))
+
+
+@pytest.mark.django_db
+def test_ids_are_cached_within_and_across_requests(django_assert_num_queries) -> None:
+    user = UserFactory()
+    cohort = CohortFactory()
+    assign_perm(VIEW_COHORT, user, cohort)
+
+    assert get_accessible_object_ids(user, VIEW_COHORT, Cohort) == {cohort.pk}
+    next_request_user = _fresh(user)
+    with django_assert_num_queries(0):
+        get_accessible_object_ids(user, VIEW_COHORT, Cohort)
+        get_accessible_object_ids(next_request_user, VIEW_COHORT, Cohort)
+
+
+@pytest.mark.django_db
+def test_object_role_changes_invalidate_cached_ids(
+    django_capture_on_commit_callbacks,
+) -> None:
+    user = UserFactory()
+    cohort = CohortFactory()
+    assert get_accessible_object_ids(user, VIEW_COHORT, Cohort) == frozenset()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assign_object_role(user, cohort, "instructor")
+    assert get_accessible_object_ids(_fresh(user), VIEW_COHORT, Cohort) == {cohort.pk}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        remove_object_role(user, cohort, "instructor")
+    assert get_accessible_object_ids(_fresh(user), VIEW_COHORT, Cohort) == frozenset()
+
+
+@pytest.mark.django_db
+def test_cached_ids_are_invalidated_on_commit(
+    django_capture_on_commit_callbacks,
+) -> None:
+    user = UserFactory()
+    cohort = CohortFactory()
+    get_accessible_object_ids(user, VIEW_COHORT, Cohort)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        assign_perm(VIEW_COHORT, user, cohort)
+        # Until the commit, other requests keep reading the old entry, and
+        # whatever they cache goes stale with it.
+        assert get_accessible_object_ids(_fresh(user), VIEW_COHORT, Cohort) == (
+            frozenset()
+        )
+    for callback in callbacks:
+        callback()
+
+    assert get_accessible_object_ids(_fresh(user), VIEW_COHORT, Cohort) == {cohort.pk}
+
+
+@pytest.mark.django_db
+def test_direct_guardian_and_group_changes_invalidate_cached_ids(
+    django_capture_on_commit_callbacks,
+) -> None:
+    user = UserFactory()
+    cohort = CohortFactory()
+    group = Group.objects.create(name="instructors")
+    assign_perm(VIEW_COHORT, group, cohort)
+    assert get_accessible_object_ids(user, VIEW_COHORT, Cohort) == frozenset()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.groups.add(group)
+    assert get_accessible_object_ids(_fresh(user), VIEW_COHORT, Cohort) == {cohort.pk}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        remove_perm(VIEW_COHORT, group, cohort)
+    assert get_accessible_object_ids(_fresh(user), VIEW_COHORT, Cohort) == frozenset()
+
+
+@pytest.mark.django_db
+def test_group_changes_only_invalidate_its_members(
+    django_capture_on_commit_callbacks, django_assert_num_queries
+) -> None:
+    member = UserFactory()
+    bystander = UserFactory()
+    cohort = CohortFactory()
+    group = Group.objects.create(name="instructors")
+    assign_perm(VIEW_COHORT, group, cohort)
+    for user in (member, bystander):
+        get_accessible_object_ids(user, VIEW_COHORT, Cohort)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        group.user_set.add(member)
+    with django_capture_on_commit_callbacks(execute=True):
+        assign_perm(VIEW_COHORT, group, CohortFactory())
+
+    assert len(get_accessible_object_ids(_fresh(member), VIEW_COHORT, Cohort)) == 2
+    bystander = _fresh(bystander)
+    with django_assert_num_queries(0):
+        get_accessible_object_ids(bystander, VIEW_COHORT, Cohort)
+
+
+@pytest.mark.django_db
+def test_objects_for_user_cached_matches_guardian_semantics() -> None:
+    cohorts = [CohortFactory() for _ in range(3)]
+    member = UserFactory()
+    assign_perm(VIEW_COHORT, member, cohorts[0])
+    superuser = UserFactory(superuser=True)
+    inactive = UserFactory(is_active=False)
+    assign_perm(VIEW_COHORT, inactive, cohorts[0])
+
+    assert list(get_objects_for_user_cached(member, "view_cohort", Cohort)) == [
+        cohorts[0]
+    ]
+    assert get_objects_for_user_cached(superuser, "view_cohort", Cohort).count() == 3
+    assert not get_objects_for_user_cached(inactive, "view_cohort", Cohort).exists()
+
+
+@pytest.mark.django_db
+def test_ids_are_cached_per_request_only_by_default(
+    settings, mocker: MockerFixture, django_assert_num_queries
+) -> None:
+    settings.FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT = 0
+    cache_get = mocker.spy(access.cache, "get")
+    cache_set = mocker.spy(access.cache, "set")
+    user = UserFactory()
+    cohort = CohortFactory()
+    assign_perm(VIEW_COHORT, user, cohort)
+
+    assert get_accessible_object_ids(user, VIEW_COHORT, Cohort) == {cohort.pk}
+    with django_assert_num_queries(0):
+        get_accessible_object_ids(user, VIEW_COHORT, Cohort)
+    # Without a shared cache, another process could not see invalidations.
+    assert get_accessible_object_ids(_fresh(user), VIEW_COHORT, Cohort) == {cohort.pk}
+    cache_get.assert_not_called()
+    cache_set.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_many_accessible_objects_use_guardian_subquery(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(access, "MAX_ACCESSIBLE_IDS", 1)
+    user = UserFactory()
+    cohorts = [CohortFactory() for _ in range(2)]
+    CohortFactory()
+    for cohort in cohorts:
+        assign_perm(VIEW_COHORT, user, cohort)
+
+    assert get_accessible_object_ids(user, VIEW_COHORT, Cohort) is None
+    queryset = get_objects_for_user_cached(user, "view_cohort", Cohort)
+    assert set(queryset) == set(cohorts)
+    assert "SELECT" in str(queryset.query).split("WHERE", 1)[1]
@@ -0,0 +1,184 @@
+"""Tests for RoleBasedPermissionBackend and the role-based get_objects_for_user."""
+
+from collections.abc import Generator
+
+import pytest
+from guardian.backends import ObjectPermissionBackend
+from guardian.shortcuts import get_objects_for_user as guardian_get_objects_for_user
+from pytest_mock import MockerFixture
+
+from django.contrib.sites.models import Site
+from django.db.models import Model
+
+from freedom_ls.accounts.factories import UserFactory
+from freedom_ls.accounts.models import User
+from freedom_ls.role_based_permissions.backends import (
+    RoleBasedPermissionBackend,
+    get_objects_for_user,
+)
+from freedom_ls.role_based_permissions.factories import (
+    ObjectRoleAssignmentFactory,
+    SystemRoleAssignmentFactory,
+)
+from freedom_ls.role_based_permissions.loader import clear_caches
+from freedom_ls.role_based_permissions.roles import BASE_ROLES
+from freedom_ls.role_based_permissions.types import SCOPE_SYSTEM, Role, SiteRolesConfig
+from freedom_ls.role_based_permissions.utils import (
+    assign_site_role,
+    sync_user_object_permissions,
+)
+from freedom_ls.student_management.factories import CohortFactory
+from freedom_ls.student_management.models import Cohort
+
+VIEW_COHORT = "freedom_ls_student_management.view_cohort"
+DELETE_COHORT = "freedom_ls_student_management.delete_cohort"
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Generator[None]:
+    """Clear the loader and compiled table caches between tests."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture(autouse=True)
+def _site_context(mock_site_context: Site) -> None:
+    """Serve the test site; SITE_ID stays unset, as in the project settings."""
+
+
+def _assign_object_role(user: User, cohort: Cohort, role: str) -> None:
+    """Assign ``role`` on ``cohort`` and sync its guardian rows."""
+    ObjectRoleAssignmentFactory(user=user, target_object=cohort, role=role)
+    sync_user_object_permissions(user, cohort, site_name=cohort.site.name)
+
+
+def _fresh(user: User) -> User:
+    """Reload the user, as a new request would."""
+    fresh: User = User.objects.get(pk=user.pk)
+    return fresh
+
+
+@pytest.mark.django_db
+def test_has_perm_agrees_with_guardian(mock_site_context: Site) -> None:
+    """Object and site roles grant the same permissions as the synced guardian rows."""
+    user = UserFactory()
+    cohorts = [CohortFactory() for _ in range(2)]
+    _assign_object_role(user, cohorts[0], "ta")
+    assign_site_role(user, "site_admin", site=mock_site_context)
+
+    guardian = ObjectPermissionBackend()
+    roles = RoleBasedPermissionBackend()
+    checks: list[tuple[Model, str]] = [
+        (cohort, perm) for cohort in cohorts for perm in (VIEW_COHORT, DELETE_COHORT)
+    ]
+    checks += [(mock_site_context, "sites.change_site")]
+    for obj, perm in checks:
+        assert roles.has_perm(_fresh(user), perm, obj) == guardian.has_perm(
+            _fresh(user), perm, obj
+        ), (perm, obj)
+    assert roles.has_perm(user, VIEW_COHORT, cohorts[0])
+    assert not roles.has_perm(user, DELETE_COHORT, cohorts[0])
+
+
+@pytest.mark.django_db
+def test_permissions_are_cached_on_the_user(django_assert_num_queries) -> None:
+    """Repeated checks on the same user instance reuse the first lookup."""
+    user = UserFactory()
+    cohort = CohortFactory()
+    ObjectRoleAssignmentFactory(user=user, target_object=cohort, role="ta")
+    backend = RoleBasedPermissionBackend()
+    backend.has_perm(user, VIEW_COHORT, cohort)
+
+    with django_assert_num_queries(0):
+        assert backend.has_perm(user, VIEW_COHORT, cohort)
+        assert not backend.has_perm(user, DELETE_COHORT, cohort)
+
+
+@pytest.mark.django_db
+def test_no_guardian_rows_needed() -> None:
+    """Assignments grant permissions without any synced guardian rows."""
+    user = UserFactory()
+    cohort = CohortFactory()
+    ObjectRoleAssignmentFactory(user=user, target_object=cohort, role="ta")
+    ObjectRoleAssignmentFactory(
+        user=user, target_object=CohortFactory(), role="ta", is_active=False
+    )
+
+    assert RoleBasedPermissionBackend().has_perm(user, VIEW_COHORT, cohort)
+    assert not ObjectPermissionBackend().has_perm(user, VIEW_COHORT, cohort)
+    assert list(get_objects_for_user(user, "view_cohort", Cohort)) == [cohort]
+
+
+@pytest.mark.django_db
+def test_get_objects_for_user_agrees_with_guardian() -> None:
+    """The role-based queryset matches guardian's for synced assignments."""
+    user = UserFactory()
+    cohorts = [CohortFactory() for _ in range(3)]
+    _assign_object_role(user, cohorts[0], "ta")
+    _assign_object_role(user, cohorts[2], "instructor")
+
+    for perm in (VIEW_COHORT, DELETE_COHORT):
+        assert set(get_objects_for_user(user, perm, Cohort)) == set(
+            guardian_get_objects_for_user(
+                user, perm, klass=Cohort, accept_global_perms=False
+            )
+        )
+    assert set(get_objects_for_user(user, VIEW_COHORT, Cohort)) == {
+        cohorts[0],
+        cohorts[2],
+    }
+
+
+@pytest.mark.django_db
+def test_system_roles_grant_global_permissions(settings, mocker: MockerFixture) -> None:
+    """System role permissions apply without an object and on every object."""
+    system_config = BASE_ROLES.extend(
+        {
+            "system_admin": Role(
+                display_name="System Administrator",
+                assignment_scope=SCOPE_SYSTEM,
+                permissions=frozenset({VIEW_COHORT}),
+            ),
+        }
+    )
+    assert isinstance(system_config, SiteRolesConfig)
+    mocker.patch(
+        "freedom_ls.role_based_permissions.compiled.get_role_config",
+        return_value=system_config,
+    )
+    user = UserFactory()
+    SystemRoleAssignmentFactory(user=user, role="system_admin")
+    cohorts = [CohortFactory() for _ in range(2)]
+    backend = RoleBasedPermissionBackend()
+
+    assert backend.has_perm(user, VIEW_COHORT)
+    assert backend.has_perm(user, VIEW_COHORT, cohorts[1])
+    assert get_objects_for_user(user, VIEW_COHORT, Cohort).count() == 2
+
+
+@pytest.mark.django_db
+def test_inactive_users_have_no_permissions() -> None:
+    user = UserFactory(is_active=False)
+    cohort = CohortFactory()
+    ObjectRoleAssignmentFactory(user=user, target_object=cohort, role="ta")
+
+    assert not RoleBasedPermissionBackend().has_perm(user, VIEW_COHORT, cohort)
+    assert not get_objects_for_user(user, VIEW_COHORT, Cohort).exists()
+
+
+@pytest.mark.django_db
+def test_roles_resolve_outside_a_site(mocker: MockerFixture) -> None:
+    """Without a site being served, roles use their assignment's site's config."""
+    user = UserFactory()
+    cohort = CohortFactory()
+    ObjectRoleAssignmentFactory(user=user, target_object=cohort, role="ta")
+    mocker.patch(
+        "freedom_ls.role_based_permissions.backends.get_context_site",
+        return_value=None,
+    )
+    backend = RoleBasedPermissionBackend()
+
+    assert backend.has_perm(user, VIEW_COHORT, cohort)
+    assert not backend.has_perm(user, VIEW_COHORT)
+    assert list(get_objects_for_user(user, VIEW_COHORT, Cohort)) == [cohort]
@@ -0,0 +1,81 @@
+"""Tests for the compiled role -> content type -> permission tables."""
+
+from collections.abc import Generator
+
+import pytest
+
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+
+from freedom_ls.role_based_permissions.compiled import (
+    compile_permission_tables,
+    get_permission_tables,
+)
+from freedom_ls.role_based_permissions.loader import clear_caches
+from freedom_ls.role_based_permissions.types import SCOPE_OBJECT, Role, SiteRolesConfig
+from freedom_ls.student_management.models import Cohort
+
+VIEW_COHORT = "freedom_ls_student_management.view_cohort"
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Generator[None]:
+    """Clear the loader and compiled table caches between tests."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+def _config(*permissions: str) -> SiteRolesConfig:
+    return SiteRolesConfig(
+        {
+            "reader": Role(
+                display_name="Reader",
+                permissions=frozenset(permissions),
+                assignment_scope=SCOPE_OBJECT,
+            ),
+        }
+    )
+
+
+@pytest.mark.django_db
+def test_expands_roles_per_content_type(django_assert_num_queries) -> None:
+    """Permissions are grouped under the content type they exist on."""
+    cohort_ct = ContentType.objects.get_for_model(Cohort)
+    site_ct = ContentType.objects.get_for_model(Site)
+
+    with django_assert_num_queries(1):
+        tables = compile_permission_tables(
+            _config(VIEW_COHORT, "freedom_ls_student_management.no_such_perm")
+        )
+
+    assert tables.permissions_for({"reader", "unknown_role"}, cohort_ct.pk) == {
+        VIEW_COHORT
+    }
+    assert tables.permissions_for({"reader"}, site_ct.pk) == set()
+    assert tables.permission_ids[(cohort_ct.pk, VIEW_COHORT)] == (
+        Permission.objects.get(content_type=cohort_ct, codename="view_cohort").pk
+    )
+    assert tables.missing == {"freedom_ls_student_management.no_such_perm"}
+
+
+@pytest.mark.django_db
+def test_tables_are_shared_by_sites_using_the_same_module(
+    settings, django_assert_num_queries
+) -> None:
+    """Sites without their own module share the base tables, compiled once."""
+    settings.FREEDOMLS_PERMISSIONS_MODULES = {}
+    tables = get_permission_tables("SiteA")
+
+    with django_assert_num_queries(0):
+        assert get_permission_tables("SiteB") is tables
+        assert get_permission_tables("SiteA") is tables
+
+
+@pytest.mark.django_db
+def test_clear_caches_recompiles_tables() -> None:
+    """Clearing caches drops compiled tables, e.g. once Permissions were added."""
+    tables = get_permission_tables("SiteA")
+    clear_caches()
+    assert get_permission_tables("SiteA") is not tables
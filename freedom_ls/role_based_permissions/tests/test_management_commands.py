@@ -1,18 +1,21 @@
 """Tests for role_based_permissions management commands."""
 
+import json
 from collections.abc import Generator
-from contextlib import redirect_stdout
+from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from click import ClickException
 from guardian.models import GroupObjectPermission, UserObjectPermission
-from guardian.shortcuts import assign_perm
+from guardian.shortcuts import assign_perm, get_perms
 from pytest_mock import MockerFixture
 
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
+from django.core.exceptions import ImproperlyConfigured
 from django.core.management import call_command
 
 from freedom_ls.accounts.factories import UserFactory
@@ -21,8 +24,12 @@ from freedom_ls.role_based_permissions.factories import (
     SystemRoleAssignmentFactory,
 )
 from freedom_ls.role_based_permissions.loader import clear_caches, get_role_config
+from freedom_ls.role_based_permissions.management.commands import (
+    sync_role_permissions,
+)
 from freedom_ls.role_based_permissions.models import ObjectRoleAssignment
 from freedom_ls.role_based_permissions.types import SCOPE_SITE, Role, SiteRolesConfig
+from freedom_ls.role_based_permissions.utils import assign_object_role
 from freedom_ls.student_management.factories import CohortFactory
 
 
@@ -189,6 +196,124 @@ class TestSyncRolePermissionsReportOrphans:
 # ============================================================
 
 
+class TestSyncRolePermissionsChunkedResume:
+    """Test chunked sync with checkpoints."""
+
+    @pytest.mark.django_db
+    def test_chunks_sync_all_assignments_and_report_progress(self) -> None:
+        """Every assignment is synced when split into chunks, with progress output."""
+        user = UserFactory()
+        cohorts = [CohortFactory() for _ in range(3)]
+        for cohort in cohorts:
+            ObjectRoleAssignmentFactory(user=user, target_object=cohort, role="ta")
+
+        out = _call_sync("--chunk-size", "2")
+
+        assert all("view_cohort" in get_perms(user, cohort) for cohort in cohorts)
+        assert "2/3 pair(s)" in out
+        assert "3/3 pair(s)" in out
+        assert "3 drifted" in out
+
+    @pytest.mark.django_db
+    def test_assignments_of_one_pair_share_a_chunk(self) -> None:
+        """Several roles on the same object are synced together, once."""
+        user = UserFactory()
+        cohort = CohortFactory()
+        for role in ("ta", "instructor"):
+            ObjectRoleAssignmentFactory(user=user, target_object=cohort, role=role)
+
+        out = _call_sync("--chunk-size", "1")
+
+        assert "1/1 pair(s)" in out
+        assert "1 drifted" in out
+
+    @pytest.mark.django_db
+    def test_interrupted_run_resumes_from_checkpoint(self, tmp_path: Path) -> None:
+        """A failed chunk leaves a checkpoint; the next run skips completed chunks."""
+        checkpoint = tmp_path / "sync.json"
+        user = UserFactory()
+        cohorts = [CohortFactory() for _ in range(3)]
+        for cohort in cohorts:
+            ObjectRoleAssignmentFactory(user=user, target_object=cohort, role="ta")
+        cohort_ct = ContentType.objects.get_for_model(cohorts[0])
+        first_pair = [user.pk, cohort_ct.pk, min(str(cohort.pk) for cohort in cohorts)]
+
+        real_sync_chunk = sync_role_permissions._sync_object_chunk
+        calls: list[list] = []
+
+        def fail_after_first_chunk(site_id, pairs, dry_run):
+            calls.append(pairs)
+            if len(calls) > 1:
+                raise RuntimeError("interrupted")
+            return real_sync_chunk(site_id, pairs, dry_run)
+
+        with (
+            patch.object(
+                sync_role_permissions,
+                "_sync_object_chunk",
+                side_effect=fail_after_first_chunk,
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            _call_sync("--chunk-size", "1", "--checkpoint", str(checkpoint))
+
+        assert list(json.loads(checkpoint.read_text()).values()) == [first_pair]
+
+        out = _call_sync("--chunk-size", "1", "--checkpoint", str(checkpoint))
+
+        assert "Resuming from checkpoint: 2 pair(s) left." in out
+        assert "2 drifted" in out
+        assert not checkpoint.exists()
+        assert all("view_cohort" in get_perms(user, cohort) for cohort in cohorts)
+
+    # transaction=True so the forked workers (separate connections) see the
+    # committed assignments.
+    @pytest.mark.django_db(transaction=True)
+    def test_workers_sync_pairs_with_several_roles(self) -> None:
+        """Pairs whose roles would straddle chunks are synced by one worker."""
+        users = [UserFactory() for _ in range(2)]
+        cohorts = [CohortFactory() for _ in range(2)]
+        for user in users:
+            for cohort in cohorts:
+                for role in ("ta", "instructor"):
+                    ObjectRoleAssignmentFactory(
+                        user=user, target_object=cohort, role=role
+                    )
+
+        out = _call_sync("--chunk-size", "1", "--workers", "2")
+
+        assert "4/4 pair(s)" in out
+        assert "4 drifted" in out
+        for user in users:
+            for cohort in cohorts:
+                assert "view_cohort" in get_perms(user, cohort)
+
+
+class TestBenchmarkRolePermissions:
+    """Test the guardian vs role backend benchmark command."""
+
+    @pytest.mark.django_db
+    def test_reports_both_paths(self, mocker: MockerFixture) -> None:
+        """The benchmark runs both paths over synced assignments and agrees."""
+        user = UserFactory()
+        cohort = CohortFactory()
+        assign_object_role(user, cohort, "ta")
+        # The command must not need SITE_ID, which the project does not set.
+        mocker.patch(
+            "django.contrib.sites.models.SiteManager.get_current",
+            side_effect=ImproperlyConfigured,
+        )
+
+        out = StringIO()
+        err = StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            call_command("benchmark_role_permissions", "--iterations", "1")
+
+        assert "has_perm, guardian" in out.getvalue()
+        assert "get_objects_for_user, roles" in out.getvalue()
+        assert "disagree" not in err.getvalue()
+
+
 class TestValidateRolePermissionsValidConfig:
     """Test validate command with valid config."""
 
@@ -8,13 +8,17 @@ from pytest_mock import MockerFixture
 
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 
 from freedom_ls.accounts.factories import UserFactory
+from freedom_ls.accounts.models import User
+from freedom_ls.role_based_permissions.access import get_accessible_object_ids
+from freedom_ls.role_based_permissions.compiled import get_permission_tables
 from freedom_ls.role_based_permissions.factories import (
     ObjectRoleAssignmentFactory,
     SiteRoleAssignmentFactory,
 )
-from freedom_ls.role_based_permissions.loader import clear_caches, get_role_config
+from freedom_ls.role_based_permissions.loader import clear_caches
 from freedom_ls.role_based_permissions.models import (
     ObjectRoleAssignment,
     SiteRoleAssignment,
@@ -24,6 +28,10 @@ from freedom_ls.role_based_permissions.utils import (
     assign_object_role,
     assign_site_role,
     assign_system_role,
+    bulk_assign_object_roles,
+    bulk_assign_site_roles,
+    bulk_remove_object_roles,
+    bulk_sync_user_object_permissions,
     check_role_name_in_config,
     get_cohort_roles,
     get_object_roles,
@@ -33,6 +41,7 @@ from freedom_ls.role_based_permissions.utils import (
     sync_user_object_permissions,
 )
 from freedom_ls.student_management.factories import CohortFactory
+from freedom_ls.student_management.models import Cohort
 
 
 @pytest.fixture(autouse=True)
@@ -267,8 +276,8 @@ class TestSyncUserObjectPermissionsSiteConfig:
     ) -> None:
         """When syncing a Site object, config is loaded for that site's name."""
         spy = mocker.patch(
-            "freedom_ls.role_based_permissions.utils.get_role_config",
-            wraps=get_role_config,
+            "freedom_ls.role_based_permissions.utils.get_permission_tables",
+            wraps=get_permission_tables,
         )
         user = UserFactory()
         sync_user_object_permissions(user, mock_site_context)
@@ -280,14 +289,179 @@ class TestSyncUserObjectPermissionsSiteConfig:
     ) -> None:
         """Explicit site_name parameter takes precedence."""
         spy = mocker.patch(
-            "freedom_ls.role_based_permissions.utils.get_role_config",
-            wraps=get_role_config,
+            "freedom_ls.role_based_permissions.utils.get_permission_tables",
+            wraps=get_permission_tables,
         )
         user = UserFactory()
         sync_user_object_permissions(user, mock_site_context, site_name="custom_site")
         spy.assert_called_once_with("custom_site")
 
 
+class TestBulkRoleFunctions:
+    """Tests for the bulk role assignment and permission sync functions."""
+
+    @pytest.mark.django_db
+    def test_bulk_assign_matches_single_assignment(self) -> None:
+        """Bulk assignment creates the same assignments and perms as assign_object_role."""
+        user = UserFactory()
+        other = UserFactory()
+        cohorts = [CohortFactory() for _ in range(3)]
+        assign_object_role(other, cohorts[0], "instructor")
+
+        assignments = bulk_assign_object_roles(
+            [(user, cohort, "instructor") for cohort in cohorts]
+            + [(user, cohorts[0], "ta")]
+        )
+
+        assert [a.role for a in assignments] == ["instructor"] * 3 + ["ta"]
+        assert all(a.is_active and a.pk for a in assignments)
+        for cohort in cohorts:
+            assert get_object_roles(user, cohort) >= {"instructor"}
+            assert set(get_perms(user, cohort)) == set(get_perms(other, cohorts[0]))
+
+    @pytest.mark.django_db
+    def test_bulk_assign_reactivates_and_updates_assigned_by(self) -> None:
+        """Existing inactive assignments are reactivated rather than duplicated."""
+        user: User = UserFactory()
+        admin = UserFactory()
+        cohort: Cohort = CohortFactory()
+        existing = ObjectRoleAssignmentFactory(
+            user=user, target_object=cohort, role="instructor", is_active=False
+        )
+
+        [assignment] = bulk_assign_object_roles(
+            [(user, cohort, "instructor")], assigned_by=admin
+        )
+
+        assert assignment.pk == existing.pk
+        existing.refresh_from_db()
+        assert existing.is_active is True
+        assert existing.assigned_by == admin
+        assert ObjectRoleAssignment.objects.filter(user=user).count() == 1
+
+    @pytest.mark.django_db
+    def test_bulk_assign_does_not_load_existing_assigners(
+        self, django_assert_max_num_queries
+    ) -> None:
+        """Unchanged assignments are recognised without fetching assigned_by."""
+        user = UserFactory()
+        admin = UserFactory()
+        cohorts = [CohortFactory() for _ in range(10)]
+        grants = [(user, cohort, "instructor") for cohort in cohorts]
+        bulk_assign_object_roles(grants, assigned_by=admin)
+        user = User.objects.get(pk=user.pk)
+        ContentType.objects.get_for_model(cohorts[0])
+
+        with django_assert_max_num_queries(5):
+            bulk_assign_object_roles(
+                [(user, cohort, "instructor") for cohort in cohorts],
+                assigned_by=admin,
+            )
+
+    @pytest.mark.django_db
+    def test_bulk_assign_invalidates_accessible_ids_on_commit(
+        self, settings, django_capture_on_commit_callbacks
+    ) -> None:
+        """The cached ids are only dropped once the whole bulk write commits."""
+        settings.FREEDOMLS_ACCESSIBLE_OBJECTS_CACHE_TIMEOUT = 300
+        cache.clear()
+        view_cohort = "freedom_ls_student_management.view_cohort"
+        user: User = UserFactory()
+        cohort: Cohort = CohortFactory()
+        assert get_accessible_object_ids(user, view_cohort, Cohort) == frozenset()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            bulk_assign_object_roles([(user, cohort, "instructor")])
+            fresh = User.objects.get(pk=user.pk)
+            assert get_accessible_object_ids(fresh, view_cohort, Cohort) == frozenset()
+        for callback in callbacks:
+            callback()
+
+        fresh = User.objects.get(pk=user.pk)
+        assert get_accessible_object_ids(fresh, view_cohort, Cohort) == {cohort.pk}
+
+    @pytest.mark.django_db
+    def test_bulk_assign_rejects_site_scoped_role(self) -> None:
+        """Scope enforcement applies to every grant, before anything is written."""
+        user: User = UserFactory()
+        cohort: Cohort = CohortFactory()
+        with pytest.raises(ValueError, match="assignment_scope='site'"):
+            bulk_assign_object_roles(
+                [(user, cohort, "instructor"), (user, cohort, "site_admin")]
+            )
+        assert not ObjectRoleAssignment.objects.filter(user=user).exists()
+
+    @pytest.mark.django_db
+    def test_bulk_remove_keeps_other_roles(self) -> None:
+        """Removing one role in bulk keeps perms granted by the remaining roles."""
+        user = UserFactory()
+        cohorts = [CohortFactory() for _ in range(2)]
+        bulk_assign_object_roles(
+            [
+                (user, cohort, role)
+                for cohort in cohorts
+                for role in ("instructor", "ta")
+            ]
+        )
+
+        bulk_remove_object_roles([(user, cohort, "instructor") for cohort in cohorts])
+
+        for cohort in cohorts:
+            assert get_object_roles(user, cohort) == {"ta"}
+            assert "view_cohort" in get_perms(user, cohort)
+
+    @pytest.mark.django_db
+    def test_bulk_sync_matches_single_sync(self) -> None:
+        """bulk_sync_user_object_permissions reports the same diff as the single sync."""
+        user: User = UserFactory()
+        cohort: Cohort = CohortFactory()
+        ObjectRoleAssignmentFactory(user=user, target_object=cohort, role="instructor")
+
+        [dry] = bulk_sync_user_object_permissions([(user, cohort)], dry_run=True)
+        assert get_perms(user, cohort) == []
+        expected = sync_user_object_permissions(user, cohort, dry_run=True)
+        assert dry["added"] == expected["added"]
+
+        bulk_sync_user_object_permissions([(user, cohort)])
+        [second] = bulk_sync_user_object_permissions([(user, cohort)])
+        assert second["added"] == second["removed"] == set()
+
+    @pytest.mark.django_db
+    def test_bulk_sync_query_count_does_not_grow_with_pairs(
+        self, django_assert_max_num_queries
+    ) -> None:
+        """Syncing many cohorts costs a fixed number of queries."""
+        user = UserFactory()
+        cohorts = [CohortFactory() for _ in range(10)]
+        for cohort in cohorts:
+            ObjectRoleAssignmentFactory(
+                user=user, target_object=cohort, role="instructor"
+            )
+        ContentType.objects.get_for_model(cohorts[0])
+
+        with django_assert_max_num_queries(8):
+            bulk_sync_user_object_permissions([(user, cohort) for cohort in cohorts])
+        assert all("view_cohort" in get_perms(user, cohort) for cohort in cohorts)
+
+    @pytest.mark.django_db
+    def test_bulk_assign_site_roles(self, mock_site_context: Site) -> None:
+        """bulk_assign_site_roles assigns the role on the current site and syncs perms."""
+        users = [UserFactory() for _ in range(3)]
+        single = UserFactory()
+        assign_site_role(single, "site_admin")
+
+        assignments = bulk_assign_site_roles([(user, "site_admin") for user in users])
+
+        assert all(a.site == mock_site_context for a in assignments)
+        for user in users:
+            assert SiteRoleAssignment.objects.filter(
+                user=user, role="site_admin", is_active=True
+            ).exists()
+            assert set(get_perms(user, mock_site_context)) == set(
+                get_perms(single, mock_site_context)
+            )
+
+
 class TestSiteRoleFunctions:
     """Tests for assign_site_role and remove_site_role."""
 
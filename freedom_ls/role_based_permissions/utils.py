@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, TypedDict
 
 from guardian.models import UserObjectPermission
 from guardian.shortcuts import assign_perm, remove_perm
 
-from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
 from django.db import transaction
-from django.db.models import Model
+from django.db.models import Model, Q
 
+from freedom_ls.role_based_permissions.access import invalidate_accessible_objects
+from freedom_ls.role_based_permissions.compiled import get_permission_tables
 from freedom_ls.role_based_permissions.loader import get_role_config
 from freedom_ls.role_based_permissions.types import AssignmentScope
 
@@ -26,11 +28,6 @@ from freedom_ls.role_based_permissions.models import (
 )
 
 
-def clear_permission_cache() -> None:
-    """Clear the permission codename cache. Intended for use in tests."""
-    _get_valid_codenames_for_content_type.cache_clear()
-
-
 class SyncResult(TypedDict):
     user: int
     object: str
@@ -107,36 +104,6 @@ def _get_guardian_perms_as_full_strings(user: User, obj: Model) -> set[str]:
     return {f"{app_label}.{codename}" for app_label, codename in tuples}
 
 
-@lru_cache(maxsize=64)
-def _get_valid_codenames_for_content_type(ct_pk: int) -> frozenset[str]:
-    """Return the set of valid permission codenames for a content type pk.
-
-    Cached to avoid repeated DB queries for the same content type.
-    """
-    return frozenset(
-        Permission.objects.filter(content_type_id=ct_pk).values_list(
-            "codename", flat=True
-        )
-    )
-
-
-def _filter_perms_for_content_type(perms: set[str], ct: ContentType) -> set[str]:
-    """Filter permission strings to only those matching the given content type.
-
-    Guardian requires that a permission's content_type matches the object's
-    content_type when using assign_perm/remove_perm and when querying with
-    get_perms/get_objects_for_user. This filters out permissions that belong
-    to a different model's content type.
-    """
-    valid_codenames = _get_valid_codenames_for_content_type(ct.pk)
-    result = set()
-    for perm in perms:
-        app_label, codename = perm.split(".", 1)
-        if app_label == ct.app_label and codename in valid_codenames:
-            result.add(perm)
-    return result
-
-
 def sync_user_object_permissions(
     user: User, obj: Model, dry_run: bool = False, site_name: str | None = None
 ) -> SyncResult:
@@ -144,6 +111,8 @@ def sync_user_object_permissions(
 
     Only permissions whose content type matches the object's content type
     are synced, as guardian requires this for its permission queries to work.
+    The role -> content type -> permission expansion comes from the compiled
+    PermissionTables, so it needs no queries.
 
     Args:
         site_name: Site name to load config for. If not provided, resolves
@@ -153,20 +122,15 @@ def sync_user_object_permissions(
     """
     if site_name is None and isinstance(obj, Site):
         site_name = obj.name
-    config = get_role_config(site_name)
+    tables = get_permission_tables(site_name)
 
     if isinstance(obj, Site):
         roles = _get_active_roles_for_user_on_site(user, obj)
     else:
         roles = get_object_roles(user, obj)
 
-    all_desired: set[str] = set()
-    for role_name in roles:
-        if role_name in config:
-            all_desired |= config[role_name].permissions
-
     ct = ContentType.objects.get_for_model(obj)
-    desired = _filter_perms_for_content_type(all_desired, ct)
+    desired = tables.permissions_for(roles, ct.pk)
 
     current = _get_guardian_perms_as_full_strings(user, obj)
 
@@ -179,6 +143,8 @@ def sync_user_object_permissions(
                 assign_perm(perm, user, obj)
             for perm in to_remove:
                 remove_perm(perm, user, obj)
+        if to_add or to_remove:
+            invalidate_accessible_objects(user)
 
     return {
         "user": user.pk,
@@ -189,6 +155,132 @@ def sync_user_object_permissions(
     }
 
 
+def _active_roles_by_pair(
+    ct: ContentType, pairs: list[tuple[User, Model]]
+) -> dict[tuple[int, str], set[str]]:
+    """Map (user_id, object_pk) to active role names for pairs of one content type.
+
+    Site objects read SiteRoleAssignment, everything else ObjectRoleAssignment.
+    """
+    user_ids = {user.pk for user, _ in pairs}
+    object_pks = {str(obj.pk) for _, obj in pairs}
+    rows: Iterable[tuple[int, object, str]]
+    if ct.model_class() is Site:
+        rows = SiteRoleAssignment.objects.filter(
+            user_id__in=user_ids, site_id__in=object_pks, is_active=True
+        ).values_list("user_id", "site_id", "role")
+    else:
+        rows = ObjectRoleAssignment.objects.filter(
+            user_id__in=user_ids,
+            content_type=ct,
+            object_id__in=object_pks,
+            is_active=True,
+        ).values_list("user_id", "object_id", "role")
+    roles: dict[tuple[int, str], set[str]] = defaultdict(set)
+    for user_id, object_pk, role in rows:
+        roles[(user_id, str(object_pk))].add(role)
+    return roles
+
+
+def bulk_sync_user_object_permissions(
+    pairs: Iterable[tuple[User, Model]],
+    dry_run: bool = False,
+    site_name: str | None = None,
+) -> list[SyncResult]:
+    """Sync guardian object permissions for many (user, object) pairs at once.
+
+    Gives the same result as calling sync_user_object_permissions for each
+    pair, but reads roles and current permissions with two queries per
+    content type, computes the diffs in memory, and writes them
+    with one bulk_create and one delete inside a single transaction.
+
+    Like any bulk_create this sends no post_save signals for the added rows;
+    the accessible-object cache of every changed user is invalidated here,
+    once the outermost transaction commits.
+
+    Args:
+        site_name: Site name to load config for. If not provided, resolves
+            from the object (for Site instances) or falls back to the current site.
+
+    Returns one SyncResult per distinct pair, in input order.
+    """
+    by_ct: dict[ContentType, dict[tuple[int, str], tuple[User, Model]]] = defaultdict(
+        dict
+    )
+    for user, obj in pairs:
+        ct = ContentType.objects.get_for_model(obj)
+        by_ct[ct].setdefault((user.pk, str(obj.pk)), (user, obj))
+
+    results: list[SyncResult] = []
+    to_create: list[UserObjectPermission] = []
+    to_delete: list[int] = []
+    changed_users: dict[int, User] = {}
+    for ct, ct_pairs in by_ct.items():
+        pair_list = list(ct_pairs.values())
+        roles_by_pair = _active_roles_by_pair(ct, pair_list)
+        current: dict[tuple[int, str], dict[str, int]] = defaultdict(dict)
+        for (
+            uop_id,
+            user_id,
+            object_pk,
+            app_label,
+            codename,
+        ) in UserObjectPermission.objects.filter(
+            content_type=ct,
+            user_id__in={user.pk for user, _ in pair_list},
+            object_pk__in={object_pk for _, object_pk in ct_pairs},
+        ).values_list(
+            "pk",
+            "user_id",
+            "object_pk",
+            "permission__content_type__app_label",
+            "permission__codename",
+        ):
+            current[(user_id, object_pk)][f"{app_label}.{codename}"] = uop_id
+
+        for key, (user, obj) in ct_pairs.items():
+            pair_site_name = site_name
+            if pair_site_name is None and isinstance(obj, Site):
+                pair_site_name = obj.name
+            tables = get_permission_tables(pair_site_name)
+            roles = roles_by_pair.get(key, set())
+            desired = tables.permissions_for(roles, ct.pk)
+
+            current_perms = current.get(key, {})
+            to_add = desired - current_perms.keys()
+            to_remove = current_perms.keys() - desired
+            to_create.extend(
+                UserObjectPermission(
+                    user=user,
+                    permission_id=tables.permission_ids[(ct.pk, perm)],
+                    content_type=ct,
+                    object_pk=key[1],
+                )
+                for perm in to_add
+            )
+            to_delete.extend(current_perms[perm] for perm in to_remove)
+            if to_add or to_remove:
+                changed_users[user.pk] = user
+            results.append(
+                {
+                    "user": user.pk,
+                    "object": repr(obj),
+                    "roles": list(roles),
+                    "added": to_add,
+                    "removed": to_remove,
+                }
+            )
+
+    if not dry_run and changed_users:
+        with transaction.atomic():
+            UserObjectPermission.objects.bulk_create(to_create)
+            UserObjectPermission.objects.filter(pk__in=to_delete).delete()
+        for user in changed_users.values():
+            invalidate_accessible_objects(user)
+
+    return results
+
+
 def assign_object_role(
     user: User,
     target: Model,
@@ -248,6 +340,121 @@ def remove_object_role(
     # TODO: AuditLog entry for role removal (use removed_by)
 
 
+def bulk_assign_object_roles(
+    grants: Iterable[tuple[User, Model, str]],
+    assigned_by: User | None = None,
+) -> list[ObjectRoleAssignment]:
+    """Assign object-level roles for many (user, target, role) tuples at once.
+
+    Bulk counterpart of assign_object_role: existing assignments are read
+    with one query per content type, missing ones are bulk created, inactive
+    ones reactivated, and the guardian permissions of every affected pair are
+    synced with bulk_sync_user_object_permissions, all in one transaction.
+
+    Returns the assignments in input order.
+    """
+    grants = list(grants)
+    for _, _, role in grants:
+        check_role_name_in_config(role)
+        _check_assignment_scope(role, "object")
+
+    # Compared by id so that existing assignments don't load their assigner.
+    assigned_by_id = getattr(assigned_by, "pk", None)
+    by_ct: dict[ContentType, list[tuple[User, Model, str]]] = defaultdict(list)
+    for user, target, role in grants:
+        by_ct[ContentType.objects.get_for_model(target)].append((user, target, role))
+
+    assignments: dict[tuple[int, int, str, str], ObjectRoleAssignment] = {}
+    with transaction.atomic():
+        for ct, ct_grants in by_ct.items():
+            existing = ObjectRoleAssignment.objects.filter(
+                content_type=ct,
+                user_id__in={user.pk for user, _, _ in ct_grants},
+                object_id__in={str(target.pk) for _, target, _ in ct_grants},
+                role__in={role for _, _, role in ct_grants},
+            )
+            for assignment in existing:
+                key = (
+                    assignment.user_id,
+                    ct.pk,
+                    assignment.object_id,
+                    assignment.role,
+                )
+                assignments[key] = assignment
+
+            to_create: list[ObjectRoleAssignment] = []
+            to_update: list[ObjectRoleAssignment] = []
+            for user, target, role in ct_grants:
+                key = (user.pk, ct.pk, str(target.pk), role)
+                assignment = assignments.get(key)
+                if assignment is None:
+                    assignment = ObjectRoleAssignment(
+                        user=user,
+                        content_type=ct,
+                        object_id=str(target.pk),
+                        role=role,
+                        assigned_by=assigned_by,
+                        is_active=True,
+                    )
+                    # bulk_create skips save(), which is where the site is set.
+                    assignment._set_site_from_request()
+                    assignments[key] = assignment
+                    to_create.append(assignment)
+                elif assignment not in to_update and (
+                    not assignment.is_active
+                    or assignment.assigned_by_id != assigned_by_id
+                ):
+                    assignment.is_active = True
+                    assignment.assigned_by = assigned_by
+                    to_update.append(assignment)
+            ObjectRoleAssignment.objects.bulk_create(to_create)
+            ObjectRoleAssignment.objects.bulk_update(
+                to_update, ["is_active", "assigned_by"]
+            )
+
+        bulk_sync_user_object_permissions((user, target) for user, target, _ in grants)
+    # TODO: AuditLog entries for role assignments
+    return [
+        assignments[
+            (
+                user.pk,
+                ContentType.objects.get_for_model(target).pk,
+                str(target.pk),
+                role,
+            )
+        ]
+        for user, target, role in grants
+    ]
+
+
+def bulk_remove_object_roles(
+    grants: Iterable[tuple[User, Model, str]],
+    removed_by: User | None = None,
+) -> None:
+    """Remove object-level roles for many (user, target, role) tuples at once.
+
+    Bulk counterpart of remove_object_role: deactivates the assignments with
+    one update per content type, then resyncs the affected pairs in bulk.
+    """
+    grants = list(grants)
+    for _, _, role in grants:
+        check_role_name_in_config(role)
+
+    by_ct: dict[ContentType, Q] = {}
+    for user, target, role in grants:
+        ct = ContentType.objects.get_for_model(target)
+        match = Q(user=user, object_id=str(target.pk), role=role)
+        by_ct[ct] = by_ct[ct] | match if ct in by_ct else match
+
+    with transaction.atomic():
+        for ct, match in by_ct.items():
+            ObjectRoleAssignment.objects.filter(match, content_type=ct).update(
+                is_active=False
+            )
+        bulk_sync_user_object_permissions((user, target) for user, target, _ in grants)
+    # TODO: AuditLog entries for role removals (use removed_by)
+
+
 def assign_site_role(
     user: User,
     role: str,
@@ -289,6 +496,65 @@ def assign_site_role(
     return assignment
 
 
+def bulk_assign_site_roles(
+    grants: Iterable[tuple[User, str]],
+    assigned_by: User | None = None,
+    site: Site | None = None,
+) -> list[SiteRoleAssignment]:
+    """Assign site-level roles for many (user, role) pairs on one site at once.
+
+    Bulk counterpart of assign_site_role; see bulk_assign_object_roles.
+
+    Args:
+        site: The site to assign the roles on. Defaults to the current site.
+
+    Returns the assignments in input order.
+    """
+    if site is None:
+        site = Site.objects.get_current()
+    grants = list(grants)
+    for _, role in grants:
+        check_role_name_in_config(role, site_name=site.name)
+        _check_assignment_scope(role, "site", site_name=site.name)
+
+    assigned_by_id = getattr(assigned_by, "pk", None)
+    with transaction.atomic():
+        assignments: dict[tuple[int, str], SiteRoleAssignment] = {
+            (assignment.user_id, assignment.role): assignment
+            for assignment in SiteRoleAssignment.objects.filter(
+                site=site,
+                user_id__in={user.pk for user, _ in grants},
+                role__in={role for _, role in grants},
+            )
+        }
+        to_create: list[SiteRoleAssignment] = []
+        to_update: list[SiteRoleAssignment] = []
+        for user, role in grants:
+            assignment = assignments.get((user.pk, role))
+            if assignment is None:
+                assignment = SiteRoleAssignment(
+                    user=user,
+                    site=site,
+                    role=role,
+                    assigned_by=assigned_by,
+                    is_active=True,
+                )
+                assignments[(user.pk, role)] = assignment
+                to_create.append(assignment)
+            elif assignment not in to_update and (
+                not assignment.is_active or assignment.assigned_by_id != assigned_by_id
+            ):
+                assignment.is_active = True
+                assignment.assigned_by = assigned_by
+                to_update.append(assignment)
+        SiteRoleAssignment.objects.bulk_create(to_create)
+        SiteRoleAssignment.objects.bulk_update(to_update, ["is_active", "assigned_by"])
+
+        bulk_sync_user_object_permissions((user, site) for user, _ in grants)
+    # TODO: AuditLog entries for site role assignments
+    return [assignments[(user.pk, role)] for user, role in grants]
+
+
 def remove_site_role(
     user: User,
     role: str,
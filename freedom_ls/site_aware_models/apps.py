@@ -5,3 +5,7 @@ class SiteAwareModelsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "freedom_ls.site_aware_models"
     label = "freedom_ls_site_aware_models"
+
+    def ready(self) -> None:
+        # Register the site registry invalidation receivers.
+        from . import signals  # noqa: F401
@@ -10,6 +10,7 @@ class SiteAwareModelsConfig(AppSettings):
     HEADER_TITLE: str | None
     HEADER_TITLE_STYLE: str | None
     EMAIL_LOGO_STATIC_PATH: str | None
+    SITE_REGISTRY_TIMEOUT: int
 
     declared_settings = {
         "FORCE_SITE_NAME": Setting(default=None),
@@ -18,6 +19,8 @@ class SiteAwareModelsConfig(AppSettings):
         "HEADER_TITLE": Setting(default=None),
         "HEADER_TITLE_STYLE": Setting(default=None),
         "EMAIL_LOGO_STATIC_PATH": Setting(default=None),
+        # Seconds before the process-wide site registry is reloaded.
+        "SITE_REGISTRY_TIMEOUT": Setting(default=300),
     }
 
 
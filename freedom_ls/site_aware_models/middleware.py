@@ -1,13 +1,31 @@
-from freedom_ls.site_aware_models.models import _thread_locals
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from freedom_ls.site_aware_models.models import get_cached_site, request_context
 
 
 class CurrentSiteMiddleware:
+    """Make the request the tenant context for the rest of the stack.
+
+    Works in both sync and async stacks. In async mode the site is resolved
+    up front, in a thread, so site-aware querysets built later in async code
+    find it cached on the request instead of querying from the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        _thread_locals.request = request
-        response = self.get_response(request)
-        if hasattr(_thread_locals, "request"):
-            delattr(_thread_locals, "request")
-        return response
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with request_context(request):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        await sync_to_async(get_cached_site)(request)
+        with request_context(request):
+            return await self.get_response(request)
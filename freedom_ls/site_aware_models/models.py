@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import uuid
-from threading import local
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from django.contrib.sites.models import Site
 from django.contrib.sites.requests import RequestSite
@@ -10,8 +12,15 @@ from django.db import models
 from django.http import HttpRequest
 
 from .config import config
+from .registry import get_site_by_name, get_site_names
 
-_thread_locals = local()
+# The tenant context. Context variables are per thread and per asyncio task,
+# and asgiref copies them into sync_to_async threads, so the same context is
+# seen under WSGI, ASGI and async views.
+_current_request: ContextVar[HttpRequest | None] = ContextVar(
+    "site_aware_request", default=None
+)
+_current_site: ContextVar[Site | None] = ContextVar("site_aware_site", default=None)
 
 _CACHED_SITE_ATTR = "_cached_site"
 
@@ -23,16 +32,14 @@ def get_cached_site(request: HttpRequest) -> Site | RequestSite:
         return cached
 
     force_name = config.FORCE_SITE_NAME
-    site: Site | RequestSite
+    site: Site | RequestSite | None
     if force_name:
-        try:
-            site = Site.objects.get(name=force_name)
-        except Site.DoesNotExist as err:
-            available = list(Site.objects.values_list("name", flat=True))
+        site = get_site_by_name(force_name)
+        if site is None:
             raise Site.DoesNotExist(
                 f"FORCE_SITE_NAME={force_name!r} does not match any Site. "
-                f"Available sites: {available}"
-            ) from err
+                f"Available sites: {get_site_names()}"
+            )
     else:
         site = get_current_site(request)
 
@@ -40,12 +47,58 @@ def get_cached_site(request: HttpRequest) -> Site | RequestSite:
     return site
 
 
+def get_current_request() -> HttpRequest | None:
+    """Return the request being handled in this context, if any."""
+    return _current_request.get()
+
+
+@contextmanager
+def request_context(request: HttpRequest) -> Iterator[HttpRequest]:
+    """Make ``request`` the current request, and its site the current site."""
+    token = _current_request.set(request)
+    try:
+        yield request
+    finally:
+        _current_request.reset(token)
+
+
+@contextmanager
+def site_context(site: Site) -> Iterator[Site]:
+    """Scope site-aware queries and saves to ``site`` outside a request.
+
+    For tasks, management commands and scripts::
+
+        with site_context(site):
+            Course.objects.all()  # only ``site``'s courses
+
+    Takes precedence over the current request's site, and can be nested.
+    """
+    token = _current_site.set(site)
+    try:
+        yield site
+    finally:
+        _current_site.reset(token)
+
+
+def get_context_site() -> Site | None:
+    """Return the site of the current ``site_context`` or request, if any."""
+    site = _current_site.get()
+    if site is not None:
+        return site
+    request = _current_request.get()
+    if request is None:
+        return None
+    result = get_cached_site(request)
+    # In practice, get_cached_site always returns Site when
+    # django.contrib.sites is installed (which it always is).
+    return result if isinstance(result, Site) else None
+
+
 class SiteAwareManager(models.Manager):
     def get_queryset(self):
         queryset = super().get_queryset()
-        request = getattr(_thread_locals, "request", None)
-        if request:
-            site = get_cached_site(request)
+        site = get_context_site()
+        if site is not None:
             return queryset.filter(site=site)
         return queryset
 
@@ -67,13 +120,11 @@ class SiteAwareModelBase(models.Model):
         super().full_clean(*args, **kwargs)
 
     def _set_site_from_request(self) -> None:
-        """Automatically set site from the current request if not already set."""
+        """Automatically set site from the current context if not already set."""
         if not self.site_id:
-            request = getattr(_thread_locals, "request", None)
-            if request:
-                # In practice, get_cached_site always returns Site when
-                # django.contrib.sites is installed (which it always is).
-                self.site = get_cached_site(request)  # type: ignore[assignment]
+            site = get_context_site()
+            if site is not None:
+                self.site = site
 
 
 class SiteAwareModel(SiteAwareModelBase):
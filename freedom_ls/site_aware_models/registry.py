@@ -0,0 +1,69 @@
+"""Process-wide registry of Site rows.
+
+Sites change rarely but are looked up by name on every request when
+``FORCE_SITE_NAME`` is set, and by id in management commands. The registry
+loads every Site in one query and answers those lookups from memory. Lookups
+by domain already go through Django's own process-wide ``SITE_CACHE``.
+
+The snapshot is dropped when a Site write commits in this process (see
+``signals``) and reloaded after ``SITE_REGISTRY_TIMEOUT`` seconds, so changes
+made by other processes are picked up too.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from django.contrib.sites.models import Site
+
+from .config import config
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    by_name: dict[str, Site]
+    by_id: dict[int, Site]
+    loaded_at: float
+
+
+_snapshot: _Snapshot | None = None
+
+
+def _get_snapshot() -> _Snapshot:
+    global _snapshot
+    snapshot = _snapshot
+    now = time.monotonic()
+    if snapshot is None or now - snapshot.loaded_at > config.SITE_REGISTRY_TIMEOUT:
+        sites = list(Site.objects.all())
+        snapshot = _Snapshot(
+            by_name={site.name: site for site in sites},
+            by_id={site.pk: site for site in sites},
+            loaded_at=now,
+        )
+        _snapshot = snapshot
+    return snapshot
+
+
+def get_site_by_name(name: str) -> Site | None:
+    """Return the Site with the given name, or None."""
+    return _get_snapshot().by_name.get(name)
+
+
+def get_site_by_id(site_id: int) -> Site | None:
+    """Return the Site with the given pk, or None."""
+    return _get_snapshot().by_id.get(site_id)
+
+
+def get_site_names() -> list[str]:
+    """Return the names of all sites."""
+    return list(_get_snapshot().by_name)
+
+
+def clear_site_registry(**kwargs: object) -> None:
+    """Drop the snapshot; the next lookup reloads it.
+
+    Accepts signal kwargs so it can be used as a receiver.
+    """
+    global _snapshot
+    _snapshot = None
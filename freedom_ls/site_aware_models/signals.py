@@ -0,0 +1,17 @@
+"""Keep the process-wide site registry in step with Site writes."""
+
+from __future__ import annotations
+
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .registry import clear_site_registry
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def site_changed(sender: type[Site], **kwargs) -> None:
+    # Dropped on commit: a reload before then would cache the old rows again.
+    transaction.on_commit(clear_site_registry)
@@ -24,7 +24,7 @@ class TestSiteAwareFactory:
     def test_picks_up_site_from_mock_site_context(
         self, mock_site_context: Site
     ) -> None:
-        """SiteAwareFactory subclass should automatically get site from thread-local context."""
+        """SiteAwareFactory subclass should automatically get site from the current site context."""
         user = ConcreteUserFactory()
         assert user.site == mock_site_context
 
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import pytest
+
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, override_settings
+
+from freedom_ls.accounts.factories import SiteFactory
+from freedom_ls.site_aware_models.models import get_cached_site
+from freedom_ls.site_aware_models.registry import get_site_by_id, get_site_by_name
+
+type AssertNumQueries = Callable[[int], AbstractContextManager[None]]
+
+
+@pytest.mark.django_db
+class TestSiteRegistry:
+    def test_loads_sites_once(
+        self, django_assert_num_queries: AssertNumQueries
+    ) -> None:
+        site = SiteFactory(name="RegistrySite", domain="registry.example.com")
+
+        with django_assert_num_queries(1):
+            assert get_site_by_name("RegistrySite") == site
+            assert get_site_by_id(site.pk) == site
+            assert get_site_by_name("Missing") is None
+
+    def test_site_writes_invalidate_registry_on_commit(
+        self, django_capture_on_commit_callbacks
+    ) -> None:
+        site = SiteFactory(name="Before", domain="rename.example.com")
+        assert get_site_by_name("Before") == site
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            site.name = "After"
+            site.save()
+        # Until the write commits, other threads must not reload the old row.
+        assert get_site_by_name("Before") == site
+        for callback in callbacks:
+            callback()
+        assert get_site_by_name("Before") is None
+        assert get_site_by_name("After") == site
+
+        with django_capture_on_commit_callbacks(execute=True):
+            site.delete()
+        assert get_site_by_name("After") is None
+
+    def test_timeout_reloads_registry(self, settings) -> None:
+        settings.SITE_REGISTRY_TIMEOUT = -1
+        get_site_by_name("Anything")
+        # Written without signals, as another process would.
+        Site.objects.bulk_create(
+            [Site(name="Elsewhere", domain="elsewhere.example.com")]
+        )
+        assert get_site_by_name("Elsewhere") is not None
+
+    def test_forced_site_costs_no_query_per_request(
+        self, django_assert_num_queries: AssertNumQueries
+    ) -> None:
+        forced_site = SiteFactory(name="ForcedSite", domain="forced.example.com")
+
+        with override_settings(FORCE_SITE_NAME="ForcedSite"):
+            get_cached_site(RequestFactory().get("/"))
+            with django_assert_num_queries(0):
+                assert get_cached_site(RequestFactory().get("/")) == forced_site
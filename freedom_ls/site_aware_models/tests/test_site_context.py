@@ -0,0 +1,100 @@
+"""Tests for the contextvar-based tenant context."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from django.contrib.sites.models import Site
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from freedom_ls.accounts.factories import SiteFactory
+from freedom_ls.site_aware_models.middleware import CurrentSiteMiddleware
+from freedom_ls.site_aware_models.models import (
+    get_context_site,
+    get_current_request,
+    site_context,
+)
+from freedom_ls.student_management.factories import CohortFactory
+from freedom_ls.student_management.models import Cohort
+
+
+def _request_for(site: Site) -> HttpRequest:
+    request = RequestFactory().get("/")
+    request._cached_site = site
+    return request
+
+
+@pytest.mark.django_db
+class TestSiteContext:
+    def test_scopes_queries_and_saves_outside_a_request(self) -> None:
+        site_a = SiteFactory(name="A", domain="a.example.com")
+        site_b = SiteFactory(name="B", domain="b.example.com")
+        with site_context(site_a):
+            cohort_a = CohortFactory()
+        with site_context(site_b):
+            CohortFactory()
+
+        assert cohort_a.site == site_a
+        with site_context(site_a):
+            assert list(Cohort.objects.all()) == [cohort_a]
+        assert get_context_site() is None
+        assert Cohort.objects.count() == 2
+
+    def test_nests_and_overrides_the_request_site(
+        self, mock_site_context: Site
+    ) -> None:
+        other = SiteFactory(name="Other", domain="other.example.com")
+        inner = SiteFactory(name="Inner", domain="inner.example.com")
+
+        with site_context(other):
+            with site_context(inner):
+                assert get_context_site() == inner
+            assert get_context_site() == other
+        assert get_context_site() == mock_site_context
+
+
+@pytest.mark.django_db
+class TestCurrentSiteMiddleware:
+    def test_sync_sets_context_for_the_request_only(self) -> None:
+        site = SiteFactory(name="Sync", domain="sync.example.com")
+        request = _request_for(site)
+        seen: list[Site | None] = []
+
+        def get_response(request: HttpRequest) -> HttpResponse:
+            seen.append(get_context_site())
+            return HttpResponse()
+
+        CurrentSiteMiddleware(get_response)(request)
+
+        assert seen == [site]
+        assert get_current_request() is None
+
+    def test_async_requests_do_not_share_context(self) -> None:
+        sites = [
+            SiteFactory(name=f"Async{i}", domain=f"async{i}.example.com")
+            for i in range(2)
+        ]
+        seen: dict[str, Site | None] = {}
+
+        async def get_response(request: HttpRequest) -> HttpResponse:
+            # Yield so the two requests interleave.
+            await asyncio.sleep(0)
+            seen[request.path] = get_context_site()
+            return HttpResponse()
+
+        middleware = CurrentSiteMiddleware(get_response)
+        assert asyncio.iscoroutinefunction(middleware)
+
+        async def serve_both() -> None:
+            requests = [_request_for(site) for site in sites]
+            for i, request in enumerate(requests):
+                request.path = f"/{i}/"
+            await asyncio.gather(*(middleware(request) for request in requests))
+
+        asyncio.run(serve_both())
+
+        assert seen == {"/0/": sites[0], "/1/": sites[1]}
+        assert get_current_request() is None
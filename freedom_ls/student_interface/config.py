@@ -0,0 +1,30 @@
+"""
+App-level configuration for student_interface.
+
+Provides a `config` object that resolves settings by checking Django's
+``settings`` first, then falling back to the defaults declared here.
+
+Usage::
+
+    from freedom_ls.student_interface.config import config
+
+    if config.TOPIC_STREAMING_MIN_LENGTH is not None:
+        # stream long topics
+"""
+
+from __future__ import annotations
+
+from freedom_ls.base.app_settings import AppSettings, Setting
+
+
+class StudentInterfaceConfig(AppSettings):
+    TOPIC_STREAMING_MIN_LENGTH: int | None
+
+    declared_settings = {
+        # Topics whose markdown is at least this many characters long are
+        # streamed a section at a time; None turns streaming off.
+        "TOPIC_STREAMING_MIN_LENGTH": Setting(default=None),
+    }
+
+
+config = StudentInterfaceConfig()
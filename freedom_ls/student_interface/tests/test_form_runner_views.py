@@ -6,6 +6,8 @@ import re
 
 import pytest
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -557,6 +559,44 @@ def test_form_fill_page_context_includes_total_question_count(
     assert response.context["total_question_count"] == 2  # 1 question per page, 2 pages
 
 
+@pytest.mark.django_db
+def test_form_fill_page_queries_do_not_grow_with_questions(mock_site_context, client):
+    """Prompts, question numbers and option labels are loaded per page."""
+
+    def fill_page_queries(question_count):
+        user = UserFactory()
+        form = FormFactory()
+        page = FormPageFactory(form=form, order=0)
+        for order in range(question_count):
+            question = FormQuestionFactory(form_page=page, order=order)
+            QuestionOptionFactory(question=question)
+            QuestionOptionFactory(question=question)
+        course = course_with_form(
+            form, title=f"Course {question_count}", slug=f"course-{question_count}"
+        )
+        register_user_for_course(course, user)
+        client.force_login(user)
+        client.get(
+            reverse(
+                "student_interface:form_start",
+                kwargs={"course_slug": course.slug, "index": 1},
+            )
+        )
+        url = reverse(
+            "student_interface:form_fill_page",
+            kwargs={"course_slug": course.slug, "index": 1, "page_number": 1},
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert response.status_code == 200
+        assert f'data-testid="question-number-{question_count}"' in (
+            response.content.decode()
+        )
+        return len(queries)
+
+    assert fill_page_queries(6) == fill_page_queries(2)
+
+
 @pytest.mark.django_db
 def test_form_fill_page_context_includes_submit_and_exit_url(mock_site_context, client):
     """form_fill_page context includes submit_and_exit_url."""
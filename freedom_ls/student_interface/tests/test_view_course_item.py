@@ -315,3 +315,31 @@ def test_form_fill_page_out_of_range_page_returns_404(
     )
     response = authenticated_client.get(url)
     assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_long_topic_is_streamed_a_section_at_a_time(
+    course_with_nested_structure, authenticated_client, settings
+):
+    settings.TOPIC_STREAMING_MIN_LENGTH = 10
+    topic = course_with_nested_structure["first_item"]
+    topic.content = "# Alpha section\n\nFirst\n\n# Beta section\n\nSecond\n"
+    topic.save()
+    url = reverse(
+        "student_interface:view_course_item",
+        kwargs={"course_slug": "test-course", "index": 1},
+    )
+
+    response = authenticated_client.get(url)
+
+    assert response.streaming
+    chunks = [chunk.decode() for chunk in response.streaming_content]
+    assert len(chunks) == 4
+    assert topic.title in chunks[0]
+    assert "Alpha section" in chunks[1]
+    assert "Beta section" in chunks[2]
+    assert "mark_complete" in chunks[3]
+
+    htmx_response = authenticated_client.get(url, headers={"HX-Request": "true"})
+    assert not htmx_response.streaming
+    assert "Beta section" in htmx_response.content.decode()
@@ -5,11 +5,13 @@ import uuid
 from typing import TYPE_CHECKING, cast
 
 from django.contrib.auth.decorators import login_required
-from django.http import Http404, HttpRequest, HttpResponse
+from django.db.models import prefetch_related_objects
+from django.http import Http404, HttpRequest, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.safestring import mark_safe
 from django.views.decorators.http import require_POST
 
 from freedom_ls.content_engine.models import (
@@ -26,6 +28,7 @@ from freedom_ls.course_access.overrides import (
 )
 from freedom_ls.course_access.visibility import raise_404_if_hidden_unregistered
 from freedom_ls.course_interest.queries import stamp_interest
+from freedom_ls.site_aware_models.models import request_context
 from freedom_ls.student_management.config import config
 from freedom_ls.student_management.deadline_utils import is_item_locked_by_deadline
 from freedom_ls.student_management.models import (
@@ -38,6 +41,7 @@ from freedom_ls.student_progress.models import (
     TopicProgress,
 )
 
+from .config import config as interface_config
 from .utils import (
     IN_PROGRESS,
     READY,
@@ -738,9 +742,48 @@ def view_topic(
         "is_course_complete": is_course_complete,
         **player_context,
     }
+    min_length = interface_config.TOPIC_STREAMING_MIN_LENGTH
+    if (
+        min_length is not None
+        and len(topic.content) >= min_length
+        # HTMX swaps only once the whole response has arrived, and toasts are
+        # appended to complete responses only; see HtmxMessagesMiddleware.
+        and request.headers.get("HX-Request") != "true"
+    ):
+        return _stream_topic(request, context)
     return render(request, "student_interface/course_topic.html", context)
 
 
+# Stands in for the topic content in the page rendered around the stream.
+# Safe: a constant HTML comment with no user input
+TOPIC_STREAM_MARKER = mark_safe("<!--topic-content-stream-->")  # nosec B308
+
+
+def _stream_topic(request, context) -> StreamingHttpResponse:
+    """Send the player page first and then the topic a section at a time."""
+    page = render_to_string(
+        "student_interface/course_topic.html",
+        {**context, "topic_stream_marker": TOPIC_STREAM_MARKER},
+        request,
+    )
+    head, tail = page.split(TOPIC_STREAM_MARKER, 1)
+    sections = context["topic"].rendered_sections()
+
+    def stream():
+        yield head
+        while True:
+            # The response is iterated after the middleware has returned, so
+            # re-enter the request's tenant context for each section.
+            with request_context(request):
+                section = next(sections, None)
+            if section is None:
+                break
+            yield section
+        yield tail
+
+    return StreamingHttpResponse(stream(), content_type="text/html; charset=utf-8")
+
+
 def view_form(
     request,
     form,
@@ -837,9 +880,10 @@ def form_fill_page(request, course_slug, index, page_number):
     form_progress = FormProgress.get_latest_incomplete(user=request.user, form=form)
 
     # Get existing answers for questions on this page
+    page_children = form_page.children()
     questions = [
         child
-        for child in form_page.children()
+        for child in page_children
         if hasattr(child, "question")  # It's a FormQuestion
     ]
 
@@ -908,6 +952,9 @@ def form_fill_page(request, course_slug, index, page_number):
 
     # Build a dictionary of existing answers keyed by question ID
     existing_answers = form_progress.existing_answers_dict(questions)
+    # The template renders these same instances, so option labels come from
+    # one query and each prompt is rendered once, from its stored render.
+    prefetch_related_objects(questions, "options")
 
     # Determine the furthest page the user has progressed to
     furthest_page = form_progress.get_current_page_number()
@@ -961,6 +1008,7 @@ def form_fill_page(request, course_slug, index, page_number):
         "course": course,
         "form": form,
         "form_page": form_page,
+        "page_children": page_children,
         "form_progress": form_progress,
         "current_page_num": page_number,
         "total_pages": total_pages,
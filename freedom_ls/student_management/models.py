@@ -8,6 +8,7 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from freedom_ls.base.indexes import trigram_index
 from freedom_ls.site_aware_models.models import SiteAwareModel
 
 User = get_user_model()
@@ -22,6 +23,7 @@ class Cohort(SiteAwareModel):
                 fields=["site_id", "name"], name="unique_cohort_name_per_site"
             )
         ]
+        indexes = [trigram_index("name", name="cohort_name_trgm_idx")]
 
     def __str__(self):
         return self.name
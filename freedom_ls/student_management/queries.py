@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.db.models import Exists, OuterRef, Q
+from django.db.models import Exists, IntegerField, OuterRef, Q, Subquery
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractBaseUser, AnonymousUser
@@ -47,3 +47,38 @@ def is_registered_for_course_expression(user: RequestUser) -> Q:
             is_active=True,
         )
     )
+
+
+class _SubqueryCount(Subquery):
+    """Count the rows of a correlated subquery without materialising them."""
+
+    template = "(SELECT COUNT(*) FROM (%(subquery)s) _count)"
+    output_field = IntegerField()
+
+
+def active_student_count_expression() -> _SubqueryCount:
+    """Count unique active students of a course, direct and through cohorts.
+
+    A student is counted once even if they are both registered directly and
+    a member of one or more actively registered cohorts: the two user-id sets
+    are combined with ``UNION`` (which de-duplicates) and counted in SQL, so
+    no membership rows are loaded into Python.
+
+    References ``OuterRef("pk")``, so it must be annotated onto a queryset of
+    courses::
+
+        Course.objects.annotate(total_student_count=active_student_count_expression())
+    """
+    from freedom_ls.student_management.models import (
+        CohortMembership,
+        UserCourseRegistration,
+    )
+
+    cohort_students = CohortMembership.objects.filter(
+        cohort__course_registrations__collection=OuterRef("pk"),
+        cohort__course_registrations__is_active=True,
+    ).values("user_id")
+    direct_students = UserCourseRegistration.objects.filter(
+        collection=OuterRef("pk"), is_active=True
+    ).values("user_id")
+    return _SubqueryCount(cohort_students.union(direct_students))
@@ -5,3 +5,7 @@ class StudentProgressConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "freedom_ls.student_progress"
     label = "freedom_ls_student_progress"
+
+    def ready(self) -> None:
+        # Register the CohortProgressSummary maintenance receivers.
+        from freedom_ls.student_progress import signals  # noqa: F401
@@ -0,0 +1,19 @@
+import djclick as click
+
+from freedom_ls.student_management.models import CohortCourseRegistration
+from freedom_ls.student_progress.summaries import refresh_cohort_progress_summaries
+
+
+@click.command()
+def command() -> None:
+    """Rebuild every CohortProgressSummary row.
+
+    Useful for backfilling, and worth scheduling (e.g. nightly) so that
+    overdue counts catch up with deadlines that passed without any progress
+    being written.
+    """
+    registrations = CohortCourseRegistration.objects.select_related("collection")
+    total = 0
+    for registration in registrations.iterator():
+        total += refresh_cohort_progress_summaries(registration)
+    click.echo(f"Refreshed {total} cohort progress summaries.")
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.9 on 2026-10-18 23:51
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freedom_ls_student_management', '0014_cohort_name_trgm_idx'),
+        ('freedom_ls_student_progress', '0005_courseprogress_last_accessed_content_type_and_more'),
+        ('sites', '0002_alter_domain_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CohortProgressSummary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('progress_percentage', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+                ('overdue_count', models.IntegerField(default=0)),
+                ('next_deadline', models.DateTimeField(blank=True, null=True)),
+                ('last_activity', models.DateTimeField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('cohort_course_registration', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress_summaries', to='freedom_ls_student_management.cohortcourseregistration')),
+                ('membership', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress_summaries', to='freedom_ls_student_management.cohortmembership')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='sites.site')),
+            ],
+            options={
+                'verbose_name_plural': 'Cohort progress summaries',
+                'indexes': [models.Index(fields=['cohort_course_registration', 'progress_percentage'], name='cps_reg_progress_idx'), models.Index(fields=['cohort_course_registration', 'overdue_count'], name='cps_reg_overdue_idx'), models.Index(fields=['cohort_course_registration', 'next_deadline'], name='cps_reg_next_deadline_idx'), models.Index(models.F('cohort_course_registration'), models.OrderBy(models.F('last_activity'), nulls_first=True), name='cps_reg_last_activity_idx')],
+                'constraints': [models.UniqueConstraint(fields=('cohort_course_registration', 'membership'), name='unique_cohort_progress_summary')],
+            },
+        ),
+    ]
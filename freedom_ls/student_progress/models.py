@@ -19,6 +19,10 @@ from freedom_ls.content_engine.models import (
     Topic,
 )
 from freedom_ls.site_aware_models.models import SiteAwareModel
+from freedom_ls.student_management.models import (
+    CohortCourseRegistration,
+    CohortMembership,
+)
 from freedom_ls.student_management.utils import calculate_course_progress_percentage
 
 User = get_user_model()
@@ -80,17 +84,34 @@ def update_course_progress_on_completion(
         ).values_list("form_id", flat=True)
     )
 
+    previous_percentages = dict(
+        CourseProgress.objects.filter(user=user, course_id__in=course_ids).values_list(
+            "course_id", "progress_percentage"
+        )
+    )
+
     # Update each affected course's progress (find/create CourseProgress if needed)
+    unchanged_course_ids = set()
     for course in Course.objects.filter(id__in=course_ids):
         percentage = calculate_course_progress_percentage(
             course, completed_topic_ids, completed_form_ids
         )
+        if previous_percentages.get(course.id, 0) == percentage:
+            unchanged_course_ids.add(course.id)
         CourseProgress.objects.update_or_create(
             user=user,
             course=course,
             defaults={"progress_percentage": percentage},
         )
 
+    # A changed percentage refreshes the cohort progress summaries from
+    # CourseProgress.save. The completed item count moved either way, so
+    # refresh the courses whose rounded percentage stayed the same here.
+    if unchanged_course_ids:
+        from freedom_ls.student_progress.summaries import refresh_summaries_for_learner
+
+        refresh_summaries_for_learner(user.pk, unchanged_course_ids)
+
 
 class CourseItemProgress(SiteAwareModel):
     # Subclasses must define these class attributes
@@ -119,6 +140,7 @@ class CourseItemProgress(SiteAwareModel):
         if current_value is not None and self._original_completion_value is None:
             content_item = getattr(self, self.content_item_field_name)
             user = self.user
+            # Also refreshes the learner's cohort progress summaries.
             update_course_progress_on_completion(user, content_item)
             self._original_completion_value = current_value
 
@@ -232,16 +254,10 @@ class FormProgress(CourseItemProgress):
         Get a dictionary of existing answers for the given questions.
         Returns a dict with question.id as keys and QuestionAnswer objects as values.
         """
-        existing_answers = {}
-        for question in questions:
-            try:
-                answer = QuestionAnswer.objects.get(
-                    form_progress=self, question=question
-                )
-                existing_answers[question.id] = answer
-            except QuestionAnswer.DoesNotExist:
-                pass
-        return existing_answers
+        answers = QuestionAnswer.objects.filter(
+            form_progress=self, question__in=questions
+        ).prefetch_related("selected_options")
+        return {answer.question_id: answer for answer in answers}
 
     def save_answers(self, questions, post_data):
         """
@@ -608,3 +624,88 @@ class CourseProgress(SiteAwareModel):
 
     def __str__(self):
         return f"{self.user} - {self.course.title}"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._original_summary_values = (self.progress_percentage, self.completed_time)
+
+    def save(self, *args, **kwargs):
+        original = (0, None) if self._state.adding else self._original_summary_values
+        super().save(*args, **kwargs)
+        from freedom_ls.student_progress.summaries import (
+            refresh_summaries_for_learner,
+            touch_summaries_for_learner,
+        )
+
+        # The student views save on every course item view; unless the
+        # progress itself moved, only the summaries' last activity changes.
+        current = (self.progress_percentage, self.completed_time)
+        if current != original:
+            refresh_summaries_for_learner(self.user_id, {self.course_id})
+            self._original_summary_values = current
+        else:
+            touch_summaries_for_learner(
+                self.user_id, self.course_id, self.last_accessed_time
+            )
+
+
+class CohortProgressSummary(SiteAwareModel):
+    """Materialised progress of one cohort member in one cohort course registration.
+
+    Read by the educator course progress grid so that sorting, the "overdue
+    only" filter and pagination run on indexed columns. Rows are refreshed
+    incrementally by ``freedom_ls.student_progress.summaries``; see that module
+    for what triggers a refresh.
+    """
+
+    cohort_course_registration = models.ForeignKey(
+        CohortCourseRegistration,
+        on_delete=models.CASCADE,
+        related_name="progress_summaries",
+    )
+    membership = models.ForeignKey(
+        CohortMembership,
+        on_delete=models.CASCADE,
+        related_name="progress_summaries",
+    )
+    progress_percentage = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    overdue_count = models.IntegerField(default=0)
+    # Earliest deadline still ahead of an incomplete item when the row was
+    # refreshed. Once it passes, overdue_count is stale; see summaries.overdue_q.
+    next_deadline = models.DateTimeField(null=True, blank=True)
+    last_activity = models.DateTimeField(null=True, blank=True)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Cohort progress summaries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cohort_course_registration", "membership"],
+                name="unique_cohort_progress_summary",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["cohort_course_registration", "progress_percentage"],
+                name="cps_reg_progress_idx",
+            ),
+            models.Index(
+                fields=["cohort_course_registration", "overdue_count"],
+                name="cps_reg_overdue_idx",
+            ),
+            models.Index(
+                fields=["cohort_course_registration", "next_deadline"],
+                name="cps_reg_next_deadline_idx",
+            ),
+            # Matches the "least recently active first" sort, which lists
+            # learners with no activity at all first.
+            models.Index(
+                "cohort_course_registration",
+                models.F("last_activity").asc(nulls_first=True),
+                name="cps_reg_last_activity_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.membership} - {self.progress_percentage}%"
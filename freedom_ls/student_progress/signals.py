@@ -0,0 +1,155 @@
+"""Keep ``CohortProgressSummary`` rows in step with cohort-side changes.
+
+Progress writes refresh summaries from the progress models' ``save``; these
+receivers cover the student_management and content_engine models, which must
+not import student_progress themselves.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType as DjangoContentType
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from freedom_ls.content_engine.models import (
+    ContentCollectionItem,
+    Course,
+    CoursePart,
+)
+from freedom_ls.student_management.models import (
+    CohortCourseRegistration,
+    CohortDeadline,
+    CohortMembership,
+    UserCohortDeadlineOverride,
+)
+from freedom_ls.student_progress.summaries import (
+    refresh_cohort_progress_summaries,
+    refresh_course_summaries,
+)
+
+
+def _is_cascade_delete(sender: type, kwargs: dict[str, Any]) -> bool:
+    """True when the row goes because its registration/cohort is being deleted.
+
+    The summaries cascade away with the registration, so refreshing them
+    would only re-insert rows that are about to be deleted.
+    """
+    origin = kwargs.get("origin")
+    if origin is None:
+        return False
+    return (
+        not isinstance(origin, sender) and getattr(origin, "model", None) is not sender
+    )
+
+
+@receiver(post_save, sender=CohortCourseRegistration)
+def refresh_on_registration_created(
+    sender: type, instance: CohortCourseRegistration, created: bool, **kwargs: Any
+) -> None:
+    if created:
+        refresh_cohort_progress_summaries(instance)
+
+
+@receiver(post_save, sender=CohortMembership)
+def refresh_on_membership_created(
+    sender: type, instance: CohortMembership, created: bool, **kwargs: Any
+) -> None:
+    if not created:
+        return
+    registrations = CohortCourseRegistration.objects.filter(
+        cohort_id=instance.cohort_id
+    ).select_related("collection")
+    for registration in registrations:
+        refresh_cohort_progress_summaries(registration, [instance.user_id])
+
+
+@receiver(post_save, sender=CohortDeadline)
+@receiver(post_delete, sender=CohortDeadline)
+def refresh_on_cohort_deadline_changed(
+    sender: type, instance: CohortDeadline, **kwargs: Any
+) -> None:
+    # Course-level deadlines are not counted per item, so they never change
+    # a summary.
+    if instance.content_type_id is None or _is_cascade_delete(sender, kwargs):
+        return
+    refresh_cohort_progress_summaries(instance.cohort_course_registration)
+
+
+@receiver(post_save, sender=UserCohortDeadlineOverride)
+@receiver(post_delete, sender=UserCohortDeadlineOverride)
+def refresh_on_deadline_override_changed(
+    sender: type, instance: UserCohortDeadlineOverride, **kwargs: Any
+) -> None:
+    if instance.content_type_id is None or _is_cascade_delete(sender, kwargs):
+        return
+    refresh_cohort_progress_summaries(
+        instance.cohort_course_registration, [instance.user_id]
+    )
+
+
+@dataclass
+class _PendingCourses:
+    """Courses to refresh once the transaction that changed them commits."""
+
+    # The connection's on-commit hook list this refresh was queued on. Django
+    # replaces the list on commit and on (savepoint) rollback, so a different
+    # list means the queued refresh already ran or was discarded.
+    hooks: list
+    course_ids: set[UUID] = field(default_factory=set)
+    done: bool = False
+
+    def refresh(self) -> None:
+        self.done = True
+        refresh_course_summaries(self.course_ids)
+
+
+_pending: ContextVar[_PendingCourses | None] = ContextVar(
+    "student_progress_pending_courses", default=None
+)
+
+
+def _refresh_on_commit(course_ids: set[UUID]) -> None:
+    """Refresh ``course_ids`` once, when the current transaction commits."""
+    hooks = transaction.get_connection().run_on_commit
+    pending = _pending.get()
+    if pending is None or pending.done or pending.hooks is not hooks:
+        pending = _PendingCourses(hooks)
+        _pending.set(pending)
+        pending.course_ids.update(course_ids)
+        transaction.on_commit(pending.refresh)
+    else:
+        pending.course_ids.update(course_ids)
+
+
+@receiver(post_save, sender=ContentCollectionItem)
+@receiver(post_delete, sender=ContentCollectionItem)
+def refresh_on_course_structure_changed(
+    sender: type, instance: ContentCollectionItem, **kwargs: Any
+) -> None:
+    # Reordering items changes no counts.
+    if kwargs.get("created") is False:
+        return
+    course_ct = DjangoContentType.objects.get_for_model(Course)
+    if instance.collection_type_id == course_ct.id:
+        course_ids = {instance.collection_id}
+    elif instance.collection_type_id == (
+        DjangoContentType.objects.get_for_model(CoursePart).id
+    ):
+        course_ids = set(
+            ContentCollectionItem.objects.filter(
+                child_type=instance.collection_type_id,
+                child_id=instance.collection_id,
+                collection_type=course_ct,
+            ).values_list("collection_id", flat=True)
+        )
+    else:
+        return
+    # An import adds a course's items one by one; refresh each course once,
+    # after the import commits.
+    _refresh_on_commit(course_ids)
@@ -0,0 +1,245 @@
+"""Maintenance of the materialised ``CohortProgressSummary`` rows.
+
+The educator course progress grid sorts, filters and paginates a cohort by
+each member's progress. Computing that live means a correlated subquery into
+CourseProgress for every member of the cohort on every page. Instead each
+(cohort course registration, member) pair has a summary row, refreshed
+incrementally:
+
+- Completing a topic or form refreshes the learner's rows for every course
+  containing it, as does any ``CourseProgress.save`` that changes the
+  progress percentage or completion time.
+- The student views save CourseProgress on every course item view. Those
+  saves only bump ``last_activity`` on the learner's rows, in one UPDATE.
+- Changes to item deadlines, deadline overrides, memberships and cohort course
+  registrations refresh the rows they affect, and adding or removing course
+  items refreshes every registration of the course once the transaction
+  commits (see ``signals``).
+- ``ensure_cohort_progress_summaries`` fills in rows that were never built,
+  e.g. for data that predates the table.
+
+``overdue_count`` is only recomputed on a refresh, so an item whose deadline
+passes without any write is not counted until the next one. Each row also
+stores ``next_deadline``, the earliest deadline still ahead of an incomplete
+item, and ``overdue_q`` uses it so those rows still pass the "overdue only"
+filter. The ``refresh_cohort_progress_summaries`` management command rebuilds
+every row (e.g. nightly) to bring the counts up to date.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType as DjangoContentType
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from freedom_ls.content_engine.models import CoursePart, Form, Topic
+from freedom_ls.student_management.models import (
+    CohortCourseRegistration,
+    CohortDeadline,
+    CohortMembership,
+    UserCohortDeadlineOverride,
+)
+from freedom_ls.student_progress.models import (
+    CohortProgressSummary,
+    CourseProgress,
+    FormProgress,
+    TopicProgress,
+)
+
+SUMMARY_FIELDS = [
+    "progress_percentage",
+    "completed_count",
+    "overdue_count",
+    "next_deadline",
+    "last_activity",
+    "refreshed_at",
+]
+
+
+def overdue_q(now: datetime | None = None) -> Q:
+    """Filter for summary rows with at least one overdue, incomplete item."""
+    now = now or timezone.now()
+    return Q(overdue_count__gt=0) | Q(next_deadline__lt=now)
+
+
+def refresh_cohort_progress_summaries(
+    registration: CohortCourseRegistration,
+    user_ids: Iterable[int] | None = None,
+) -> int:
+    """Recompute the summary rows of ``registration`` and upsert them.
+
+    Limited to the cohort members in ``user_ids`` when given, otherwise every
+    member is refreshed. Returns the number of rows written.
+
+    ``progress_percentage`` mirrors CourseProgress (0 when the learner has
+    none), which is what the grid has always displayed. Overdue counts use the
+    same per-item rule as the grid cells: the learner's override for the item,
+    else the cohort deadline for the item.
+    """
+    memberships = CohortMembership.objects.filter(cohort_id=registration.cohort_id)
+    if user_ids is not None:
+        memberships = memberships.filter(user_id__in=list(user_ids))
+    membership_by_user: dict[int, UUID] = dict(memberships.values_list("user_id", "id"))
+    if not membership_by_user:
+        return 0
+    member_ids = list(membership_by_user)
+
+    course = registration.collection
+    items = [
+        child for child in course.children_flat() if not isinstance(child, CoursePart)
+    ]
+    topic_ct = DjangoContentType.objects.get_for_model(Topic)
+    form_ct = DjangoContentType.objects.get_for_model(Form)
+    item_keys = [
+        (topic_ct.id if isinstance(item, Topic) else form_ct.id, item.id)
+        for item in items
+    ]
+
+    completed: dict[int, set[UUID]] = {user_id: set() for user_id in member_ids}
+    last_activity: dict[int, datetime] = {}
+
+    def touch(user_id: int, *times: datetime | None) -> None:
+        for moment in times:
+            if moment is not None and (
+                user_id not in last_activity or moment > last_activity[user_id]
+            ):
+                last_activity[user_id] = moment
+
+    topic_ids = [item.id for item in items if isinstance(item, Topic)]
+    if topic_ids:
+        for user_id, topic_id, accessed, complete_time in TopicProgress.objects.filter(
+            user_id__in=member_ids, topic_id__in=topic_ids
+        ).values_list("user_id", "topic_id", "last_accessed_time", "complete_time"):
+            touch(user_id, accessed, complete_time)
+            if complete_time is not None:
+                completed[user_id].add(topic_id)
+
+    form_ids = [item.id for item in items if isinstance(item, Form)]
+    if form_ids:
+        for user_id, form_id, updated, completed_time in FormProgress.objects.filter(
+            user_id__in=member_ids, form_id__in=form_ids
+        ).values_list("user_id", "form_id", "last_updated_time", "completed_time"):
+            touch(user_id, updated, completed_time)
+            if completed_time is not None:
+                completed[user_id].add(form_id)
+
+    percentage: dict[int, int] = {}
+    for user_id, pct, accessed in CourseProgress.objects.filter(
+        user_id__in=member_ids, course=course
+    ).values_list("user_id", "progress_percentage", "last_accessed_time"):
+        percentage[user_id] = pct
+        touch(user_id, accessed)
+
+    item_deadlines: dict[tuple[int, UUID], datetime] = {
+        (ct_id, object_id): deadline
+        for ct_id, object_id, deadline in CohortDeadline.objects.filter(
+            cohort_course_registration=registration, content_type__isnull=False
+        ).values_list("content_type_id", "object_id", "deadline")
+    }
+    overrides: dict[tuple[int, int, UUID], datetime] = {
+        (user_id, ct_id, object_id): deadline
+        for user_id, ct_id, object_id, deadline in (
+            UserCohortDeadlineOverride.objects.filter(
+                cohort_course_registration=registration,
+                user_id__in=member_ids,
+                content_type__isnull=False,
+            ).values_list("user_id", "content_type_id", "object_id", "deadline")
+        )
+    }
+
+    now = timezone.now()
+    summaries = []
+    for user_id, membership_id in membership_by_user.items():
+        overdue_count = 0
+        next_deadline: datetime | None = None
+        for ct_id, item_id in item_keys:
+            if item_id in completed[user_id]:
+                continue
+            deadline = overrides.get((user_id, ct_id, item_id)) or item_deadlines.get(
+                (ct_id, item_id)
+            )
+            if deadline is None:
+                continue
+            if deadline < now:
+                overdue_count += 1
+            elif next_deadline is None or deadline < next_deadline:
+                next_deadline = deadline
+        summaries.append(
+            CohortProgressSummary(
+                site_id=registration.site_id,
+                cohort_course_registration=registration,
+                membership_id=membership_id,
+                progress_percentage=percentage.get(user_id, 0),
+                completed_count=len(completed[user_id]),
+                overdue_count=overdue_count,
+                next_deadline=next_deadline,
+                last_activity=last_activity.get(user_id),
+            )
+        )
+
+    CohortProgressSummary.objects.bulk_create(
+        summaries,
+        update_conflicts=True,
+        unique_fields=["cohort_course_registration", "membership"],
+        update_fields=SUMMARY_FIELDS,
+    )
+    return len(summaries)
+
+
+def refresh_summaries_for_learner(user_id: int, course_ids: Iterable[UUID]) -> None:
+    """Refresh a learner's rows in every cohort registration for ``course_ids``."""
+    course_ids = list(course_ids)
+    if not course_ids:
+        return
+    registrations = CohortCourseRegistration.objects.filter(
+        collection_id__in=course_ids,
+        cohort__cohortmembership__user_id=user_id,
+    ).select_related("collection")
+    for registration in registrations:
+        refresh_cohort_progress_summaries(registration, [user_id])
+
+
+def touch_summaries_for_learner(
+    user_id: int, course_id: UUID, moment: datetime
+) -> None:
+    """Set ``last_activity`` on a learner's rows for ``course_id`` in one UPDATE.
+
+    Only valid when ``moment`` is the learner's latest activity, as it is for
+    a CourseProgress that was just saved.
+    """
+    CohortProgressSummary.objects.filter(
+        cohort_course_registration__collection_id=course_id,
+        membership__user_id=user_id,
+    ).update(last_activity=moment)
+
+
+def refresh_course_summaries(course_ids: Iterable[UUID]) -> None:
+    """Refresh every cohort registration row for ``course_ids``."""
+    registrations = CohortCourseRegistration.objects.filter(
+        collection_id__in=list(course_ids)
+    ).select_related("collection")
+    for registration in registrations:
+        refresh_cohort_progress_summaries(registration)
+
+
+def ensure_cohort_progress_summaries(registration: CohortCourseRegistration) -> int:
+    """Build the rows missing for ``registration``; returns how many were built."""
+    missing_user_ids = list(
+        CohortMembership.objects.filter(cohort_id=registration.cohort_id)
+        .filter(
+            ~Exists(
+                CohortProgressSummary.objects.filter(
+                    cohort_course_registration=registration,
+                    membership=OuterRef("pk"),
+                )
+            )
+        )
+        .values_list("user_id", flat=True)
+    )
+    if not missing_user_ids:
+        return 0
+    return refresh_cohort_progress_summaries(registration, missing_user_ids)
@@ -0,0 +1,318 @@
+from datetime import timedelta
+
+import pytest
+
+from django.db import transaction
+from django.utils import timezone
+
+from freedom_ls.accounts.factories import UserFactory
+from freedom_ls.content_engine.factories import (
+    ContentCollectionItemFactory,
+    CourseFactory,
+    CoursePartFactory,
+    TopicFactory,
+)
+from freedom_ls.student_management.factories import (
+    CohortCourseRegistrationFactory,
+    CohortDeadlineFactory,
+    CohortFactory,
+    CohortMembershipFactory,
+    UserCohortDeadlineOverrideFactory,
+)
+from freedom_ls.student_progress.factories import (
+    CourseProgressFactory,
+    TopicProgressFactory,
+)
+from freedom_ls.student_progress.models import CohortProgressSummary
+from freedom_ls.student_progress.summaries import (
+    ensure_cohort_progress_summaries,
+    overdue_q,
+)
+
+
+@pytest.fixture
+def registration(mock_site_context, django_capture_on_commit_callbacks):
+    course = CourseFactory()
+    # Run the course refresh queued by the items, as a committed import would.
+    with django_capture_on_commit_callbacks(execute=True):
+        for i in range(2):
+            ContentCollectionItemFactory(
+                collection_object=course, child_object=TopicFactory(), order=i
+            )
+    return CohortCourseRegistrationFactory(cohort=CohortFactory(), collection=course)
+
+
+def _topics(registration):
+    return registration.collection.children()
+
+
+def _summary(registration, user):
+    return CohortProgressSummary.objects.get(
+        cohort_course_registration=registration, membership__user=user
+    )
+
+
+@pytest.mark.django_db
+def test_joining_cohort_creates_summary_row(registration):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+
+    summary = _summary(registration, user)
+    assert summary.progress_percentage == 0
+    assert summary.completed_count == 0
+    assert summary.last_activity is None
+
+
+@pytest.mark.django_db
+def test_completing_topic_updates_summary(registration):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+
+    progress = TopicProgressFactory(user=user, topic=_topics(registration)[0])
+    progress.complete_time = timezone.now()
+    progress.save()
+
+    summary = _summary(registration, user)
+    assert summary.progress_percentage == 50
+    assert summary.completed_count == 1
+    assert summary.last_activity is not None
+
+
+@pytest.mark.django_db
+def test_revisiting_course_only_updates_last_activity(
+    registration, django_assert_num_queries
+):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+    course_progress = CourseProgressFactory(user=user, course=registration.collection)
+
+    # The CourseProgress UPDATE and a single summary UPDATE.
+    with django_assert_num_queries(2):
+        course_progress.save()
+
+    summary = _summary(registration, user)
+    assert summary.last_activity == course_progress.last_accessed_time
+    assert summary.progress_percentage == 0
+
+
+@pytest.mark.django_db
+def test_completion_refreshes_summary_when_percentage_is_unchanged(registration):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+    CourseProgressFactory(
+        user=user, course=registration.collection, progress_percentage=50
+    )
+
+    progress = TopicProgressFactory(user=user, topic=_topics(registration)[0])
+    progress.complete_time = timezone.now()
+    progress.save()
+
+    summary = _summary(registration, user)
+    assert summary.progress_percentage == 50
+    assert summary.completed_count == 1
+
+
+@pytest.mark.django_db
+def test_removing_course_item_refreshes_summaries(
+    registration, django_capture_on_commit_callbacks
+):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+    first = _topics(registration)[0]
+    progress = TopicProgressFactory(user=user, topic=first)
+    progress.complete_time = timezone.now()
+    progress.save()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        registration.collection.items.get(child_id=first.id).delete()
+
+    assert _summary(registration, user).completed_count == 0
+
+
+@pytest.mark.django_db
+def test_adding_item_to_course_part_refreshes_summaries(
+    registration, django_capture_on_commit_callbacks
+):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+    part = CoursePartFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        ContentCollectionItemFactory(
+            collection_object=registration.collection, child_object=part, order=2
+        )
+    topic = TopicFactory()
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=topic,
+        deadline=timezone.now() - timedelta(days=1),
+    )
+    assert _summary(registration, user).overdue_count == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ContentCollectionItemFactory(collection_object=part, child_object=topic)
+
+    assert _summary(registration, user).overdue_count == 1
+
+
+def _overdue_topic(registration):
+    topic = TopicFactory()
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=topic,
+        deadline=timezone.now() - timedelta(days=1),
+    )
+    return topic
+
+
+@pytest.mark.django_db
+def test_import_queues_one_refresh_per_transaction(
+    registration, django_capture_on_commit_callbacks
+):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        for order in range(2, 5):
+            ContentCollectionItemFactory(
+                collection_object=registration.collection,
+                child_object=_overdue_topic(registration),
+                order=order,
+            )
+    refreshes = [c for c in callbacks if getattr(c, "__name__", "") == "refresh"]
+    assert len(refreshes) == 1
+
+    for callback in callbacks:
+        callback()
+    assert _summary(registration, user).overdue_count == 3
+
+
+@pytest.mark.django_db
+def test_refresh_is_queued_again_after_a_rollback(
+    registration, django_capture_on_commit_callbacks
+):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+
+    def add_item_and_roll_back():
+        with transaction.atomic():
+            ContentCollectionItemFactory(
+                collection_object=registration.collection,
+                child_object=TopicFactory(),
+                order=2,
+            )
+            raise RuntimeError
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError):
+            add_item_and_roll_back()
+        ContentCollectionItemFactory(
+            collection_object=registration.collection,
+            child_object=_overdue_topic(registration),
+            order=3,
+        )
+
+    assert _summary(registration, user).overdue_count == 1
+
+
+@pytest.mark.django_db
+def test_overdue_count_uses_override_before_cohort_deadline(registration):
+    first, second = _topics(registration)
+    late = UserFactory()
+    extended = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=late)
+    CohortMembershipFactory(cohort=registration.cohort, user=extended)
+    for topic in (first, second):
+        CohortDeadlineFactory(
+            cohort_course_registration=registration,
+            content_item=topic,
+            deadline=timezone.now() - timedelta(days=1),
+        )
+    UserCohortDeadlineOverrideFactory(
+        cohort_course_registration=registration,
+        user=extended,
+        content_item=first,
+        deadline=timezone.now() + timedelta(days=2),
+    )
+
+    assert _summary(registration, late).overdue_count == 2
+    extended_summary = _summary(registration, extended)
+    assert extended_summary.overdue_count == 1
+    assert extended_summary.next_deadline is not None
+
+
+@pytest.mark.django_db
+def test_completed_items_are_not_overdue(registration):
+    first, _ = _topics(registration)
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=first,
+        deadline=timezone.now() - timedelta(days=1),
+    )
+    assert _summary(registration, user).overdue_count == 1
+
+    progress = TopicProgressFactory(user=user, topic=first)
+    progress.complete_time = timezone.now()
+    progress.save()
+
+    assert _summary(registration, user).overdue_count == 0
+
+
+@pytest.mark.django_db
+def test_deleting_deadline_clears_overdue_count(registration):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+    deadline = CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=_topics(registration)[0],
+        deadline=timezone.now() - timedelta(days=1),
+    )
+
+    deadline.delete()
+
+    assert _summary(registration, user).overdue_count == 0
+
+
+@pytest.mark.django_db
+def test_overdue_q_matches_rows_whose_next_deadline_has_passed(registration):
+    user = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=user)
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=_topics(registration)[0],
+        deadline=timezone.now() + timedelta(hours=1),
+    )
+    summaries = CohortProgressSummary.objects.filter(
+        cohort_course_registration=registration
+    )
+
+    assert not summaries.filter(overdue_q()).exists()
+    assert summaries.filter(overdue_q(timezone.now() + timedelta(hours=2))).exists()
+
+
+@pytest.mark.django_db
+def test_deleting_registration_removes_summaries(registration):
+    CohortMembershipFactory(cohort=registration.cohort)
+    CohortDeadlineFactory(
+        cohort_course_registration=registration,
+        content_item=_topics(registration)[0],
+        deadline=timezone.now(),
+    )
+
+    registration.delete()
+
+    assert not CohortProgressSummary.objects.exists()
+
+
+@pytest.mark.django_db
+def test_ensure_builds_missing_rows_only(registration):
+    kept = UserFactory()
+    missing = UserFactory()
+    CohortMembershipFactory(cohort=registration.cohort, user=kept)
+    CohortMembershipFactory(cohort=registration.cohort, user=missing)
+    CohortProgressSummary.objects.filter(membership__user=missing).delete()
+
+    assert ensure_cohort_progress_summaries(registration) == 1
+    assert ensure_cohort_progress_summaries(registration) == 0
+    assert _summary(registration, missing).progress_percentage == 0
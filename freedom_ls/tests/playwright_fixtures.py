@@ -52,7 +52,7 @@ Composition
 ``logged_in_page`` depends on ``live_server_site`` (sets the test
 ``Site``'s domain to match ``live_server.url`` so allauth's site-aware
 queries hit the right row) and ``mock_site_context`` (patches
-``_thread_locals.request`` and ``get_current_site`` for code that runs in
+the current request and ``get_current_site`` for code that runs in
 the test's own thread — factories, view helpers called directly from the
 test, etc.). The live server itself runs in a separate thread and does
 its own site lookup; the mock is for the test process.
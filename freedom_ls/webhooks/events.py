@@ -1,7 +1,6 @@
-from django.contrib.sites.models import Site
 from django.tasks import default_task_backend, task
 
-from freedom_ls.site_aware_models.models import _thread_locals, get_cached_site
+from freedom_ls.site_aware_models.models import get_context_site
 from freedom_ls.webhooks.delivery import attempt_delivery, check_circuit_breaker
 from freedom_ls.webhooks.models import WebhookDelivery, WebhookEndpoint, WebhookEvent
 from freedom_ls.webhooks.registry import validate_event_type
@@ -9,23 +8,20 @@ from freedom_ls.webhooks.registry import validate_event_type
 
 def fire_webhook_event(event_type: str, payload: dict[str, object]) -> None:
     """
-    Fire a webhook event. Silently returns if called outside a request context
-    (e.g. management commands, shell, data migrations).
+    Fire a webhook event. Silently returns if called outside a request or
+    ``site_context`` (e.g. management commands, shell, data migrations).
 
     1. Validate event_type against registry
-    2. Capture site_id from current request context (or return early)
+    2. Capture site_id from the current site context (or return early)
     3. Create WebhookEvent record (with explicit site_id)
     4. Enqueue dispatch_event task with event_id and site_id
     """
     validate_event_type(event_type)
 
-    request = getattr(_thread_locals, "request", None)
-    if request is None:
+    site = get_context_site()
+    if site is None:
         return
-    site_result = get_cached_site(request)
-    if not isinstance(site_result, Site):
-        return
-    site_id: int = site_result.pk
+    site_id: int = site.pk
 
     event = WebhookEvent.objects.create(
         event_type=event_type,
@@ -220,9 +220,9 @@ class TestSiteIsolation:
         """build_template_context filters secrets by site_id.
 
         In production, this runs in a background task without a request context.
-        We simulate that by clearing thread locals before calling it.
+        We simulate that by clearing the current request before calling it.
         """
-        from freedom_ls.site_aware_models.models import _thread_locals
+        from freedom_ls.site_aware_models.models import _current_request
 
         site_a = mock_site_context
 
@@ -244,8 +244,7 @@ class TestSiteIsolation:
         event = WebhookEventFactory(event_type="user.registered")
 
         # Clear request context to simulate background task environment
-        old_request = getattr(_thread_locals, "request", None)
-        delattr(_thread_locals, "request")
+        token = _current_request.set(None)
         try:
             # Build context for site A -- should only see site A's secrets
             context_a = build_template_context(event, site_a.pk)
@@ -261,7 +260,7 @@ class TestSiteIsolation:
             assert "site_b_key" in secrets_b
             assert "site_a_key" not in secrets_b
         finally:
-            _thread_locals.request = old_request
+            _current_request.reset(token)
 
     def test_dispatch_event_only_delivers_to_own_site_endpoints(
         self, mock_site_context: Site